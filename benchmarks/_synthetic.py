@@ -0,0 +1,122 @@
+"""Deterministic synthetic lastfmstats exports for benchmarks.
+
+The generated listening history has a realistic shape:
+- artist popularity follows a Zipf-like power law, and each artist has a
+  few albums with a handful of tracks each (some track titles, such as
+  "Intro", repeat across albums)
+- scrobbles come in listening sessions of ~3.5 minute tracks, with
+  sessions spread over `years` years
+
+The same `num_scrobbles` and `seed` always produce the same data.
+"""
+from __future__ import annotations
+
+import csv
+
+import numpy as np
+import pandas as pd
+
+import memoryfm as mfm
+
+START = pd.Timestamp("2010-01-01", tz="UTC")
+COMMON_TITLES = ["Intro", "Outro", "Interlude", "Untitled", "Home"]
+
+
+def generate_scrobbles(
+    num_scrobbles: int,
+    seed: int = 0,
+    years: int = 15,
+) -> pd.DataFrame:
+    """
+    Generate scrobbles as a DataFrame with the lastfmstats JSON columns:
+    track, artist, album, albumId, date (epoch milliseconds).
+    Rows are in ascending date order.
+    """
+    rng = np.random.default_rng(seed)
+    num_artists = int(np.clip(num_scrobbles // 150, 50, 20_000))
+
+    # Catalog: artists -> albums -> tracks
+    albums_per_artist = rng.integers(1, 9, num_artists)
+    album_artist = np.repeat(np.arange(num_artists), albums_per_artist)
+    artist_first_album = np.concatenate(
+        [[0], np.cumsum(albums_per_artist)[:-1]])
+    tracks_per_album = rng.integers(8, 15, len(album_artist))
+    album_first_track = np.concatenate(
+        [[0], np.cumsum(tracks_per_album)[:-1]])
+    num_tracks = int(tracks_per_album.sum())
+    track_titles = np.array([f"Track {i}" for i in range(num_tracks)],
+                            dtype=object)
+    common = rng.random(num_tracks) < 0.02
+    track_titles[common] = rng.choice(COMMON_TITLES, int(common.sum()))
+
+    # Plays: Zipf-like artist popularity, earlier albums played more
+    weights = 1.0 / np.arange(1, num_artists + 1) ** 1.1
+    artist = rng.choice(num_artists, num_scrobbles, p=weights / weights.sum())
+    album = (artist_first_album[artist]
+             + (rng.random(num_scrobbles) ** 2
+                * albums_per_artist[artist]).astype(np.int64))
+    track = (album_first_track[album]
+             + (rng.random(num_scrobbles)
+                * tracks_per_album[album]).astype(np.int64))
+
+    # Timestamps: sessions of consecutive ~3.5 minute tracks
+    sizes = rng.geometric(1 / 12, num_scrobbles // 6 + 1)
+    sizes = sizes[:np.searchsorted(np.cumsum(sizes), num_scrobbles) + 1]
+    session = np.repeat(np.arange(len(sizes)), sizes)[:num_scrobbles]
+    session_first = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    position = np.arange(num_scrobbles) - session_first[session]
+    span_ms = years * 365 * 86_400_000
+    session_start = np.sort(rng.integers(0, span_ms, len(sizes)))
+    date = (START.value // 1_000_000 + session_start[session]
+            + position * 210_000 + rng.integers(0, 30_000, num_scrobbles))
+
+    df = pd.DataFrame({
+        "track": track_titles[track],
+        "artist": np.char.add("Artist ", artist.astype(str)).astype(object),
+        "album": np.char.add("Album ", album.astype(str)).astype(object),
+        "albumId": np.char.add("album-id-", album.astype(str)).astype(object),
+        "date": date,
+    })
+    return df.sort_values("date", kind="stable", ignore_index=True)
+
+
+def write_lastfmstats_json(
+    df: pd.DataFrame,
+    path: str,
+    username: str = "bench",
+    chunksize: int = 500_000,
+) -> None:
+    """Write scrobbles as a lastfmstats.com JSON export"""
+    with open(path, "w") as f:
+        f.write(f'{{"username":"{username}","scrobbles":[')
+        for start in range(0, len(df), chunksize):
+            if start:
+                f.write(",")
+            chunk = df.iloc[start:start + chunksize]
+            f.write(chunk.to_json(orient="records")[1:-1])
+        f.write("]}")
+
+
+def write_lastfmstats_csv(
+    df: pd.DataFrame,
+    path: str,
+    username: str = "bench",
+) -> None:
+    """Write scrobbles as a lastfmstats.com CSV export"""
+    columns = ["artist", "album", "albumId", "track", "date"]
+    with open(path, "w", newline="") as f:
+        f.write(f"Artist;Album;AlbumId;Track;Date#{username}\n")
+        df[columns].to_csv(f, sep=";", header=False, index=False,
+                           quoting=csv.QUOTE_ALL)
+
+
+def synthetic_log(
+    num_scrobbles: int,
+    seed: int = 0,
+    tz: str = "Etc/UTC",
+) -> mfm.ScrobbleLog:
+    """Generate a ScrobbleLog directly"""
+    df = generate_scrobbles(num_scrobbles, seed)
+    df = df.rename(columns={"date": "timestamp"})
+    return mfm.ScrobbleLog(df, username="bench", tz=tz,
+                           source="lastfmstats.com")
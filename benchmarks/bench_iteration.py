@@ -0,0 +1,62 @@
+"""Benchmark: ScrobbleLog iteration
+
+Compare the batched column iteration of `ScrobbleLog.__iter__` with the
+previous row-by-row iteration (`df.iloc[i].to_dict()` followed by
+`Scrobble.from_dict` for every scrobble).
+
+Usage
+-----
+python benchmarks/bench_iteration.py [num_scrobbles]
+"""
+import contextlib
+import io
+import sys
+import time
+
+import memoryfm as mfm
+from _synthetic import synthetic_log
+
+
+def iterate_rowwise(log: mfm.ScrobbleLog) -> int:
+    """Previous implementation of ScrobbleLog.__iter__"""
+    count = 0
+    # check_datetime prints a tzlocal warning for every scrobble
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(len(log)):
+            d = log.df.iloc[i].to_dict()
+            d["tz"] = log.tz
+            mfm.Scrobble.from_dict(d)
+            count += 1
+    return count
+
+
+def iterate_batched(log: mfm.ScrobbleLog) -> int:
+    count = 0
+    for _ in log:
+        count += 1
+    return count
+
+
+def iterate_batches_df(log: mfm.ScrobbleLog) -> int:
+    count = 0
+    for batch in log.iter_batches(10_000):
+        count += len(batch)
+    return count
+
+
+def timed(func, log):
+    start = time.perf_counter()
+    count = func(log)
+    elapsed = time.perf_counter() - start
+    return count, elapsed
+
+
+if __name__ == "__main__":
+    num_scrobbles = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    log = synthetic_log(num_scrobbles)
+    for name, func in [("row-by-row (previous)", iterate_rowwise),
+                       ("__iter__ (batched columns)", iterate_batched),
+                       ("iter_batches (DataFrame chunks)", iterate_batches_df)]:
+        count, elapsed = timed(func, log)
+        print(f"{name:<34} {count:>9} scrobbles  {elapsed:8.3f} s  "
+              f"{count / elapsed:>12,.0f} scrobbles/s")
@@ -0,0 +1,47 @@
+"""Benchmark: lastfmstats JSON ingest
+
+Compare peak RSS and wall time of `from_lastfmstats(..., "json")` with
+the streaming JSON loader and with `json.load` (streaming=False), on a
+synthetic lastfmstats JSON export. Each loader runs in a fresh process,
+so the peak RSS of one does not hide the other.
+
+Usage
+-----
+python benchmarks/bench_json_load.py [num_scrobbles] [path]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from _synthetic import generate_scrobbles, write_lastfmstats_json
+
+RUNNER = """
+import sys, time
+import memoryfm as mfm
+from run import peak_rss_mb
+start = time.perf_counter()
+log = mfm.from_lastfmstats(sys.argv[1], "json", tz="Etc/UTC",
+                           streaming=sys.argv[2] == "1")
+elapsed = time.perf_counter() - start
+print(f"{len(log)} {elapsed:.2f} {peak_rss_mb():.0f}")
+"""
+
+
+if __name__ == "__main__":
+    num_scrobbles = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(
+            tmp_dir, "lastfmstats-bench.json")
+        if not os.path.exists(path):
+            write_lastfmstats_json(generate_scrobbles(num_scrobbles), path)
+        size = os.path.getsize(path) / 2**20
+        print(f"{path}: {size:.0f} MB")
+        for name, streaming in [("json.load", "0"), ("streaming", "1")]:
+            out = subprocess.run([sys.executable, "-c", RUNNER,
+                                  path, streaming],
+                                 capture_output=True, text=True, check=True,
+                                 cwd=os.path.dirname(os.path.abspath(__file__)))
+            count, elapsed, rss = out.stdout.split()
+            print(f"{name:<10} {count:>9} scrobbles  {elapsed:>6} s  "
+                  f"peak RSS {rss:>6} MB")
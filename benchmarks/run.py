@@ -0,0 +1,288 @@
+"""Benchmark suite for memory.fm
+
+Times the main ScrobbleLog operations on deterministic synthetic
+lastfmstats exports (see `_synthetic.py`), and records wall time, peak
+traced Python memory (tracemalloc) and peak RSS for each of them.
+Every benchmark runs in a fresh process, so peak RSS is not inherited
+from the setup or from other benchmarks.
+
+Results are written to a JSON file that can be compared with an earlier
+run using `--compare`.
+
+Usage
+-----
+python benchmarks/run.py --sizes 10000 100000 1000000 \\
+    --output results.json [--repeat 3] [--only top_charts to_json] \\
+    [--compare previous.json]
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+import memoryfm as mfm
+from _synthetic import (
+    generate_scrobbles,
+    write_lastfmstats_csv,
+    write_lastfmstats_json,
+)
+
+
+# ---------------------------------------------------------------------
+# Benchmarks
+#
+# Each benchmark takes the data directory and returns a function to be
+# timed. Setup work (loading the log) happens before timing starts.
+
+def _load(data_dir: str) -> mfm.ScrobbleLog:
+    return mfm.ScrobbleLog.open(os.path.join(data_dir, "log.mfm"))
+
+
+def bench_from_lastfmstats_json(data_dir):
+    path = os.path.join(data_dir, "lastfmstats.json")
+    return lambda: mfm.from_lastfmstats(path, "json", tz="Etc/UTC")
+
+
+def bench_from_lastfmstats_csv(data_dir):
+    path = os.path.join(data_dir, "lastfmstats.csv")
+    return lambda: mfm.from_lastfmstats(path, "csv", tz="Etc/UTC")
+
+
+def bench_to_json(data_dir):
+    log = _load(data_dir)
+    path = os.path.join(data_dir, "to_json.json")
+    return lambda: log.to_json(path)
+
+
+def bench_from_json(data_dir):
+    path = os.path.join(data_dir, "canonical.json")
+    return lambda: mfm.ScrobbleLog.from_json(path)
+
+
+def bench_filter_by_date(data_dir):
+    log = _load(data_dir)
+    starts = pd.date_range("2010-01-01", "2024-12-01", freq="MS",
+                           tz="Etc/UTC")
+
+    def run():
+        for start in starts:
+            log.filter_by_date(start, start + pd.Timedelta(days=30))
+    return run
+
+
+def bench_top_charts(data_dir):
+    log = _load(data_dir)
+
+    def run():
+        for kind in ["track", "artist", "album"]:
+            log.top_charts(kind, n=10)
+    return run
+
+
+def bench_aggregate(data_dir):
+    log = _load(data_dir)
+    return lambda: log.aggregate(by=["artist", "album"], freq="month", n=10)
+
+
+def bench_sessions(data_dir):
+    log = _load(data_dir)
+
+    def run():
+        # Measure the computation, not the cached result
+        log.cache_clear()
+        log.sessions("30min")
+    return run
+
+
+def bench_calendar(data_dir):
+    log = _load(data_dir)
+
+    def run():
+        log.cache_clear()
+        log.calendar().longest_streak()
+    return run
+
+
+def bench_iteration(data_dir):
+    log = _load(data_dir)
+
+    def run():
+        for _ in log:
+            pass
+    return run
+
+
+def bench_append(data_dir):
+    log = _load(data_dir)
+    end = log.df["timestamp"].iloc[-1]
+    day = [{"timestamp": end + pd.Timedelta(minutes=4 * (i + 1)),
+            "track": f"New Track {i}", "artist": "New Artist",
+            "album": "New Album"} for i in range(200)]
+    return lambda: log.append(day)
+
+
+def bench_to_markdown(data_dir):
+    log = _load(data_dir)
+    path = os.path.join(data_dir, "to_markdown.md")
+    return lambda: log.to_markdown(path)
+
+
+BENCHMARKS = {
+    "from_lastfmstats_json": bench_from_lastfmstats_json,
+    "from_lastfmstats_csv": bench_from_lastfmstats_csv,
+    "to_json": bench_to_json,
+    "from_json": bench_from_json,
+    "filter_by_date": bench_filter_by_date,
+    "top_charts": bench_top_charts,
+    "aggregate": bench_aggregate,
+    "sessions": bench_sessions,
+    "calendar": bench_calendar,
+    "iteration": bench_iteration,
+    "append": bench_append,
+    "to_markdown": bench_to_markdown,
+}
+
+
+# ---------------------------------------------------------------------
+# Runner
+
+def prepare_data(num_scrobbles: int, data_dir: str, seed: int) -> None:
+    """Write the synthetic inputs used by the benchmarks"""
+    df = generate_scrobbles(num_scrobbles, seed=seed)
+    write_lastfmstats_json(df, os.path.join(data_dir, "lastfmstats.json"))
+    write_lastfmstats_csv(df, os.path.join(data_dir, "lastfmstats.csv"))
+    log = mfm.from_lastfmstats(os.path.join(data_dir, "lastfmstats.json"),
+                               "json", tz="Etc/UTC")
+    log.save(os.path.join(data_dir, "log.mfm"))
+    log.to_json(os.path.join(data_dir, "canonical.json"))
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak RSS of this process.
+
+    Reads VmHWM on Linux: unlike ru_maxrss, it is not carried over from
+    the parent process through fork/exec.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 2**10
+    except OSError:
+        pass
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            / (2**20 if sys.platform == "darwin" else 2**10))
+
+
+def run_single(name: str, data_dir: str) -> dict:
+    """Run one benchmark once, in the current process"""
+    func = BENCHMARKS[name](data_dir)
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": seconds,
+        "tracemalloc_peak_mb": peak / 2**20,
+        "max_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_isolated(name: str, data_dir: str) -> dict:
+    """Run one benchmark in a fresh interpreter"""
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__),
+         "--single", name, data_dir],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def environment() -> dict:
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "memory.fm": mfm.__version__,
+        "pandas": pd.__version__,
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results: list[dict], previous_file: str) -> None:
+    """Print timing ratios against an earlier results file"""
+    with open(previous_file) as f:
+        previous = {(r["benchmark"], r["num_scrobbles"]): r
+                    for r in json.load(f)["results"]}
+    print(f"\nCompared with {previous_file} (ratio > 1: faster now)")
+    for result in results:
+        old = previous.get((result["benchmark"], result["num_scrobbles"]))
+        if old is None:
+            continue
+        ratio = old["seconds"] / result["seconds"]
+        print(f"{result['benchmark']:<24} {result['num_scrobbles']:>9}"
+              f"  {old['seconds']:9.4f} s -> {result['seconds']:9.4f} s"
+              f"  x{ratio:.2f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000],
+                        help="numbers of scrobbles (10k to 5M)")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS),
+                        help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="runs per benchmark; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", metavar="PREVIOUS_JSON")
+    parser.add_argument("--single", nargs=2, metavar=("NAME", "DATA_DIR"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.single:
+        print(json.dumps(run_single(*args.single)))
+        return
+
+    names = args.only or list(BENCHMARKS)
+    results = []
+    for num_scrobbles in args.sizes:
+        with tempfile.TemporaryDirectory() as data_dir:
+            prepare_data(num_scrobbles, data_dir, args.seed)
+            for name in names:
+                runs = [run_isolated(name, data_dir)
+                        for _ in range(args.repeat)]
+                best = min(runs, key=lambda run: run["seconds"])
+                result = {"benchmark": name,
+                          "num_scrobbles": num_scrobbles,
+                          "repeat": args.repeat,
+                          **best}
+                results.append(result)
+                print(f"{name:<24} {num_scrobbles:>9}"
+                      f"  {best['seconds']:9.4f} s"
+                      f"  tracemalloc {best['tracemalloc_peak_mb']:8.1f} MB"
+                      f"  RSS {best['max_rss_mb']:8.1f} MB")
+    with open(args.output, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f,
+                  indent=2)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Export periodic top charts for a whole listening history.
+
+Loads a lastfmstats.com export (JSON or CSV) or a memory.fm binary log
+(.mfm), computes the top charts of every period in one pass, and writes
+one markdown file per period. The tidy chart table can also be written
+as CSV.
+
+Usage
+-----
+python scripts/batch_export.py EXPORT --output-dir charts/ \\
+    [--freq month] [-n 10] [--kinds artist album track] \\
+    [--tz Asia/Kolkata] [--csv charts.csv]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+
+import memoryfm as mfm
+from memoryfm.charts.top_charts import periodic_charts_markdown
+
+
+def load_log(path: str, tz: str | None = None) -> mfm.ScrobbleLog:
+    """Load a ScrobbleLog from a lastfmstats export or a .mfm file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".mfm":
+        scrobble_log = mfm.ScrobbleLog.open(path)
+        if tz is not None:
+            scrobble_log = scrobble_log.tz_convert(tz)
+        return scrobble_log
+    file_type = "csv" if extension == ".csv" else "json"
+    return mfm.from_lastfmstats(path, file_type, tz=tz)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("export", help="lastfmstats JSON/CSV export or .mfm")
+    parser.add_argument("--output-dir", default="charts")
+    parser.add_argument("--freq", default="month",
+                        choices=["day", "week", "month", "year"])
+    parser.add_argument("-n", type=int, default=10,
+                        help="entries per chart")
+    parser.add_argument("--kinds", nargs="+",
+                        default=["artist", "album", "track"],
+                        choices=["artist", "album", "track"])
+    parser.add_argument("--tz", help="timezone of the periods")
+    parser.add_argument("--csv", metavar="FILE",
+                        help="also write the tidy chart table as CSV")
+    args = parser.parse_args(argv)
+
+    scrobble_log = load_log(args.export, args.tz)
+    charts = scrobble_log.periodic_charts(args.freq, args.kinds, args.n)
+    if args.csv:
+        charts.to_csv(args.csv, index=False)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    sections = periodic_charts_markdown(charts)
+    for period, markdown in sections.items():
+        path = os.path.join(args.output_dir, f"charts-{period}.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# Top charts for {scrobble_log.username}: {period}\n\n")
+            f.write(markdown + "\n")
+    print(f"Wrote {len(sections)} chart files to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
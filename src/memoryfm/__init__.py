@@ -1,20 +1,56 @@
-"""Package: memoryfm"""
+"""Package: memoryfm
 
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:
-        from importlib_metadata import version, PackageNotFoundError
-try:
-    __version__ = version("memory.fm")
-except PackageNotFoundError:
-    __version__ = "0.0.0"    # Fallback value only
+Public names are imported on first access (PEP 562), so that
+`import memoryfm` does not load pandas and the io stack until they are
+needed.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from memoryfm.core.objects import ScrobbleLog, Scrobble
-from memoryfm.io.api import from_lastfmstats
+if TYPE_CHECKING:
+    from memoryfm.core.objects import ScrobbleLog, Scrobble
+    from memoryfm.core.partitioned import PartitionedScrobbleLog
+    from memoryfm.io.api import from_lastfmstats, from_lastfmstats_many
+
+# Public name -> module defining it
+_LAZY_IMPORTS = {
+    "ScrobbleLog": "memoryfm.core.objects",
+    "Scrobble": "memoryfm.core.objects",
+    "PartitionedScrobbleLog": "memoryfm.core.partitioned",
+    "from_lastfmstats": "memoryfm.io.api",
+    "from_lastfmstats_many": "memoryfm.io.api",
+}
+
+# Subpackages and modules, imported on first attribute access too, as
+# `import memoryfm` made them reachable when it imported them eagerly
+_SUBMODULES = {"charts", "cli", "core", "errors", "export", "filter", "io",
+               "util"}
 
 __all__ = [
         "from_lastfmstats",
+        "from_lastfmstats_many",
         "ScrobbleLog",
+        "PartitionedScrobbleLog",
         "Scrobble"
 ]
 
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from memoryfm._version import package_version
+        value = package_version()
+    elif name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _SUBMODULES:
+        from importlib import import_module
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the name without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS, *_SUBMODULES, "__version__"})
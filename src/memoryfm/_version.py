@@ -0,0 +1,14 @@
+"""Module: _version
+Resolve the installed memory.fm version
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def package_version() -> str:
+    """Return the installed memory.fm version, resolved only once"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version("memory.fm")
+    except PackageNotFoundError:
+        return "0.0.0"    # Fallback value only
@@ -0,0 +1,242 @@
+"""Module: memoryfm.charts._aggregate
+Group-by aggregation engine for ScrobbleLog charts.
+
+Counts scrobbles by one or more key columns (e.g. artist and album, so
+that two albums both called "Greatest Hits" stay apart), optionally
+bucketed by day/week/month/year, and ranks the counts within each group
+in a single vectorized pass.
+"""
+
+from __future__ import annotations
+import pandas as pd
+
+KEYS = ["track", "artist", "album"]
+
+# Weeks run from Monday to Sunday
+FREQUENCIES = {
+    "day": "D",
+    "week": "W-SUN",
+    "month": "M",
+    "year": "Y",
+}
+
+
+def _as_keys(value: str | list[str] | None, name: str) -> list[str]:
+    """Normalise key column name(s), e.g. 'Artists' -> ['artist']"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    keys = []
+    for key in value:
+        if not isinstance(key, str):
+            raise TypeError(f"Expecting string type values for '{name}'")
+        key = key.lower().strip().rstrip("s")
+        if key not in KEYS:
+            raise ValueError(f"'{name}' columns must be in: {KEYS}")
+        keys.append(key)
+    return keys
+
+
+def validate_aggregate_args(
+    by: str | list[str],
+    freq: str | None = None,
+    n: int | None = None,
+    within: str | list[str] | None = None,
+) -> tuple[list[str], str | None, int | None, list[str]]:
+    """
+    Check and normalise the arguments of `aggregate`.
+    """
+    by = _as_keys(by, "by")
+    within = _as_keys(within, "within")
+    if not by:
+        raise ValueError("'by' must name at least one column")
+    if len(set(by)) != len(by):
+        raise ValueError("'by' columns must be unique")
+    for key in within:
+        if key not in by:
+            raise ValueError("'within' columns must also be in 'by'")
+    if freq is not None:
+        if not isinstance(freq, str):
+            raise TypeError("Expecting string type value for 'freq'")
+        freq = freq.lower().strip()
+        if freq not in FREQUENCIES:
+            raise ValueError(f"'freq' must be one of: {list(FREQUENCIES)}")
+    if n is not None and (not isinstance(n, int) or n < 0):
+        raise ValueError("'n' must be a non-negative integer")
+    return by, freq, n, within
+
+
+def periods(timestamps: pd.Series, freq: str) -> pd.Series:
+    """
+    Bucket tz-aware timestamps into periods of their local (wall) time.
+    """
+    local = timestamps.dt.tz_localize(None)
+    return local.dt.to_period(FREQUENCIES[freq]).rename("period")
+
+
+def aggregate(
+    df: pd.DataFrame,
+    by: str | list[str],
+    freq: str | None = None,
+    n: int | None = None,
+    within: str | list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Count scrobbles of a validated ScrobbleLog DataFrame.
+
+    Parameters
+    ----------
+    by: column(s) among 'track', 'artist', 'album' forming the key
+    freq: None, 'day', 'week', 'month' or 'year' to count per period
+    n: keep only the top `n` keys of each group (all if None)
+    within: column(s) of `by` to rank within, e.g. by=['artist', 'album'],
+        within='artist' ranks each artist's albums
+
+    Returns a tidy DataFrame with columns
+    ['period'] (if `freq`) + `by` + ['scrobbles', 'rank'],
+    sorted by period, group and rank. Ranks start at 1; ties are ordered
+    by key. Scrobbles with a missing key value are not counted.
+    """
+    by, freq, n, within = validate_aggregate_args(by, freq, n, within)
+    keys = [df[key] for key in by]
+    groups = list(within)
+    if freq is not None:
+        keys.insert(0, periods(df["timestamp"], freq))
+        groups.insert(0, "period")
+    return _rank(df, keys, groups, n)
+
+
+def _rank(
+    df: pd.DataFrame,
+    keys: list[pd.Series],
+    groups: list[str],
+    n: int | None,
+) -> pd.DataFrame:
+    """Count `df` rows by `keys` and rank the counts within `groups`"""
+    counts = (df.groupby(keys, observed=True, sort=True)
+                .size()
+                .rename("scrobbles")
+                .reset_index())
+    counts = rank_counts(counts, groups, n)
+    for key in keys:
+        column = counts[key.name]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            counts[key.name] = column.astype(column.cat.categories.dtype)
+    return counts
+
+
+def rank_counts(
+    counts: pd.DataFrame,
+    groups: list[str],
+    n: int | None,
+) -> pd.DataFrame:
+    """
+    Rank a key-sorted frame of 'scrobbles' counts within `groups`,
+    keeping the top `n` of each group.
+    """
+    # Rank within each group: highest count first, ties in key order
+    sort_columns = groups + ["scrobbles"]
+    ascending = [True] * len(groups) + [False]
+    counts = counts.sort_values(sort_columns, ascending=ascending,
+                                kind="stable", ignore_index=True)
+    if groups:
+        counts["rank"] = counts.groupby(groups, observed=True,
+                                        sort=False).cumcount() + 1
+    else:
+        counts["rank"] = range(1, len(counts) + 1)
+    if n is not None:
+        counts = counts[counts["rank"] <= n].reset_index(drop=True)
+    return counts
+
+
+def count(
+    df: pd.DataFrame,
+    by: list[str],
+    freq: str | None = None,
+) -> pd.DataFrame:
+    """
+    Unranked counts of `aggregate` for validated `by` and `freq`, with
+    plain string keys, e.g. for one part of a log to `merge_counts`.
+    """
+    keys = [df[key] for key in by]
+    if freq is not None:
+        keys.insert(0, periods(df["timestamp"], freq))
+    counts = (df.groupby(keys, observed=True, sort=False)
+                .size()
+                .rename("scrobbles")
+                .reset_index())
+    for key in by:
+        column = counts[key]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            counts[key] = column.astype(column.cat.categories.dtype)
+    return counts
+
+
+def merge_counts(
+    parts: list[pd.DataFrame],
+    by: str | list[str],
+    freq: str | None = None,
+    n: int | None = None,
+    within: str | list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Merge the `count` results of disjoint parts of a log into the result
+    of `aggregate` over the whole log.
+    """
+    by, freq, n, within = validate_aggregate_args(by, freq, n, within)
+    columns = by if freq is None else ["period"] + by
+    groups = list(within) if freq is None else ["period"] + within
+    parts = [part for part in parts if len(part)]
+    if not parts:
+        return pd.DataFrame(columns=columns + ["scrobbles", "rank"])
+    counts = (pd.concat(parts, ignore_index=True)
+                .groupby(columns, sort=True)["scrobbles"]
+                .sum()
+                .reset_index())
+    return rank_counts(counts, groups, n)
+
+
+# Keys of each chart: tracks and albums are told apart by artist
+CHART_KEYS = {
+    "artist": ["artist"],
+    "album": ["artist", "album"],
+    "track": ["artist", "track"],
+}
+
+
+def periodic_charts(
+    df: pd.DataFrame,
+    freq: str = "month",
+    kinds: str | list[str] = ("artist", "album", "track"),
+    n: int | None = 10,
+) -> pd.DataFrame:
+    """
+    Top `n` charts of each kind for every period of a validated
+    ScrobbleLog DataFrame.
+
+    Periods are computed once and shared by all charts; each chart is a
+    single groupby over (period, key) ranked within the period.
+
+    Returns a tidy DataFrame with columns
+    ['period', 'chart', 'rank', 'artist', 'album', 'track', 'scrobbles'],
+    sorted by period, chart (in the order of `kinds`) and rank. Key
+    columns a chart does not use are missing (NaN).
+    """
+    kinds = _as_keys(kinds, "kinds")
+    if not kinds:
+        raise ValueError("'kinds' must name at least one chart")
+    _, freq, n, _ = validate_aggregate_args(kinds, freq, n)
+    if freq is None:
+        raise ValueError(f"'freq' must be one of: {list(FREQUENCIES)}")
+    period = periods(df["timestamp"], freq)
+    charts = []
+    for kind in kinds:
+        keys = [period] + [df[key] for key in CHART_KEYS[kind]]
+        chart = _rank(df, keys, ["period"], n)
+        chart.insert(1, "chart", kind)
+        charts.append(chart)
+    result = pd.concat(charts, ignore_index=True)
+    result = result.reindex(columns=["period", "chart", "rank", "artist",
+                                     "album", "track", "scrobbles"])
+    return result.sort_values("period", kind="stable", ignore_index=True)
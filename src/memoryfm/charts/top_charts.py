@@ -24,3 +24,55 @@ def top_charts_markdown(
         "kind_print": kind_print_dict.get(kind),
         "markdown": top_charts_markdown
     }
+
+
+def aggregate_markdown(
+    result: pd.DataFrame,
+    tablefmt: str = "github"
+) -> dict[str, str]:
+    """
+    Render the result of `ScrobbleLog.aggregate` as markdown tables.
+
+    Returns a dict mapping each period (as a string) to its chart, or
+    {"all": chart} if the result is not bucketed by period.
+    """
+    columns = [c for c in result.columns if c != "period"]
+    headers = {c: c.capitalize() for c in columns}
+    headers["rank"] = "#"
+    order = ["rank"] + [c for c in columns if c != "rank"]
+    if "period" not in result.columns:
+        groups = [("all", result)]
+    else:
+        groups = result.groupby("period", sort=True)
+    return {
+        str(period): group[order].rename(columns=headers)
+                                 .to_markdown(index=False, tablefmt=tablefmt)
+        for period, group in groups
+    }
+
+
+def periodic_charts_markdown(
+    result: pd.DataFrame,
+    tablefmt: str = "github"
+) -> dict[str, str]:
+    """
+    Render the result of `ScrobbleLog.periodic_charts` as markdown.
+
+    Returns a dict mapping each period (as a string) to a markdown
+    section with one table per chart.
+    """
+    kind_print_dict = {
+        "track": "Tracks",
+        "artist": "Artists",
+        "album": "Albums"
+    }
+    sections = {}
+    for period, period_charts in result.groupby("period", sort=True):
+        tables = []
+        for kind, chart in period_charts.groupby("chart", sort=False):
+            chart = chart.drop(columns=["period", "chart"])
+            chart = chart.dropna(axis=1, how="all")
+            markdown = aggregate_markdown(chart, tablefmt)["all"]
+            tables.append(f"### Top {kind_print_dict[kind]}\n\n{markdown}")
+        sections[str(period)] = "\n\n".join(tables)
+    return sections
@@ -0,0 +1,247 @@
+"""Module: memoryfm.cli
+The `memoryfm` command line interface.
+
+Usage
+-----
+memoryfm info EXPORT
+memoryfm charts EXPORT [--kind artist] [-n 10] [--freq month]
+                       [--start DATE] [--end DATE]
+memoryfm filter EXPORT [--start DATE] [--end DATE] [-o FILE]
+memoryfm export EXPORT OUTPUT [--format json|csv|lastfmstats|yaml|md|mfm]
+memoryfm cache list
+memoryfm cache prune [--all] [--older-than DAYS]
+
+EXPORT is a lastfmstats.com JSON/CSV export or a memory.fm binary log
+(.mfm). Parsed exports are kept in an on-disk cache (see
+`memoryfm.io._log_cache`), so later commands on the same export skip
+parsing; pass --no-cache to bypass it.
+"""
+from __future__ import annotations
+import argparse
+import contextlib
+import datetime
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from memoryfm.core.objects import ScrobbleLog
+
+EXPORT_FORMATS = ["json", "csv", "lastfmstats", "yaml", "md", "mfm"]
+EXTENSION_FORMATS = {".json": "json", ".csv": "csv", ".yaml": "yaml",
+                     ".yml": "yaml", ".md": "md", ".mfm": "mfm"}
+
+
+def load_log(args: argparse.Namespace) -> ScrobbleLog:
+    """Load the export of `args`, through the cache unless disabled"""
+    path = args.export
+    file_type = args.file_type
+    if file_type is None:
+        extension = os.path.splitext(path)[1].lower()
+        file_type = {".json": "json", ".csv": "csv",
+                     ".mfm": "mfm"}.get(extension)
+        if file_type is None:
+            raise ValueError(f"Cannot tell the file type of '{path}', "
+                             "pass --file-type")
+    if file_type == "mfm":
+        from memoryfm.core.objects import ScrobbleLog
+        scrobble_log = ScrobbleLog.open(path)
+        if args.tz is not None:
+            scrobble_log = scrobble_log.tz_convert(args.tz, inplace=False)
+        return scrobble_log
+    from memoryfm.core._validation import validate_tz
+    # Without tzlocal, the fallback timezone warning is printed: keep it
+    # off stdout, where logs may be written
+    with contextlib.redirect_stdout(sys.stderr):
+        tz = validate_tz(args.tz)
+    if args.no_cache:
+        from memoryfm.io.lastfmstats import from_lastfmstats
+        return from_lastfmstats(path, file_type, tz=tz)
+    from memoryfm.io._log_cache import LogCache
+    return LogCache(args.cache_dir).load(path, file_type, tz=tz)
+
+
+def write_log(
+    scrobble_log: ScrobbleLog,
+    output: str | None,
+    fmt: str | None
+) -> None:
+    """Write `scrobble_log` to `output` (stdout if None) in format `fmt`"""
+    if fmt is None:
+        extension = os.path.splitext(output or "")[1].lower()
+        fmt = EXTENSION_FORMATS.get(extension, "md")
+    if fmt == "mfm":
+        if output is None:
+            raise ValueError("The mfm format needs an output file")
+        scrobble_log.save(output)
+        return
+    file = output if output is not None else sys.stdout
+    if fmt == "json":
+        scrobble_log.to_json(file)
+    elif fmt in ("csv", "lastfmstats"):
+        layout = "plain" if fmt == "csv" else fmt
+        scrobble_log.to_csv(file, layout=layout)
+    elif fmt == "yaml":
+        scrobble_log.to_yaml(file)
+    elif not len(scrobble_log) and output is None:
+        print(scrobble_log.to_markdown())
+    elif not len(scrobble_log):
+        scrobble_log.to_markdown(output)
+    else:
+        scrobble_log.to_markdown(file, max_length=None, chunksize=100_000)
+        if output is None:
+            print()
+
+
+# ---------------------------------------------------------------------
+# Commands
+
+def cmd_info(args: argparse.Namespace) -> None:
+    scrobble_log = load_log(args)
+    meta = scrobble_log.meta
+    print(f"Username  : {meta['username']}")
+    print(f"Timezone  : {meta['tz']}")
+    print(f"Scrobbles : {meta['num_scrobbles']}")
+    print(f"From      : {meta['date_range']['start']}")
+    print(f"To        : {meta['date_range']['end']}")
+    print(f"Source    : {meta['source']}")
+
+
+def cmd_charts(args: argparse.Namespace) -> None:
+    scrobble_log = load_log(args)
+    if args.freq is None:
+        chart = scrobble_log.top_charts(args.kind, n=args.n,
+                                        start=args.start, end=args.end)
+        print(chart.to_markdown(tablefmt=args.tablefmt))
+        return
+    from memoryfm.charts._aggregate import CHART_KEYS
+    from memoryfm.charts.top_charts import aggregate_markdown
+    kind = args.kind.lower().strip().rstrip("s")
+    result = scrobble_log.aggregate(CHART_KEYS[kind], freq=args.freq,
+                                    n=args.n, start=args.start,
+                                    end=args.end)
+    sections = aggregate_markdown(result, tablefmt=args.tablefmt)
+    print("\n\n".join(f"## {period}\n\n{table}"
+                      for period, table in sections.items()))
+
+
+def cmd_filter(args: argparse.Namespace) -> None:
+    scrobble_log = load_log(args).filter_by_date(args.start, args.end)
+    write_log(scrobble_log, args.output, args.format)
+
+
+def cmd_export(args: argparse.Namespace) -> None:
+    write_log(load_log(args), args.output, args.format)
+
+
+def cmd_cache_list(args: argparse.Namespace) -> None:
+    from memoryfm.io._log_cache import LogCache
+    cache = LogCache(args.cache_dir)
+    entries = cache.entries()
+    print(f"Cache directory: {cache.path} ({len(entries)} entries)")
+    for entry in entries:
+        print(f"{entry['key']}  {entry['username']}  "
+              f"{entry['num_scrobbles']} scrobbles  {entry['tz']}  "
+              f"{entry['size'] / 2**20:.1f} MiB  "
+              f"last used {entry['last_used'][:19]}  {entry['source']}")
+
+
+def cmd_cache_prune(args: argparse.Namespace) -> None:
+    from memoryfm.io._log_cache import LogCache
+    max_age = None
+    if args.older_than is not None:
+        max_age = datetime.timedelta(days=args.older_than)
+    stats = LogCache(args.cache_dir).prune(everything=args.all,
+                                           max_age=max_age)
+    print(f"Removed {stats.removed} cached files "
+          f"({stats.freed_bytes / 2**20:.1f} MiB)")
+
+
+# ---------------------------------------------------------------------
+# Parser
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="memoryfm",
+        description="Read, analyze and export Last.fm scrobble data."
+    )
+    parser.add_argument("--cache-dir",
+                        help="parsed log cache directory (default: "
+                             "$MEMORYFM_CACHE_DIR or ~/.cache/memoryfm)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    source = argparse.ArgumentParser(add_help=False)
+    source.add_argument("export",
+                        help="lastfmstats JSON/CSV export or .mfm file")
+    source.add_argument("--file-type", choices=["json", "csv", "mfm"],
+                        help="type of EXPORT (default: from its extension)")
+    source.add_argument("--tz", help="timezone of the scrobbles")
+    source.add_argument("--no-cache", action="store_true",
+                        help="parse EXPORT without the cache")
+
+    window = argparse.ArgumentParser(add_help=False)
+    window.add_argument("--start", help="first date (inclusive)")
+    window.add_argument("--end", help="last date (inclusive)")
+
+    info = commands.add_parser("info", parents=[source],
+                               help="show the metadata of a log")
+    info.set_defaults(func=cmd_info)
+
+    charts = commands.add_parser("charts", parents=[source, window],
+                                 help="show top charts")
+    charts.add_argument("--kind", default="artist",
+                        choices=["artist", "album", "track"])
+    charts.add_argument("-n", type=int, default=10,
+                        help="entries per chart")
+    charts.add_argument("--freq", choices=["day", "week", "month", "year"],
+                        help="one chart per period")
+    charts.add_argument("--tablefmt", default="github",
+                        help="tabulate table format")
+    charts.set_defaults(func=cmd_charts)
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=EXPORT_FORMATS,
+                        help="output format (default: from the output "
+                             "extension, else markdown)")
+
+    filter_ = commands.add_parser("filter",
+                                  parents=[source, window, output],
+                                  help="select scrobbles by date")
+    filter_.add_argument("-o", "--output",
+                         help="output file (default: stdout)")
+    filter_.set_defaults(func=cmd_filter)
+
+    export = commands.add_parser("export", parents=[source, output],
+                                 help="convert a log to another format")
+    export.add_argument("output", help="output file")
+    export.set_defaults(func=cmd_export)
+
+    cache = commands.add_parser("cache", help="inspect or prune the cache")
+    cache_commands = cache.add_subparsers(dest="cache_command",
+                                          required=True)
+    cache_list = cache_commands.add_parser("list", help="list cached logs")
+    cache_list.set_defaults(func=cmd_cache_list)
+    prune = cache_commands.add_parser(
+        "prune", help="remove logs of missing or changed exports"
+    )
+    prune.add_argument("--all", action="store_true",
+                       help="remove every cached log")
+    prune.add_argument("--older-than", type=float, metavar="DAYS",
+                       help="also remove logs not used for DAYS days")
+    prune.set_defaults(func=cmd_cache_prune)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    from memoryfm.errors import InvalidDataError
+    try:
+        args.func(args)
+    except (InvalidDataError, ValueError, OSError) as e:
+        print(f"memoryfm: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
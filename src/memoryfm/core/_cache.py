@@ -0,0 +1,80 @@
+"""Module: memoryfm.core._cache
+Bounded LRU cache for results derived from a ScrobbleLog.
+
+Each ScrobbleLog owns one cache. Keys are hashable tuples describing
+the computation (e.g. ("top_charts", kind, n, first_row, last_row)), and
+the whole cache is cleared whenever the log's data changes.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Hashable
+
+DEFAULT_CACHE_SIZE = 64
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    Least-recently-used cache holding at most `maxsize` results.
+
+    Hit, miss and eviction counts are kept across `clear()` calls, so
+    they describe the whole life of the owning ScrobbleLog.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError("'maxsize' must be a non-negative integer")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for `key`, computing and storing it on
+        a miss.
+        """
+        try:
+            result = self._data[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return result
+        result = compute()
+        if self.maxsize:
+            self._data[key] = result
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        """Change `maxsize`, evicting the least recently used results"""
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError("'maxsize' must be a non-negative integer")
+        self.maxsize = maxsize
+        while len(self._data) > maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        self._data.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self.maxsize, len(self._data))
@@ -0,0 +1,116 @@
+"""Module: memoryfm.core._calendar
+Dense scrobble counts per local day, hour of day and weekday.
+
+Timestamps are binned on their local (wall) time in the log's tz, as
+integer offsets: days since 1970-01-01 and hours since midnight. The
+counts are then `np.bincount`s over those offsets, so a whole history
+is binned in one pass, and listening streaks are runs of non-zero days
+in the daily array.
+"""
+
+from __future__ import annotations
+import datetime
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import NamedTuple
+
+EPOCH = datetime.date(1970, 1, 1)
+
+
+class Streak(NamedTuple):
+    days: int
+    start: datetime.date
+    end: datetime.date
+    scrobbles: int
+
+
+@dataclass(frozen=True, eq=False)
+class Calendar:
+    """
+    Scrobble counts of a ScrobbleLog in its local time.
+
+    daily   : counts per day, from `start` to the last day with a
+              scrobble (days without scrobbles count 0)
+    hourly  : 24 counts, by hour of day
+    weekday : 7 counts, by day of week (0 is Monday)
+
+    The arrays are read-only, as a Calendar is cached by its log.
+    Calendars compare (and hash) by identity.
+    """
+    start: datetime.date | None
+    daily: np.ndarray
+    hourly: np.ndarray
+    weekday: np.ndarray
+
+    @property
+    def end(self) -> datetime.date | None:
+        """Last day of `daily`"""
+        if self.start is None:
+            return None
+        return self.start + datetime.timedelta(days=len(self.daily) - 1)
+
+    def daily_series(self) -> pd.Series:
+        """`daily` as a Series indexed by (tz-naive) local dates"""
+        index = pd.date_range(self.start or EPOCH, periods=len(self.daily),
+                              freq="D", name="date")
+        return pd.Series(self.daily, index=index, name="scrobbles")
+
+    def streaks(self, min_days: int = 1) -> pd.DataFrame:
+        """
+        Runs of consecutive days with scrobbles, lasting at least
+        `min_days` days, with columns ['start', 'end', 'days',
+        'scrobbles'].
+        """
+        active = np.zeros(len(self.daily) + 2, dtype=np.int8)
+        active[1:-1] = self.daily > 0
+        edges = np.diff(active)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        days = ends - starts
+        totals = np.r_[0, np.cumsum(self.daily)]
+        keep = days >= min_days
+        starts, ends, days = starts[keep], ends[keep], days[keep]
+        first = np.datetime64(self.start or EPOCH, "D")
+        return pd.DataFrame({
+            "start": (first + starts).astype(object),
+            "end": (first + ends - 1).astype(object),
+            "days": days,
+            "scrobbles": totals[ends] - totals[starts],
+        })
+
+    def longest_streak(self) -> Streak | None:
+        """The longest (earliest, on ties) streak, None if no scrobbles"""
+        streaks = self.streaks()
+        if streaks.empty:
+            return None
+        row = streaks.iloc[int(streaks["days"].to_numpy().argmax())]
+        return Streak(int(row["days"]), row["start"], row["end"],
+                      int(row["scrobbles"]))
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+def calendar(timestamps: pd.Series) -> Calendar:
+    """Calendar of the tz-aware `timestamps` of a ScrobbleLog"""
+    if not len(timestamps):
+        empty = np.zeros(0, dtype=np.int64)
+        return Calendar(None, _read_only(empty),
+                        _read_only(np.zeros(24, dtype=np.int64)),
+                        _read_only(np.zeros(7, dtype=np.int64)))
+    local = pd.DatetimeIndex(timestamps).tz_localize(None)
+    per_hour = int(pd.Timedelta(1, unit="h") // pd.Timedelta(1, unit=local.unit))
+    # Floor division, so times before 1970 fall on the right day/hour
+    hours = local.asi8 // per_hour
+    days = hours // 24
+    first = int(days.min())
+    daily = np.bincount(days - first)
+    hourly = np.bincount(hours - days * 24, minlength=24)
+    # 1970-01-01 was a Thursday (3)
+    weekday = np.bincount((days + 3) % 7, minlength=7)
+    start = EPOCH + datetime.timedelta(days=first)
+    return Calendar(start, _read_only(daily), _read_only(hourly),
+                    _read_only(weekday))
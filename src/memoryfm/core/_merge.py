@@ -0,0 +1,109 @@
+"""Module: memoryfm.core._merge
+Duplicate detection for merging overlapping ScrobbleLogs.
+
+Two scrobbles are duplicates if they have the same timestamp, track,
+artist and (optionally) album. Both logs are sorted by timestamp, so a
+binary search over the timestamps first narrows the comparison down to
+the few rows sharing a timestamp with the other log; only those rows are
+compared on their string columns, as integer dictionary codes.
+"""
+
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+from typing import NamedTuple
+
+KEY_COLUMNS = ["track", "artist", "album"]
+
+
+class MergeStats(NamedTuple):
+    added: int
+    skipped: int
+
+
+def _epochs(
+    timestamps: pd.Series,
+    new_timestamps: pd.Series
+) -> tuple[np.ndarray, np.ndarray]:
+    """Epoch integers of two timestamp columns in a common unit"""
+    index = pd.DatetimeIndex(timestamps)
+    new_index = pd.DatetimeIndex(new_timestamps)
+    if index.unit != new_index.unit:
+        index, new_index = index.as_unit("ns"), new_index.as_unit("ns")
+    return index.asi8, new_index.asi8
+
+
+def _shared_codes(
+    series: pd.Series,
+    new_series: pd.Series
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Integer codes of two categorical columns in one code space, and the
+    number of codes: equal values get equal codes, and missing values
+    the code -1.
+    """
+    categories = series.cat.categories
+    new_categories = new_series.cat.categories
+    mapping = categories.get_indexer(new_categories)
+    unknown = mapping < 0
+    mapping[unknown] = len(categories) + np.arange(unknown.sum())
+    # Code -1 (missing) picks the appended -1
+    mapping = np.append(mapping, -1)
+    new_codes = mapping[new_series.cat.codes.to_numpy()]
+    size = len(categories) + int(unknown.sum())
+    return series.cat.codes.to_numpy(np.int64), new_codes, size
+
+
+def duplicate_mask(
+    df: pd.DataFrame,
+    new: pd.DataFrame,
+    match_album: bool = True
+) -> np.ndarray:
+    """
+    Mark the rows of `new` that duplicate a row of `df` or an earlier
+    row of `new`.
+
+    Both are validated ScrobbleLog DataFrames sorted by timestamp.
+    """
+    timestamps, new_timestamps = _epochs(df["timestamp"], new["timestamp"])
+    # Sort-merge on timestamps: only rows sharing one can be duplicates
+    first = np.searchsorted(timestamps, new_timestamps, side="left")
+    last = np.searchsorted(timestamps, new_timestamps, side="right")
+    in_df = last > first
+    same = np.zeros(len(new), dtype=bool)
+    same[1:] = new_timestamps[1:] == new_timestamps[:-1]
+    repeated = same.copy()
+    repeated[:-1] |= same[1:]
+    new_rows = np.flatnonzero(in_df | repeated)
+    mask = np.zeros(len(new), dtype=bool)
+    if not len(new_rows):
+        return mask
+    # Rows of df in the ranges [first, last) of the distinct timestamps
+    distinct = in_df & ~same
+    counts = (last - first)[distinct]
+    starts = np.repeat(first[distinct] - np.cumsum(counts) + counts, counts)
+    rows = starts + np.arange(counts.sum())
+
+    columns = KEY_COLUMNS if match_album else KEY_COLUMNS[:2]
+    keys = [np.concatenate([timestamps[rows], new_timestamps[new_rows]])]
+    sizes = []
+    for column in columns:
+        codes, new_codes, size = _shared_codes(df[column], new[column])
+        keys.append(np.concatenate([codes[rows], new_codes[new_rows]]))
+        sizes.append(size + 1)
+    if np.prod(sizes, dtype=float) < 2**63:
+        # Pack the string codes into one integer
+        packed = np.zeros(len(keys[0]), dtype=np.int64)
+        for codes, size in zip(keys[1:], sizes):
+            packed = packed * size + (codes + 1)
+        keys = [keys[0], packed]
+    # Stable sort: df rows come before new rows, and earlier rows first
+    order = np.lexsort(keys[::-1])
+    sorted_keys = [key[order] for key in keys]
+    equal = np.ones(len(order) - 1, dtype=bool)
+    for key in sorted_keys:
+        equal &= key[1:] == key[:-1]
+    duplicated = np.zeros(len(order), dtype=bool)
+    duplicated[order[1:]] = equal
+    mask[new_rows] = duplicated[len(rows):]
+    return mask
@@ -0,0 +1,117 @@
+"""Module: memoryfm.core._sessions
+Listening sessions: runs of scrobbles without a long pause.
+
+A new session starts wherever the time since the previous scrobble is
+more than the inactivity `gap`. ScrobbleLog rows are sorted by
+timestamp, so session ids are a cumulative sum over the timestamp
+differences, and per-session summaries are computed on integer arrays
+(dictionary codes for the dominant artist and album) without a Python
+loop over sessions.
+"""
+
+from __future__ import annotations
+import datetime
+import numpy as np
+import pandas as pd
+
+DEFAULT_GAP = "30min"
+
+SESSION_COLUMNS = ["session", "start", "end", "duration", "scrobbles",
+                   "artist", "album"]
+
+
+def validate_gap(gap: str | pd.Timedelta | datetime.timedelta) -> pd.Timedelta:
+    """Inactivity gap as a positive pd.Timedelta"""
+    try:
+        gap = pd.Timedelta(gap)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid 'gap': {gap!r}") from e
+    if pd.isna(gap) or gap <= pd.Timedelta(0):
+        raise ValueError("'gap' must be a positive duration")
+    return gap
+
+
+def session_ids(timestamps: pd.Series, gap: pd.Timedelta) -> np.ndarray:
+    """
+    Session id (0, 1, ...) of every row of the sorted `timestamps`: the
+    number of pauses longer than `gap` before it.
+    """
+    index = pd.DatetimeIndex(timestamps)
+    epochs = index.asi8
+    ids = np.zeros(len(epochs), dtype=np.int64)
+    if len(epochs) > 1:
+        # Whole units of the timestamps: diff > gap <=> diff > floor(gap)
+        step = int(gap // pd.Timedelta(1, unit=index.unit))
+        np.cumsum(np.diff(epochs) > step, out=ids[1:])
+    return ids
+
+
+def _dominant(ids: np.ndarray, codes: np.ndarray, num_sessions: int) -> np.ndarray:
+    """
+    Most frequent code of each session, -1 if it has no (non-missing)
+    code. Ties go to the lowest code, i.e. the first value in sorted
+    order, as categories are kept sorted.
+    """
+    result = np.full(num_sessions, -1, dtype=np.int64)
+    present = codes >= 0
+    if not present.any():
+        return result
+    ids, codes = ids[present], codes[present].astype(np.int64)
+    size = int(codes.max()) + 1
+    # Sorted (session, code) pairs form one run per pair, and the runs
+    # of each session are contiguous
+    pairs = np.sort(ids * size + codes)
+    run_starts = np.flatnonzero(np.r_[True, pairs[1:] != pairs[:-1]])
+    counts = np.diff(np.r_[run_starts, len(pairs)])
+    pairs = pairs[run_starts]
+    pair_ids = pairs // size
+    starts = np.flatnonzero(np.r_[True, pair_ids[1:] != pair_ids[:-1]])
+    best = np.maximum.reduceat(counts, starts)
+    is_best = counts == np.repeat(best, np.diff(np.r_[starts, len(counts)]))
+    # First (lowest code) pair of each session reaching its best count
+    winners = np.flatnonzero(is_best)
+    winner_ids = pair_ids[winners]
+    winners = winners[np.r_[True, winner_ids[1:] != winner_ids[:-1]]]
+    result[pair_ids[winners]] = pairs[winners] % size
+    return result
+
+
+def sessions(
+    df: pd.DataFrame,
+    gap: pd.Timedelta,
+    min_scrobbles: int = 1
+) -> pd.DataFrame:
+    """
+    One row per listening session of a validated ScrobbleLog DataFrame:
+    its id, first and last timestamps, duration (from the first to the
+    last scrobble), number of scrobbles, and its most played artist and
+    album.
+
+    Sessions with fewer than `min_scrobbles` scrobbles are left out;
+    ids are not renumbered, so they still match `session_ids`.
+    """
+    timestamps = df["timestamp"]
+    ids = session_ids(timestamps, gap)
+    num_sessions = int(ids[-1]) + 1 if len(ids) else 0
+    first = np.ones(len(ids), dtype=bool)
+    first[1:] = ids[1:] != ids[:-1]
+    starts = np.flatnonzero(first)
+    ends = np.r_[starts[1:], len(ids)][:len(starts)] - 1
+    result = pd.DataFrame({
+        "session": np.arange(num_sessions),
+        "start": timestamps.iloc[starts].reset_index(drop=True),
+        "end": timestamps.iloc[ends].reset_index(drop=True),
+    })
+    result["duration"] = result["end"] - result["start"]
+    result["scrobbles"] = ends - starts + 1
+    for column in ["artist", "album"]:
+        values = df[column]
+        codes = _dominant(ids, values.cat.codes.to_numpy(), num_sessions)
+        names = values.cat.categories.to_numpy(dtype=object)
+        dominant = np.full(num_sessions, None, dtype=object)
+        dominant[codes >= 0] = names[codes[codes >= 0]]
+        result[column] = pd.Series(dominant, dtype=object)
+    if min_scrobbles > 1:
+        result = result[result["scrobbles"] >= min_scrobbles]
+        result = result.reset_index(drop=True)
+    return result[SESSION_COLUMNS]
@@ -1,18 +1,37 @@
 from __future__ import annotations
 import pandas as pd
+from functools import lru_cache
+from memoryfm._version import package_version
 from memoryfm.errors import (
     SchemaError,
     InvalidDataError,
     InvalidTypeError
 )
 
+VALIDATION_LEVELS = ["full", "light", "trusted"]
+
 def validate_df(
     df: pd.DataFrame,
-    tz: str | None
+    tz: str | None,
+    level: str = "full"
 ) -> pd.DataFrame:
     """
     Validate ScrobbleLog DataFrame
+
+    Levels
+    ------
+    "full"    : drop rows missing required values, normalise timestamps,
+                dictionary-encode string columns and set blank values to
+                missing, and sort by timestamp.
+    "light"   : check the schema, and only convert columns which do not
+                have ScrobbleLog dtypes yet (tz-aware timestamps are only
+                converted to `tz`, categorical columns are kept as is).
+                Rows are sorted by timestamp if needed.
+    "trusted" : only select the ScrobbleLog columns; `df` must already be
+                valid, e.g. the DataFrame of another ScrobbleLog.
     """
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(f"'level' must be one of: {VALIDATION_LEVELS}")
     if not isinstance(df, pd.DataFrame):
         raise InvalidTypeError("Expecting a pandas DataFrame.")
     required_columns = [
@@ -20,24 +39,96 @@ def validate_df(
         "track",
         "artist"
     ]
+    # A trusted DataFrame has all columns, album included
+    if level == "trusted":
+        required_columns = required_columns + ["album"]
     for column in required_columns:
         if column not in df.columns:
             raise SchemaError(
                 f"Required DataFrame column not found: {column}",
                 column
             )
-    df = df.dropna(subset=required_columns)
+    if level == "trusted":
+        return df[["timestamp", "track", "artist", "album"]]
+    if level == "full":
+        df = df.dropna(subset=required_columns)
+    else:
+        # Columns are replaced below, never in the caller's DataFrame
+        df = df.copy(deep=False)
     if not df.empty:
         tz = validate_tz(tz)
-        from memoryfm.io._normalise import normalise_timestamps
-        with pd.option_context('mode.copy_on_write', True):
-            df["timestamp"] = normalise_timestamps(df["timestamp"],
-                                                   tz=tz, unit="ms")
+        timestamps = df["timestamp"]
+        if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+            # Already normalised: only the tz can differ
+            if str(timestamps.dt.tz) != tz:
+                df = df.assign(timestamp=timestamps.dt.tz_convert(tz))
+        else:
+            from memoryfm.io._normalise import normalise_timestamps
+            df = df.assign(timestamp=normalise_timestamps(timestamps,
+                                                          tz=tz, unit="ms"))
+    else:
+        # An empty DataFrame still gets a tz-aware timestamp column
+        timestamps = pd.to_datetime(df["timestamp"], utc=True)
+        if tz is not None:
+            timestamps = timestamps.dt.tz_convert(validate_tz(tz))
+        df = df.assign(timestamp=timestamps)
     if "album" not in df.columns:
         df["album"] = None
     df = df[["timestamp", "track", "artist", "album"]]
-    df = df.replace(r'^\s*$', None, regex=True)
-    return df
+    for column in STRING_COLUMNS:
+        if (
+            level == "light" and
+            isinstance(df[column].dtype, pd.CategoricalDtype)
+        ):
+            df[column] = sort_categories(df[column])
+            continue
+        df[column] = encode_strings(df[column])
+    return sort_by_timestamp(df)
+
+def sort_by_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort the rows of a ScrobbleLog DataFrame by timestamp.
+
+    ScrobbleLog keeps its rows in timestamp order, so that date ranges
+    can be looked up with a binary search. The sort is stable, and is
+    skipped if the rows are already in order.
+    """
+    if df["timestamp"].is_monotonic_increasing:
+        return df
+    return df.sort_values("timestamp", kind="stable", ignore_index=True)
+
+STRING_COLUMNS = ["track", "artist", "album"]
+
+def encode_strings(series: pd.Series) -> pd.Series:
+    """
+    Dictionary-encode a string column as a pandas categorical.
+
+    Blank or white-space only values are set to missing, and categories
+    are kept in sorted order, so that codes order like the strings (ties
+    in charts and sessions are broken in code order).
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype("category")
+    categories = series.cat.categories
+    blank = [value for value in categories
+             if isinstance(value, str) and not value.strip()]
+    if blank:
+        series = series.cat.remove_categories(blank)
+    return sort_categories(series)
+
+def sort_categories(series: pd.Series) -> pd.Series:
+    """
+    Sort the categories of a categorical Series, unless they already are
+    sorted or cannot be compared (e.g. strings mixed with numbers).
+    """
+    categories = series.cat.categories
+    if categories.is_monotonic_increasing:
+        return series
+    try:
+        ordered = categories.sort_values()
+    except TypeError:
+        return series
+    return series.cat.reorder_categories(ordered)
 
 def validate_tz(tz: str | None = None) -> str:
     """ Set timezone value from valid IANA string.
@@ -49,12 +140,7 @@ def validate_tz(tz: str | None = None) -> str:
     if not isinstance(tz, str | None):
         raise InvalidTypeError("Expecting string type value for tz")
     elif tz is not None:
-        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-        try:
-            ZoneInfo(tz)
-            return tz
-        except (ZoneInfoNotFoundError, IsADirectoryError) as e:
-            raise InvalidDataError("Invalid IANA timezone string") from e
+        return _validate_tz_name(tz)
     else:
         try:
             from tzlocal import get_localzone_name
@@ -66,6 +152,16 @@ def validate_tz(tz: str | None = None) -> str:
             )
             return "Etc/UTC"
 
+@lru_cache(maxsize=64)
+def _validate_tz_name(tz: str) -> str:
+    """Check an IANA timezone name, once per name"""
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    try:
+        ZoneInfo(tz)
+        return tz
+    except (ZoneInfoNotFoundError, IsADirectoryError) as e:
+        raise InvalidDataError("Invalid IANA timezone string") from e
+
 def validate_text(
     text: str,
     field: str
@@ -92,7 +188,6 @@ def meta_generator(
     """
     if not isinstance(df, pd.DataFrame):
         raise InvalidTypeError("Expecting a pandas DataFrame")
-    from importlib.metadata import version
     meta = {
         "username": validate_text(username, "username"),
         "tz": validate_tz(tz),
@@ -102,7 +197,7 @@ def meta_generator(
             "end": None
         },
         "source": source,
-        "memory.fm_version": f"{version('memory.fm')}",
+        "memory.fm_version": package_version(),
         "schema_version": 1
     }
     if source is None:
@@ -117,6 +212,81 @@ def meta_generator(
     meta = validate_meta(meta)
     return meta
 
+def update_meta(meta: dict, df_new: pd.DataFrame) -> dict:
+    """
+    Update meta after appending the validated rows `df_new`.
+
+    Only `df_new` is scanned: `num_scrobbles` is incremented and
+    `date_range` is widened to include the new timestamps.
+    """
+    meta = dict(meta)
+    meta["date_range"] = dict(meta["date_range"])
+    if not len(df_new):
+        return meta
+    start = df_new["timestamp"].min()
+    end = df_new["timestamp"].max()
+    date_range = meta["date_range"]
+    if not meta["num_scrobbles"] or start < pd.Timestamp(date_range["start"]):
+        date_range["start"] = start.isoformat()
+    if not meta["num_scrobbles"] or end > pd.Timestamp(date_range["end"]):
+        date_range["end"] = end.isoformat()
+    meta["num_scrobbles"] = meta["num_scrobbles"] + len(df_new)
+    return meta
+
+def derive_meta(
+    meta: dict,
+    df: pd.DataFrame,
+    source: str | None = None
+) -> dict:
+    """
+    Generate meta for a ScrobbleLog derived from an already valid one.
+
+    `df` must be a timestamp-sorted selection of the parent's rows, so
+    `date_range` is read from its first and last rows.
+    """
+    meta = dict(meta)
+    meta["num_scrobbles"] = len(df)
+    if len(df):
+        timestamps = df["timestamp"]
+        meta["date_range"] = {"start": timestamps.iloc[0].isoformat(),
+                              "end": timestamps.iloc[-1].isoformat()}
+    else:
+        meta["date_range"] = {"start": None, "end": None}
+    if source is not None:
+        meta["source"] = source
+    return meta
+
+def concat_validated(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate validated ScrobbleLog DataFrames with the same tz.
+
+    String columns stay dictionary-encoded: their categories are
+    merged with `union_categoricals`, which only recodes the integer
+    codes instead of re-encoding every string, and then sorted.
+    """
+    from pandas.api.types import union_categoricals
+    if len(frames) == 1:
+        return frames[0]
+    data = {
+        "timestamp": pd.concat([frame["timestamp"] for frame in frames],
+                               ignore_index=True)
+    }
+    for column in STRING_COLUMNS:
+        parts = [encode_strings(frame[column]) for frame in frames]
+        # An all-missing column has no categories to infer a dtype from
+        dtypes = [part.cat.categories.dtype for part in parts
+                  if len(part.cat.categories)]
+        if dtypes:
+            parts = [
+                part if len(part.cat.categories)
+                else part.cat.set_categories(pd.Index([], dtype=dtypes[0]))
+                for part in parts
+            ]
+        data[column] = sort_categories(
+            pd.Series(union_categoricals(parts), name=column)
+        )
+    return pd.DataFrame(data)
+
 def validate_meta(meta: dict) -> dict:
     """
     Validate meta schema
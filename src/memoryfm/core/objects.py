@@ -5,10 +5,10 @@ Scrobble    : (dataclass) represents a single scrobble.
 """
 
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, overload
-from tabulate import tabulate
+from typing import TYPE_CHECKING, Literal, overload
 
 from memoryfm._typing import PathLike
 from memoryfm.errors import (
@@ -18,16 +18,30 @@ from memoryfm.errors import (
     OperationNotAllowedError
 )
 from memoryfm.util.date_input_check import check_datetime
+from memoryfm.charts._aggregate import (
+    aggregate,
+    periodic_charts,
+    validate_aggregate_args,
+)
+from memoryfm.core._cache import LRUCache, CacheInfo, DEFAULT_CACHE_SIZE
+from memoryfm.core._merge import MergeStats, duplicate_mask
+from memoryfm.core._sessions import DEFAULT_GAP
+from memoryfm.core._calendar import Calendar
 from memoryfm.core._validation import(
     validate_tz,
     validate_meta,
     validate_df,
     validate_text,
     meta_generator,
+    update_meta,
+    derive_meta,
+    concat_validated,
+    sort_by_timestamp,
+    STRING_COLUMNS,
 )
 
 if TYPE_CHECKING:
-    from typing import IO, Self
+    from typing import IO, Iterable, Iterator, Self
     import datetime
 
 
@@ -120,21 +134,196 @@ class Scrobble:
 # Iterator
 
 class ScrobbleLogIterator:
-    def __init__(self, scrobble_log):
+    """
+    Iterator over the scrobbles of a ScrobbleLog.
+
+    Reads the already validated columns in batches and builds each
+    Scrobble directly, without going through `Scrobble.from_dict`.
+    """
+    def __init__(self, scrobble_log, batch_size: int = 10_000):
         """
         """
         self.scrobble_log = scrobble_log
-        self.index = 0
+        self._batches = scrobble_log.iter_batches(batch_size,
+                                                  as_scrobbles=True)
+        self._batch = iter(())
+
+    def __iter__(self):
+        return self
 
     def __next__(self):
         """
         """
-        if self.index < len(self.scrobble_log):
-            scrobble = self.scrobble_log[self.index]
-            self.index += 1
-            return scrobble
-        else:
-            raise StopIteration
+        while True:
+            try:
+                return next(self._batch)
+            except StopIteration:
+                # Raises StopIteration once all batches are consumed
+                self._batch = iter(next(self._batches))
+
+
+def _decode_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of `df` with the dictionary-encoded string columns
+    decoded to Python objects, and missing values as None.
+    """
+    df = df.copy()
+    for column in STRING_COLUMNS:
+        values = df[column].astype(object)
+        df[column] = values.where(values.notna(), None)
+    return df
+
+
+# ISO-like formats rendered with np.datetime_as_string:
+# (unit, date/time separator, with UTC offset)
+_ISO_FORMATS = {
+    "%Y-%m-%dT%H:%M:%S%z": ("s", "T", True),
+    "%Y-%m-%dT%H:%M:%S": ("s", "T", False),
+    "%Y-%m-%d %H:%M:%S": ("s", " ", False),
+    "%Y-%m-%d %H:%M": ("m", " ", False),
+    "%Y-%m-%d": ("D", "", False),
+}
+
+
+def _format_timestamps(timestamps: pd.Series, fmt: str) -> pd.Series:
+    """
+    strftime, on local wall times unless `fmt` shows the tz.
+
+    The formats in `_ISO_FORMATS` are built from NumPy's ISO 8601
+    strings instead, which is many times faster than `strftime`.
+    """
+    if fmt in _ISO_FORMATS and len(timestamps):
+        return _format_iso(timestamps, *_ISO_FORMATS[fmt])
+    if "%z" not in fmt and "%Z" not in fmt:
+        # Formatting tz-naive timestamps is much faster
+        timestamps = timestamps.dt.tz_localize(None)
+    return timestamps.dt.strftime(fmt)
+
+
+def _format_iso(
+    timestamps: pd.Series,
+    unit: str,
+    sep: str,
+    offset: bool
+) -> pd.Series:
+    local = timestamps
+    if timestamps.dt.tz is not None:
+        local = timestamps.dt.tz_localize(None)
+    values = local.to_numpy().astype(f"datetime64[{unit}]")
+    strings = np.datetime_as_string(values, unit=unit)
+    if sep != "T":
+        strings = np.char.replace(strings, "T", sep)
+    if offset and timestamps.dt.tz is not None:
+        utc = timestamps.dt.tz_convert(None).to_numpy()
+        seconds = ((local.to_numpy() - utc) // np.timedelta64(1, "s"))
+        # Few distinct offsets: format each once
+        distinct, inverse = np.unique(seconds, return_inverse=True)
+        offsets = np.array([
+            f"{'-' if s < 0 else '+'}{abs(s) // 3600:02d}"
+            f"{abs(s) % 3600 // 60:02d}"
+            for s in distinct.tolist()
+        ])
+        strings = np.char.add(strings, offsets[inverse.ravel()])
+    return pd.Series(strings.astype(object), index=timestamps.index,
+                     name=timestamps.name)
+
+
+EPOCH_UNITS = ("s", "ms", "us", "ns")
+CSV_LAYOUTS = ("plain", "lastfmstats")
+# `to_dict` orients, formerly passed to `to_csv` as its 2nd argument
+DICT_ORIENTS = ("dict", "list", "series", "split", "tight", "records",
+                "index")
+
+
+def _check_epoch_unit(unit: str) -> None:
+    if unit not in EPOCH_UNITS:
+        raise ValueError(f"'epoch_unit' must be one of {EPOCH_UNITS}")
+
+
+def _epoch_values(timestamps: pd.Series, unit: str) -> np.ndarray:
+    """Timestamps as integers since the epoch in `unit`, rounded down"""
+    index = pd.DatetimeIndex(timestamps)
+    ratio = np.timedelta64(1, unit) / np.timedelta64(1, index.unit)
+    if ratio >= 1:
+        return index.asi8 // int(ratio)
+    return index.asi8 * int(round(1 / ratio))
+
+
+def _markdown_frame(df: pd.DataFrame, datetimefmt: str) -> pd.DataFrame:
+    """
+    Rows of a validated DataFrame ready to render: plain strings,
+    formatted timestamps and capitalized column names.
+    """
+    df = _decode_strings(df)
+    df["timestamp"] = _format_timestamps(df["timestamp"], datetimefmt)
+    return df.rename(str.capitalize, axis=1)
+
+
+def _timestamp_width(timestamps: pd.Series, fmt: str) -> int:
+    """
+    Width of the widest formatted (and stripped) timestamp. Formats
+    whose output length does not depend on the date (checked over a
+    range of probe dates) are measured on one timestamp only.
+    """
+    from memoryfm.io._writers import _text_width
+    probes = pd.Series(pd.date_range("2000-01-01 00:00", periods=400,
+                                     freq="1501min", tz="Etc/UTC"))
+    widths = _format_timestamps(probes, fmt).str.len()
+    if widths.nunique() == 1 and len(timestamps):
+        timestamps = timestamps.iloc[:1]
+    formatted = _format_timestamps(timestamps, fmt).str.strip()
+    return max(map(_text_width, formatted.unique()), default=0)
+
+
+def _scrobbles_from_df(df: pd.DataFrame) -> list[Scrobble]:
+    """Build Scrobbles from the columns of a validated DataFrame"""
+    df = _decode_strings(df)
+    return [
+        Scrobble(timestamp, track, artist, album)
+        for timestamp, track, artist, album in zip(
+            df["timestamp"], df["track"], df["artist"], df["album"]
+        )
+    ]
+
+
+def _scrobble_keys(df: pd.DataFrame) -> pd.MultiIndex:
+    """
+    Build (timestamp, track, artist, album) keys for membership checks.
+
+    Timestamps are compared as UTC epoch nanoseconds, so keys do not
+    depend on the tz of the log. A missing album is keyed as "", which
+    never occurs as an album value since `validate_df` blanks it.
+    """
+    timestamps = pd.DatetimeIndex(df["timestamp"]).as_unit("ns").asi8
+    album = df["album"].astype(object)
+    album = album.where(album.notna(), "")
+    return pd.MultiIndex.from_arrays(
+        [timestamps, df["track"].to_numpy(object),
+         df["artist"].to_numpy(object), album.to_numpy(object)],
+        names=["timestamp", "track", "artist", "album"]
+    )
+
+
+def _date_window(
+    start: str | pd.Timestamp | datetime.datetime | None,
+    end: str | pd.Timestamp | datetime.datetime | None,
+    tz: str,
+    unit: str | None = None,
+    include_end: bool = True
+) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
+    """
+    Resolve the bounds of a date window to Timestamps in `tz`: `start`
+    is inclusive and `end` exclusive (see `ScrobbleLog.filter_by_date`).
+    """
+    if start is not None:
+        start = check_datetime(start, tz=tz, unit=unit).tz_convert(tz)
+    if end is not None:
+        end = check_datetime(end, tz=tz, unit=unit)
+        # Consider the full day's data if no time (or 00:00) is passed
+        if include_end and end.normalize() == end:
+            end = end + pd.Timedelta(days=1)
+        end = end.tz_convert(tz)
+    return start, end
 
 
 # ---------------------------------------------------------------------
@@ -156,6 +345,7 @@ class ScrobbleLog:
         username: str | None = None,
         tz: str | None = "Etc/UTC",
         source: str | None = "manual",
+        validation: Literal["full", "light", "trusted"] = "full",
     ) -> Self:
         """ Create ScrobbleLog object from data.
         
@@ -180,25 +370,80 @@ class ScrobbleLog:
         An updated meta is generated from the data if `update_meta` is True.
         If not, tries to use `username`, `tz`, and `source` values (if passed)
         to generate `meta`
+
+        validation: "full", "light", or "trusted"
+            How much of `df` is checked and normalised (see `validate_df`).
+            "full" (default) cleans arbitrary input. "light" only converts
+            columns that do not have the ScrobbleLog dtypes yet. "trusted"
+            takes `df` as already valid, e.g. from another ScrobbleLog.
          
         """
         try:
             meta = validate_meta(meta)
         except (SchemaError, InvalidTypeError, InvalidDataError) as e:
             if meta is not None:
-                print(f"Invalid meta passed: {e.error}."
+                print(f"Invalid meta passed: {e}. "
                       "Generating meta from username, tz, and source.")
-            self._df = validate_df(df, validate_tz(tz))
+            self._df = validate_df(df, validate_tz(tz), validation)
             self._meta = meta_generator(self._df, username, tz, source)
         else:
+            self._df = validate_df(df, meta['tz'], validation)
             if not update_meta:
                 self._meta = meta
             else:
-                self._df = validate_df(df, meta['tz'])
                 self._meta = meta_generator(self._df,
                                             meta['username'],
                                             meta['tz'],
                                             meta['source'])
+        self._invalidate_caches()
+
+    @classmethod
+    def _from_validated(cls, df: pd.DataFrame, meta: dict) -> Self:
+        """
+        Create a ScrobbleLog from a DataFrame and meta that are already
+        valid, without validating them again.
+        """
+        scrobble_log = cls.__new__(cls)
+        scrobble_log._df = df
+        scrobble_log._meta = meta
+        scrobble_log._invalidate_caches()
+        return scrobble_log
+
+    def _invalidate_caches(self) -> None:
+        """Drop all values derived from `df`"""
+        self._key_index = None
+        cache = getattr(self, "_cache", None)
+        if cache is None:
+            self._cache = LRUCache(DEFAULT_CACHE_SIZE)
+        else:
+            cache.clear()
+
+    def _cached(self, key: tuple, compute) -> pd.DataFrame | pd.Series:
+        """
+        Return a copy of the cached result of `compute()` for `key`, so
+        that callers cannot modify the cached value.
+        """
+        return self._cache.get_or_compute(key, compute).copy()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Statistics of the chart/aggregation result cache:
+        hits, misses, evictions, maxsize and currsize.
+        """
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Drop all cached chart/aggregation results"""
+        self._cache.clear()
+
+    @property
+    def cache_size(self) -> int:
+        """Maximum number of cached chart/aggregation results"""
+        return self._cache.maxsize
+
+    @cache_size.setter
+    def cache_size(self, value: int) -> None:
+        self._cache.resize(value)
 
     @property
     def df(self) -> pd.DataFrame:
@@ -207,6 +452,7 @@ class ScrobbleLog:
     @df.setter
     def df(self, value) -> pd.DataFrame:
         self._df = validate_df(value, self._meta['tz'])
+        self._invalidate_caches()
 
     @property
     def meta(self) -> dict:
@@ -215,6 +461,7 @@ class ScrobbleLog:
     @meta.setter
     def meta(self, value) -> dict:
         self._meta = validate_meta(value)
+        self._invalidate_caches()
         if len(self._df) != self._meta['num_scrobbles']:
             raise InvalidDataError(
                 "meta['num_scrobbles'] cannot be different from len(df)"
@@ -250,10 +497,12 @@ class ScrobbleLog:
             "To do so, use self.tz_convert."
         )
    
-    def copy(self):
-        return ScrobbleLog(df=self._df.copy(),
-                           meta=dict(self._meta),
-                           update_meta=False)
+    def copy(self) -> Self:
+        """Return a copy of the ScrobbleLog"""
+        return ScrobbleLog._from_validated(
+            self._df.copy(),
+            derive_meta(self._meta, self._df)
+        )
 
     # ------------------------------------------------------------------------
     # Rendering Methods
@@ -289,15 +538,13 @@ class ScrobbleLog:
         """Access scrobbles by index or slice
         """
         if isinstance(key, slice):
-            return ScrobbleLog(
-                df=self.df[key],
-                meta=self.meta,
-                source=self.meta['source']
-            )
+            df = self.df.iloc[key]
+            if key.step is not None and key.step < 0:
+                df = sort_by_timestamp(df)
+            return ScrobbleLog._from_validated(df,
+                                               derive_meta(self.meta, df))
         elif isinstance(key, int):
-            d = self.df.iloc[key].to_dict()
-            d["tz"] = self.tz
-            return Scrobble.from_dict(d)
+            return _scrobbles_from_df(self.df.iloc[[key]])[0]
         else:
             raise InvalidTypeError("Expecting int or slice as key")
 
@@ -315,19 +562,124 @@ class ScrobbleLog:
     # -----------------------------------------------------------------
     # Iteration
 
+    def _keys(self) -> pd.MultiIndex:
+        """
+        Return the hash index of unique scrobble keys, building it lazily.
+        """
+        if self._key_index is None:
+            self._key_index = _scrobble_keys(self.df).unique()
+        return self._key_index
+
+    def _item_keys(
+        self,
+        items: list[Scrobble] | ScrobbleLog
+    ) -> pd.MultiIndex:
+        """Build scrobble keys for a list of Scrobbles or a ScrobbleLog"""
+        if isinstance(items, ScrobbleLog):
+            return _scrobble_keys(items.df)
+        if not isinstance(items, list | tuple):
+            raise InvalidTypeError(
+                "Expecting list(Scrobble) or ScrobbleLog type value"
+            )
+        for item in items:
+            if not isinstance(item, Scrobble):
+                raise InvalidTypeError(
+                    "Expecting list(Scrobble) or ScrobbleLog type value"
+                )
+        df = pd.DataFrame([item.to_dict() for item in items],
+                          columns=["timestamp", "track", "artist", "album"])
+        if len(df):
+            df["timestamp"] = self._item_timestamps(df["timestamp"])
+        else:
+            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        return _scrobble_keys(df)
+
+    def _item_timestamps(self, timestamps: pd.Series) -> pd.Series:
+        """
+        Normalise the timestamps of Scrobbles to look up, as `validate_df`
+        does (integers are epoch milliseconds, naive values UTC). If some
+        cannot be parsed, the others are normalised one by one and the
+        unparsable ones become NaT, which matches no scrobble.
+        """
+        from memoryfm.io._normalise import normalise_timestamps
+        try:
+            return normalise_timestamps(timestamps, tz=self.tz, unit="ms")
+        except (InvalidDataError, TypeError):
+            pass
+        values = []
+        for timestamp in timestamps:
+            try:
+                values.append(normalise_timestamps(
+                    pd.Series([timestamp]), tz=self.tz, unit="ms"
+                ).iloc[0])
+            except (InvalidDataError, TypeError):
+                values.append(pd.NaT)
+        return pd.Series(pd.DatetimeIndex(values, tz=self.tz),
+                         index=timestamps.index)
+
     def __contains__(self, item: Scrobble) -> bool:
         """
         Define in operator value for item in ScrobbleLog
         """
         if isinstance(item, Scrobble):
-            return item.to_dict() in self.df.to_dict(orient="records")
+            # Keyed as by `contains_many`; an unparsable timestamp
+            # matches no scrobble
+            return self._item_keys([item])[0] in self._keys()
         return False
 
-    def __iter__(self):
+    def contains_many(
+        self,
+        items: list[Scrobble] | ScrobbleLog
+    ) -> np.ndarray:
+        """
+        Check membership of many scrobbles in one vectorized pass.
+
+        Returns a boolean array with one value per item in `items`
+        (a list of Scrobbles, or the rows of a ScrobbleLog). Items with
+        an unparsable timestamp are not contained.
+        """
+        return self._keys().get_indexer(self._item_keys(items)) >= 0
+
+    def isin(
+        self,
+        other: list[Scrobble] | ScrobbleLog
+    ) -> np.ndarray:
+        """
+        Return a boolean array marking which scrobbles of this
+        ScrobbleLog are present in `other`.
         """
+        if isinstance(other, ScrobbleLog):
+            return other.contains_many(self)
+        other_keys = self._item_keys(other).unique()
+        return other_keys.get_indexer(_scrobble_keys(self.df)) >= 0
+
+    def __iter__(self) -> ScrobbleLogIterator:
+        """
+        Iterate over the scrobbles in the ScrobbleLog.
         """
         return ScrobbleLogIterator(self)
 
+    def iter_batches(
+        self,
+        size: int = 10_000,
+        as_scrobbles: bool = False
+    ) -> Iterator[pd.DataFrame | list[Scrobble]]:
+        """
+        Iterate over the ScrobbleLog in batches of `size` scrobbles.
+
+        Yields DataFrame chunks of `df`, or lists of Scrobble objects if
+        `as_scrobbles` is True. The last batch may be shorter than `size`.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("'size' must be a positive integer")
+        df = self.df
+        for start in range(0, len(df), size):
+            batch = df.iloc[start:start + size]
+            if as_scrobbles:
+                yield _scrobbles_from_df(batch)
+            else:
+                yield batch
+
     # -----------------------------------------------------------------
     # IO Methods
 
@@ -349,7 +701,7 @@ class ScrobbleLog:
         if not len(self):
             scrobbles = self.df.to_dict(orient="list")
         else:
-            scrobbles = self.df.to_dict(orient=orient)
+            scrobbles = _decode_strings(self.df).to_dict(orient=orient)
         data = {
             "meta": self.meta,
             "scrobbles": scrobbles
@@ -381,30 +733,41 @@ class ScrobbleLog:
         max_length: int | None = None,
         datetimefmt: str = "%Y-%m-%d %H:%M",
         showindex: bool = False,
-        show_extra: bool = True
+        show_extra: bool = True,
+        chunksize: int | None = None
     ) -> str | None:
         """Write a nice looking ScrobbleLog in markdown using tabulate
+
+        If the log is longer than `max_length`, only its first and last
+        rows are formatted and rendered.
+
+        With `chunksize`, the full table is written to `file` in chunks
+        of `chunksize` rows instead of being built as one string
+        (only for the "github" and "pipe" formats, without
+        `maxcolwidths` and `showindex`). Logs with line breaks in their
+        values are rendered whole by tabulate.
         """
-        df_new = self.df.copy().sort_values(by=['timestamp'],
-                                            ascending = not newest_first)
-        df_new["timestamp"] = (
-                        df_new["timestamp"].dt.strftime(datetimefmt)
-        )
-        df_new = df_new.rename(str.capitalize, axis=1)
+        from tabulate import tabulate
+        # Rows are sorted by timestamp
+        rows = self.df.iloc[::-1] if newest_first else self.df
+        truncated = max_length is not None and len(self) > max_length
+        if chunksize is not None and len(self) and not truncated:
+            return self._stream_markdown(file, tablefmt, newest_first,
+                                         datetimefmt, show_extra,
+                                         chunksize, maxcolwidths,
+                                         showindex)
         if not len(self):
             df_table = "-----No scrobbles present-----"
-        elif (
-            max_length is None or
-            len(self) <= max_length
-        ):
-            df_table = tabulate(df_new, headers="keys",
+        elif not truncated:
+            df_table = tabulate(_markdown_frame(rows, datetimefmt),
+                             headers="keys",
                              tablefmt=tablefmt,
                              maxcolwidths=maxcolwidths,
                              showindex=showindex)
         else:
             total = len(self)
-            df1 = df_new.head()
-            df2 = df_new.tail()
+            df1 = _markdown_frame(rows.head(), datetimefmt)
+            df2 = _markdown_frame(rows.tail(), datetimefmt)
             dfsep = pd.DataFrame({"Timestamp":3*['...'],
                                   "Track":3*['...'],
                                   "Artist":3*['...'],
@@ -419,26 +782,91 @@ class ScrobbleLog:
         if not show_extra:
             markdown = df_table
         else:
-            markdown = (
-                f"ScrobbleLog for username: {self.username}  \n"
-                f"From {self.meta['date_range']['start']} to "
-                f"{self.meta['date_range'].get('end')}\n\n"
-                f"{df_table}"
-            )
+            markdown = self._markdown_extra() + df_table
             
         from memoryfm.io._writers import _write_string
         return _write_string(markdown, file)
 
+    def _markdown_extra(self) -> str:
+        return (
+            f"ScrobbleLog for username: {self.username}  \n"
+            f"From {self.meta['date_range']['start']} to "
+            f"{self.meta['date_range'].get('end')}\n\n"
+        )
+
+    def _stream_markdown(
+        self,
+        file: PathLike | IO[str] | None,
+        tablefmt: str | None,
+        newest_first: bool,
+        datetimefmt: str,
+        show_extra: bool,
+        chunksize: int,
+        maxcolwidths: list[int] | None,
+        showindex: bool
+    ) -> None:
+        """Write the full markdown table to `file` in row chunks"""
+        if file is None:
+            raise ValueError("'file' is required to stream markdown")
+        if maxcolwidths is not None or showindex:
+            raise ValueError("Streaming markdown does not support "
+                             "'maxcolwidths' or 'showindex'")
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError("'chunksize' must be a positive integer")
+        from memoryfm.io._writers import _text_width, _write_markdown_table
+        # Cell widths are needed before the first row is written
+        widths = [_timestamp_width(self.df["timestamp"], datetimefmt)]
+        multiline = "\n" in datetimefmt or "\r" in datetimefmt
+        for column in STRING_COLUMNS:
+            values = self.df[column].cat.remove_unused_categories()
+            strings = [str(value) for value in values.cat.categories]
+            multiline = multiline or any("\n" in string or "\r" in string
+                                         for string in strings)
+            widths.append(max((_text_width(string.strip())
+                               for string in strings), default=0))
+        if multiline:
+            # tabulate lays out cells with line breaks over several lines
+            # of the table, which the streamed rows do not
+            return self.to_markdown(file, tablefmt=tablefmt,
+                                    newest_first=newest_first,
+                                    datetimefmt=datetimefmt,
+                                    show_extra=show_extra)
+        rows = self.df.iloc[::-1] if newest_first else self.df
+        chunks = (_markdown_frame(rows.iloc[start:start + chunksize],
+                                  datetimefmt)
+                  for start in range(0, len(rows), chunksize))
+
+        from memoryfm.util._file_handler import _file_opener
+        file_like = _file_opener(file, "w")
+        try:
+            if show_extra:
+                file_like.write(self._markdown_extra())
+            _write_markdown_table(chunks, widths, file_like, tablefmt)
+        finally:
+            if file_like is not file:
+                file_like.close()
+
     @classmethod
     def from_json(
         cls, 
         file: PathLike | IO[str] | None = None,
+        epoch_unit: str | None = None
     ) -> ScrobbleLog:
         """
         Create ScrobbleLog from canonical JSON.
+
+        Pass `epoch_unit` to read epoch integer timestamps written by
+        `to_json(epoch_unit=...)`.
         """
         from memoryfm.io._loaders import load_json
         canonical_dict = load_json(file)
+        if epoch_unit is not None and "scrobbles" in canonical_dict:
+            _check_epoch_unit(epoch_unit)
+            df = pd.DataFrame(canonical_dict["scrobbles"])
+            if "timestamp" in df.columns:
+                df["timestamp"] = pd.to_datetime(df["timestamp"],
+                                                 unit=epoch_unit, utc=True)
+            canonical_dict = {**canonical_dict, "scrobbles": df}
         return ScrobbleLog.from_dict(canonical_dict)
 
     def to_json(
@@ -446,15 +874,84 @@ class ScrobbleLog:
         file: PathLike | IO[str] | None = None,
         orient: str | None = "records",
         datetimefmt: str | None = "%Y-%m-%dT%H:%M:%S%z",
+        epoch_unit: str | None = None,
+        chunksize: int = 100_000
     ) -> str | None:
         """
         Write ScrobbleLog to canonical JSON format.
+
+        With the default "records" orient, the scrobbles are encoded and
+        written `chunksize` rows at a time, so memory use does not grow
+        with the size of the log. Pass `epoch_unit` ("s", "ms", "us" or
+        "ns") to write timestamps as epoch integers instead of
+        `datetimefmt` strings.
         """
+        if epoch_unit is not None:
+            _check_epoch_unit(epoch_unit)
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError("'chunksize' must be a positive integer")
+        if orient != "records" or not len(self):
+            return self._dump_json(file, orient, datetimefmt, epoch_unit)
+
+        import json
+        # Every distinct string is JSON-encoded once, rows pick theirs
+        # by dictionary code (the appended "null" for code -1)
+        encoded = {
+            column: np.array([json.dumps(value) for value in
+                              self.df[column].cat.categories] + ["null"],
+                             dtype=object)
+            for column in STRING_COLUMNS
+        }
+
+        def chunks():
+            for start in range(0, len(self), chunksize):
+                rows = self.df.iloc[start:start + chunksize]
+                timestamps = rows["timestamp"]
+                if epoch_unit is not None:
+                    values = _epoch_values(timestamps, epoch_unit)
+                    chunk = [[str(value) for value in values.tolist()]]
+                else:
+                    formatted = _format_timestamps(timestamps, datetimefmt)
+                    chunk = [[json.dumps(value) for value in formatted]]
+                for column in STRING_COLUMNS:
+                    codes = rows[column].cat.codes.to_numpy()
+                    chunk.append(encoded[column][codes].tolist())
+                yield chunk
+
+        from memoryfm.io._writers import _write_json_log
+        from memoryfm.util._file_handler import _file_opener
+        columns = ["timestamp", *STRING_COLUMNS]
+        if file is None:
+            import io
+            buffer = io.StringIO()
+            _write_json_log(self.meta, columns, chunks(), buffer)
+            return buffer.getvalue()
+        file_like = _file_opener(file, "w")
+        try:
+            _write_json_log(self.meta, columns, chunks(), file_like)
+        finally:
+            if file_like is not file:
+                file_like.close()
+        return None
+
+    def _dump_json(
+        self,
+        file: PathLike | IO[str] | None,
+        orient: str | None,
+        datetimefmt: str | None,
+        epoch_unit: str | None
+    ) -> str | None:
+        """Build the whole JSON document at once, for any `orient`"""
         if not len(self):
             scrobbles = self.df.to_dict(orient="list")
         else:
-            df_new = self.df.copy()
-            df_new["timestamp"] = df_new["timestamp"].dt.strftime(datetimefmt)
+            df_new = _decode_strings(self.df)
+            if epoch_unit is not None:
+                df_new["timestamp"] = _epoch_values(df_new["timestamp"],
+                                                    epoch_unit)
+            else:
+                df_new["timestamp"] = _format_timestamps(df_new["timestamp"],
+                                                         datetimefmt)
             scrobbles = df_new.to_dict(orient=orient)
         data = {
             "meta": self.meta,
@@ -465,41 +962,213 @@ class ScrobbleLog:
         from memoryfm.io._writers import _write_string
         return _write_string(json_data, file)
 
-    def to_csv( 
+    @classmethod
+    def from_yaml(
+        cls,
+        file: PathLike | IO[str],
+        epoch_unit: str | None = None
+    ) -> ScrobbleLog:
+        """
+        Create ScrobbleLog from a YAML export (see `to_yaml`), loading
+        one document at a time.
+
+        Pass `epoch_unit` to read epoch integer timestamps written by
+        `to_yaml(epoch_unit=...)`.
+        """
+        from memoryfm.export.to_yaml import load_yaml
+        data = load_yaml(file)
+        df = data["scrobbles"]
+        if epoch_unit is not None:
+            _check_epoch_unit(epoch_unit)
+            df["timestamp"] = pd.to_datetime(df["timestamp"],
+                                             unit=epoch_unit, utc=True)
+        return ScrobbleLog.from_dict(data)
+
+    def to_yaml(
         self,
         file: PathLike | IO[str] | None = None,
-        orient: str | None = "records"
+        datetimefmt: str = "%Y-%m-%dT%H:%M:%S%z",
+        epoch_unit: str | None = None,
+        chunksize: int = 10_000
     ) -> str | None:
         """
-        Write ScrobbleLog to CSV format.
+        Write ScrobbleLog to YAML: a document holding `meta`, followed by
+        one document per `chunksize` scrobbles.
+
+        Timestamps are formatted with `datetimefmt`, or written as epoch
+        integers in `epoch_unit` ("s", "ms", "us" or "ns").
+        """
+        if epoch_unit is not None:
+            _check_epoch_unit(epoch_unit)
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError("'chunksize' must be a positive integer")
+
+        def chunks():
+            for start in range(0, len(self), chunksize):
+                rows = _decode_strings(self.df.iloc[start:start + chunksize])
+                if epoch_unit is not None:
+                    rows["timestamp"] = _epoch_values(rows["timestamp"],
+                                                      epoch_unit)
+                else:
+                    rows["timestamp"] = _format_timestamps(
+                        rows["timestamp"], datetimefmt)
+                yield rows
+
+        from memoryfm.export.to_yaml import dump_yaml
+        from memoryfm.util._file_handler import _file_opener
+        if file is None:
+            import io
+            buffer = io.StringIO()
+            dump_yaml(self.meta, chunks(), buffer)
+            return buffer.getvalue()
+        file_like = _file_opener(file, "w")
+        try:
+            dump_yaml(self.meta, chunks(), file_like)
+        finally:
+            if file_like is not file:
+                file_like.close()
+        return None
+
+    def save(self, file: PathLike) -> None:
+        """
+        Save ScrobbleLog in the native binary columnar format.
+
+        Timestamps are stored as int64 epoch values and string columns
+        as dictionary codes, with `meta` in the file header.
+        Use `ScrobbleLog.open` to load the file again.
+        """
+        from memoryfm.io._binary import write_binary
+        write_binary(self.df, self.meta, file)
+
+    @classmethod
+    def open(cls, file: PathLike, mmap: bool = True) -> Self:
+        """
+        Load a ScrobbleLog saved with `ScrobbleLog.save`.
+
+        The column arrays are memory mapped (unless `mmap` is False) and
+        the data is not validated again, so reopening a large log only
+        costs decoding the header and string dictionaries.
+        """
+        from memoryfm.io._binary import read_binary
+        df, meta = read_binary(file, mmap=mmap)
+        return cls._from_validated(df, meta)
+
+    def to_csv(
+        self,
+        file: PathLike | IO[str] | None = None,
+        layout: str = "plain",
+        datetimefmt: str = "%Y-%m-%dT%H:%M:%S%z",
+        epoch_unit: str | None = None,
+        chunksize: int = 100_000,
+        *,
+        orient: str | None = None
+    ) -> str | None:
+        """
+        Write ScrobbleLog to CSV format, `chunksize` rows at a time.
+
+        layout:
+            "plain": comma-separated columns timestamp, track, artist
+                and album, with timestamps formatted with `datetimefmt`
+                (or as epoch integers in `epoch_unit`).
+            "lastfmstats": the ';'-delimited lastfmstats export, with
+                the 'Date#{username}' column in epoch milliseconds, that
+                `from_lastfmstats` reads back. AlbumId is left empty.
+
+        `orient` (also accepted in place of `layout`) is deprecated and
+        ignored: the "plain" layout is written.
         """
-        data = self.to_dict(orient=orient)
-        from memoryfm.io._writers import _dict_to_csv
-        return _dict_to_csv(data, file)
+        if orient is not None or layout in DICT_ORIENTS:
+            import warnings
+            warnings.warn("The 'orient' argument of ScrobbleLog.to_csv is "
+                          "deprecated and ignored; use 'layout'",
+                          DeprecationWarning, stacklevel=2)
+            layout = "plain"
+        if layout not in CSV_LAYOUTS:
+            raise ValueError(f"'layout' must be one of {CSV_LAYOUTS}")
+        if epoch_unit is not None:
+            _check_epoch_unit(epoch_unit)
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError("'chunksize' must be a positive integer")
+        import csv
+        if layout == "lastfmstats":
+            if self.username is None:
+                raise ValueError("A username is required for the "
+                                 "lastfmstats CSV layout")
+            header = ["Artist", "Album", "AlbumId", "Track",
+                      f"Date#{self.username}"]
+            sep, quoting = ";", csv.QUOTE_ALL
+        else:
+            header = ["timestamp", *STRING_COLUMNS]
+            sep, quoting = ",", csv.QUOTE_MINIMAL
+
+        def chunks():
+            for start in range(0, len(self), chunksize):
+                rows = self.df.iloc[start:start + chunksize]
+                if layout == "lastfmstats":
+                    yield pd.DataFrame({
+                        "Artist": rows["artist"],
+                        "Album": rows["album"],
+                        "AlbumId": None,
+                        "Track": rows["track"],
+                        "Date": _epoch_values(rows["timestamp"], "ms"),
+                    })
+                    continue
+                rows = rows.copy()
+                if epoch_unit is not None:
+                    rows["timestamp"] = _epoch_values(rows["timestamp"],
+                                                      epoch_unit)
+                else:
+                    rows["timestamp"] = _format_timestamps(
+                        rows["timestamp"], datetimefmt)
+                yield rows
+
+        from memoryfm.io._writers import _write_csv_chunks
+        from memoryfm.util._file_handler import _file_opener
+        if file is None:
+            import io
+            buffer = io.StringIO()
+            _write_csv_chunks(chunks(), header, buffer, sep, quoting)
+            return buffer.getvalue()
+        file_like = _file_opener(file, "w")
+        try:
+            _write_csv_chunks(chunks(), header, file_like, sep, quoting)
+        finally:
+            if file_like is not file:
+                file_like.close()
+        return None
 
     # -----------------------------------------------------------------
     # Transform Methods
 
-    def append(
+    def _rows_frame(
         self,
         scrobbles: Scrobble | list(Scrobble | dict) | ScrobbleLog
-    ) -> Self:
+    ) -> tuple[pd.DataFrame, bool]:
+        """
+        Return a DataFrame of new scrobbles to append, and whether it
+        is already valid (rows of a ScrobbleLog).
+        """
         if isinstance(scrobbles, Scrobble):
-            df_2 = scrobbles.to_dataframe()
+            return scrobbles.to_dataframe(), False
         elif (
             isinstance(scrobbles, list)
         ):
-            scrobbles_data = [dict(scrobble) for scrobble in scrobbles]
-            df_2 = pd.DataFrame(scrobbles_data)
+            scrobbles_data = [
+                scrobble.to_dict() if isinstance(scrobble, Scrobble)
+                else dict(scrobble)
+                for scrobble in scrobbles
+            ]
+            return pd.DataFrame(scrobbles_data), False
         elif isinstance(scrobbles, ScrobbleLog):
             if (
                 scrobbles.username == self.username and
                 scrobbles.tz == self.tz
             ):
-                df_2 = scrobbles.df.copy()
+                return scrobbles.df, True
             elif scrobbles.tz != self.tz:
                 df_2 = scrobbles.df.copy()
                 df_2['timestamp'] = df_2['timestamp'].dt.tz_convert(self.tz)
+                return df_2, True
             else:
                 raise InvalidDataError("The usernames don't match")
         else:
@@ -507,23 +1176,148 @@ class ScrobbleLog:
                 "Expecting scrobbles value of type: "
                 "Scrobble, list(Scrobble) list(dict) or ScrobbleLog"
             )
-        self.df = pd.concat([self.df, df_2],
-                            ignore_index=True)
-        validate_df(self.df, self.tz)
-        self.meta = meta_generator(self.df, self.username, self.tz)
+
+    def _validate_batches(
+        self,
+        batches: list[pd.DataFrame]
+    ) -> list[pd.DataFrame]:
+        """
+        Validate consecutive batches of new scrobbles.
+
+        Batches are validated together in one pass, unless their columns
+        or timestamp types differ.
+        """
+        required = {"timestamp", "track", "artist"}
+        if (
+            len(batches) > 1 and
+            all(required <= set(df_2.columns) for df_2 in batches)
+        ):
+            df_2 = pd.concat(batches, ignore_index=True)
+            if df_2["timestamp"].dtype != object:
+                batches = [df_2]
+        return [validate_df(df_2, self.tz) for df_2 in batches]
+
+    def append(
+        self,
+        scrobbles: Scrobble | list(Scrobble | dict) | ScrobbleLog
+    ) -> Self:
+        """
+        Append scrobbles to the ScrobbleLog in place.
+
+        Only the new scrobbles are validated, and `meta` is updated from
+        the new scrobbles alone.
+        """
+        return self.append_many([scrobbles])
+
+    def append_many(
+        self,
+        batches: Iterable[Scrobble | list(Scrobble | dict) | ScrobbleLog]
+    ) -> Self:
+        """
+        Append many batches of scrobbles to the ScrobbleLog in place.
+
+        The new scrobbles of all batches are validated together and
+        added to `df` with a single concatenation, so the cost of
+        copying `df` is paid once instead of once per batch.
+        """
+        df_new = self._new_rows(batches)
+        if df_new is not None:
+            self._extend(df_new)
         return self
 
+    def _new_rows(
+        self,
+        batches: Iterable[Scrobble | list(Scrobble | dict) | ScrobbleLog]
+    ) -> pd.DataFrame | None:
+        """
+        Validate batches of new scrobbles into one DataFrame sorted by
+        timestamp, or None if there are no new scrobbles.
+        """
+        frames = []
+        unvalidated = []
+        for batch in batches:
+            df_2, valid = self._rows_frame(batch)
+            if not valid:
+                if len(df_2.columns):    # Skip empty lists
+                    unvalidated.append(df_2)
+                continue
+            frames.extend(self._validate_batches(unvalidated))
+            unvalidated = []
+            frames.append(df_2)
+        frames.extend(self._validate_batches(unvalidated))
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return None
+        return sort_by_timestamp(concat_validated(frames))
+
+    def _extend(self, df_new: pd.DataFrame) -> None:
+        """Add validated, sorted new rows to `df` and update `meta`"""
+        df = concat_validated([self._df, df_new])
+        if (
+            len(self._df) and
+            df_new["timestamp"].iloc[0] < self._df["timestamp"].iloc[-1]
+        ):
+            df = sort_by_timestamp(df)
+        self._df = df
+        self._meta = update_meta(self._meta, df_new)
+        self._invalidate_caches()
+
+    def upsert(
+        self,
+        scrobbles: Scrobble | list(Scrobble | dict) | ScrobbleLog,
+        match_album: bool = True
+    ) -> MergeStats:
+        """
+        Add the scrobbles that are not in the ScrobbleLog yet, in place.
+
+        A scrobble is skipped if a scrobble with the same timestamp,
+        track, artist and (with `match_album`) album is already present,
+        or occurs earlier in `scrobbles`. Use it to combine overlapping
+        exports.
+
+        Returns the numbers of added and skipped scrobbles.
+        """
+        df_new = self._new_rows([scrobbles])
+        if df_new is None:
+            return MergeStats(0, 0)
+        duplicated = duplicate_mask(self._df, df_new, match_album)
+        added = len(df_new) - int(duplicated.sum())
+        if added:
+            self._extend(df_new[~duplicated].reset_index(drop=True))
+        return MergeStats(added, len(df_new) - added)
+
+    def merge(
+        self,
+        other: Scrobble | list(Scrobble | dict) | ScrobbleLog,
+        match_album: bool = True
+    ) -> tuple[Self, MergeStats]:
+        """
+        Return a new ScrobbleLog combining this one and `other` without
+        duplicates (see `upsert`), and the numbers of added and skipped
+        scrobbles.
+        """
+        merged = self.copy()
+        stats = merged.upsert(other, match_album)
+        return merged, stats
+
     def tz_convert(self, tz: str | None, inplace=True) -> Self:
+        """
+        Convert timestamps to timezone `tz` and update meta['tz'].
+
+        If `inplace` is False, the ScrobbleLog is left unchanged and a
+        converted copy is returned.
+        """
+        tz = validate_tz(tz)
+        df = self._df.assign(
+            timestamp=self._df['timestamp'].dt.tz_convert(tz)
+        )
+        meta = dict(self._meta, tz=tz)
         if not inplace:
-            df = self._df.copy()
-            df['timestamp'] = df['timestamp'].dt.tz_convert(tz)
-            meta = self._meta
-            meta['tz'] = tz
-            return ScrobbleLog(df, dict(self._meta))
-        else:
-            self._meta['tz'] = tz
-            self._df = self._df['timestamps'].tz_convert(tz)
-            return self
+            return ScrobbleLog._from_validated(df, meta)
+        self._df = df
+        self._meta = meta
+        self._invalidate_caches()
+        return self
 
     # ------------------------------------------------------------------------
     # Filtering Methods
@@ -533,14 +1327,16 @@ class ScrobbleLog:
         """
         if n is None:
             n = 5
-        return ScrobbleLog(self.df.head(n), meta=self.meta)
+        df = self.df.head(n)
+        return ScrobbleLog._from_validated(df, derive_meta(self.meta, df))
 
     def tail(self, n: int | None = None) -> Self:
-        """ Return ScrobbleLog for the first n scrobbles 
+        """ Return ScrobbleLog for the last n scrobbles 
         """
         if n is None:
             n = 5
-        return ScrobbleLog(self.df.tail(n), meta=self.meta)
+        df = self.df.tail(n)
+        return ScrobbleLog._from_validated(df, derive_meta(self.meta, df))
 
     def filter_by_date(
         self,
@@ -551,25 +1347,45 @@ class ScrobbleLog:
     ) -> Self:
         """
         Filter ScrobbleLog by date.
+
+        Scrobbles from `start` (inclusive) to `end` (exclusive) are
+        selected with a binary search on the sorted timestamps, and the
+        result is built without validating the rows again.
+        If `include_end` is True and `end` has no time (or 00:00), the
+        whole day of `end` is included.
+        """
+        first, last = self._date_bounds(start, end, unit, include_end)
+        date_filtered_df = self.df.iloc[first:last]
+        return ScrobbleLog._from_validated(
+            date_filtered_df,
+            derive_meta(self.meta, date_filtered_df, source="filter")
+        )
+
+    def _date_bounds(
+        self,
+        start: str | pd.Timestamp | datetime.datetime | None = None,
+        end: str | pd.Timestamp | datetime.datetime | None = None,
+        unit : str | None = None,
+        include_end: bool = True
+    ) -> tuple[int, int]:
+        """
+        Positions of the first and past-the-last rows of a date window
+        (see `filter_by_date`).
         """
-        if start is None:
-            start = self.df["timestamp"].min()
-        if end is None:
-            end = self.df["timestamp"].max()
-        start = check_datetime(start, tz=self.tz, unit=unit)
-        end = check_datetime(end, tz=self.tz, unit=unit)
-        # Consider the full day's data if no time (or 00:00) is passed
-        if include_end and end.normalize() == end:  
-            end = end + pd.Timedelta(days=1)
         if 'timestamp' not in self.df.columns:
             raise SchemaError("Expected column 'timestamp' missing",
                                      'timestamp')
-        filter_start = self.df['timestamp'] >= start
-        filter_end = self.df['timestamp'] < end
-        filter_condition = filter_start & filter_end
-        date_filtered_df = self.df[filter_condition]
-        return ScrobbleLog(df=date_filtered_df, username=self.username,
-                           tz=self.tz, source="filter")
+        timestamps = self.df["timestamp"]
+        start, end = _date_window(start, end, self.tz, unit, include_end)
+        if start is None or not len(self):
+            first = 0
+        else:
+            first = timestamps.searchsorted(start, side="left")
+        if end is None or not len(self):
+            last = len(self)
+        else:
+            last = timestamps.searchsorted(end, side="left")
+        return int(first), int(max(first, last))
 
     # -----------------------------------------------------------------
     # Charts Methods
@@ -577,10 +1393,16 @@ class ScrobbleLog:
     def top_charts(
         self: ScrobbleLog,
         kind: str = "track",
-        n: int = 5
+        n: int = 5,
+        start: str | pd.Timestamp | datetime.datetime | None = None,
+        end: str | pd.Timestamp | datetime.datetime | None = None
     ) -> pd.Series:
         """
         Get top n tracks/artists/albums by number of scrobbles.
+
+        `start` and `end` restrict the charts to a date window, as in
+        `filter_by_date`. Ties are ordered by name. Results are cached
+        (see `cache_info`).
         """        
         names_dict = {
             "track": "Track",
@@ -601,8 +1423,145 @@ class ScrobbleLog:
             )
         if not isinstance(n, int) or n < 0:
             raise ValueError("'n' must be a non-negative integer")
-        df_new = self.df.copy()
-        count_series = df_new[kind].value_counts()
-        count_series.index.name = names_dict.get(kind)
-        count_series.name = "Scrobbles"
-        return count_series.head(n)
+        first, last = self._date_bounds(start, end)
+
+        def compute() -> pd.Series:
+            column = self.df[kind].iloc[first:last]
+            # Counts in category (sorted) order, so that the stable sort
+            # orders ties by name
+            count_series = column.value_counts(sort=False)
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Unused categories are counted as 0
+                count_series = count_series[count_series > 0]
+                count_series.index = count_series.index.astype(
+                    column.cat.categories.dtype
+                )
+            count_series = count_series.sort_values(ascending=False,
+                                                    kind="stable")
+            count_series.index.name = names_dict.get(kind)
+            count_series.name = "Scrobbles"
+            return count_series.head(n)
+
+        return self._cached(("top_charts", kind, n, first, last), compute)
+
+    def aggregate(
+        self: ScrobbleLog,
+        by: str | list[str] = ("artist", "album"),
+        freq: str | None = None,
+        n: int | None = None,
+        within: str | list[str] | None = None,
+        start: str | pd.Timestamp | datetime.datetime | None = None,
+        end: str | pd.Timestamp | datetime.datetime | None = None
+    ) -> pd.DataFrame:
+        """
+        Count scrobbles by one or more of 'track', 'artist', 'album'.
+
+        Composite keys keep e.g. two albums called "Greatest Hits" by
+        different artists apart. With `freq` ('day', 'week', 'month' or
+        'year'), counts are per period of local time; with `n`, only the
+        top `n` keys of each period (and of each `within` group, e.g.
+        within='artist' for each artist's top albums) are kept.
+
+        Returns a tidy DataFrame with columns
+        ['period'] (if `freq`) + `by` + ['scrobbles', 'rank'].
+        `start` and `end` restrict the counts to a date window, as in
+        `filter_by_date`. Results are cached (see `cache_info`).
+
+        Example
+        -------
+        >>> log.aggregate(by=["artist", "album"], freq="year", n=10)
+        """
+        by, freq, n, within = validate_aggregate_args(by, freq, n, within)
+        first, last = self._date_bounds(start, end)
+        key = ("aggregate", tuple(by), freq, n, tuple(within), first, last)
+        return self._cached(key, lambda: aggregate(
+            self._df.iloc[first:last], by, freq=freq, n=n, within=within
+        ))
+
+    def periodic_charts(
+        self: ScrobbleLog,
+        freq: str = "month",
+        kinds: str | list[str] = ("artist", "album", "track"),
+        n: int | None = 10
+    ) -> pd.DataFrame:
+        """
+        Top `n` artists/albums/tracks for every day/week/month/year of
+        the log, in one pass.
+
+        Returns a tidy DataFrame with columns
+        ['period', 'chart', 'rank', 'artist', 'album', 'track', 'scrobbles'].
+        Album and track charts are keyed by artist too. Render it with
+        `memoryfm.charts.top_charts.periodic_charts_markdown`.
+        """
+        if not isinstance(kinds, str):
+            kinds = tuple(kinds)
+        key = ("periodic_charts", freq, kinds, n)
+        return self._cached(key, lambda: periodic_charts(
+            self._df, freq=freq, kinds=kinds, n=n
+        ))
+
+    # -----------------------------------------------------------------
+    # Sessions
+
+    def session_ids(
+        self,
+        gap: str | pd.Timedelta | datetime.timedelta = DEFAULT_GAP
+    ) -> pd.Series:
+        """
+        Listening session id of every scrobble, numbered from 0: a new
+        session starts after a pause longer than `gap`.
+        """
+        from memoryfm.core._sessions import session_ids, validate_gap
+        ids = session_ids(self.df["timestamp"], validate_gap(gap))
+        return pd.Series(ids, index=self.df.index, name="session")
+
+    def sessions(
+        self,
+        gap: str | pd.Timedelta | datetime.timedelta = DEFAULT_GAP,
+        min_scrobbles: int = 1
+    ) -> pd.DataFrame:
+        """
+        Split the log into listening sessions, separated by pauses
+        longer than `gap` (default 30 minutes).
+
+        Returns a DataFrame with one row per session and columns
+        ['session', 'start', 'end', 'duration', 'scrobbles', 'artist',
+        'album'], where 'artist' and 'album' are the most played ones
+        of the session. Sessions with fewer than `min_scrobbles`
+        scrobbles are left out. Results are cached (see `cache_info`).
+
+        Example
+        -------
+        >>> log.sessions("1h").nlargest(5, "duration")
+        """
+        from memoryfm.core._sessions import sessions, validate_gap
+        gap = validate_gap(gap)
+        if not isinstance(min_scrobbles, int) or min_scrobbles < 1:
+            raise ValueError("'min_scrobbles' must be a positive integer")
+        key = ("sessions", gap.value, min_scrobbles)
+        return self._cached(key, lambda: sessions(self._df, gap,
+                                                  min_scrobbles))
+
+    # -----------------------------------------------------------------
+    # Calendar
+
+    def calendar(self) -> Calendar:
+        """
+        Dense scrobble counts per local day, hour of day and weekday, in
+        the log's tz, e.g. for a calendar heatmap.
+
+        The Calendar (read-only arrays) is cached until the log changes;
+        see `Calendar.streaks` and `Calendar.longest_streak` for runs of
+        consecutive listening days.
+
+        Example
+        -------
+        >>> cal = log.calendar()
+        >>> cal.daily_series().resample("W").sum()
+        >>> cal.longest_streak()
+        """
+        from memoryfm.core._calendar import calendar
+        # Calendars are immutable, so the cached one is returned as is
+        return self._cache.get_or_compute(
+            ("calendar",), lambda: calendar(self._df["timestamp"])
+        )
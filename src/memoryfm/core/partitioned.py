@@ -0,0 +1,434 @@
+"""Module: memoryfm.core.partitioned
+Out-of-core ScrobbleLog, split into monthly or yearly partitions on disk.
+
+Layout of a partitioned log directory
+-------------------------------------
+manifest.json : meta of the whole log, the partition frequency, and one
+                entry per partition with its key, file, number of
+                scrobbles and first and last timestamps
+<key>.mfm     : one binary ScrobbleLog (see `ScrobbleLog.save`) per
+                partition, e.g. 2024-01.mfm (month) or 2024.mfm (year)
+
+A partition holds the scrobbles of one month or year of local time.
+Opening a partitioned log only reads the manifest. Queries open (memory
+map) only the partitions their date window touches, one at a time, and
+charts are counted per partition before the counts are merged, so
+memory use does not grow with the length of the history.
+"""
+
+from __future__ import annotations
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import TYPE_CHECKING
+
+from memoryfm.errors import InvalidDataError, ParseError
+from memoryfm.charts._aggregate import (
+    FREQUENCIES,
+    count,
+    merge_counts,
+    validate_aggregate_args,
+)
+from memoryfm.core._merge import MergeStats
+from memoryfm.core._validation import (
+    validate_df,
+    validate_meta,
+    meta_generator,
+    derive_meta,
+    concat_validated,
+)
+from memoryfm.core.objects import ScrobbleLog, _date_window
+
+if TYPE_CHECKING:
+    import datetime
+    from typing import Iterator, Self
+    from memoryfm._typing import PathLike
+    from memoryfm.core.objects import Scrobble
+
+MANIFEST = "manifest.json"
+FORMAT = "memory.fm partitioned ScrobbleLog"
+FORMAT_VERSION = 1
+PARTITION_FREQUENCIES = ["month", "year"]
+
+
+def _partition_slices(
+    df: pd.DataFrame,
+    freq: str
+) -> list[tuple[str, int, int]]:
+    """
+    Split the rows of a sorted ScrobbleLog DataFrame into runs of the
+    same local month or year: (key, start row, stop row) per run.
+    """
+    if not len(df):
+        return []
+    local = df["timestamp"].dt.tz_localize(None)
+    codes = local.dt.year.to_numpy(np.int64)
+    if freq == "month":
+        codes = codes * 12 + local.dt.month.to_numpy(np.int64)
+    bounds = np.concatenate(
+        [[0], np.flatnonzero(np.diff(codes)) + 1, [len(df)]]
+    )
+    return [
+        (str(pd.Period(local.iloc[start], FREQUENCIES[freq])),
+         int(start), int(stop))
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+class PartitionedScrobbleLog:
+    """
+    Class representing a scrobble log stored as partitions on disk
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        """
+        Open the partitioned ScrobbleLog in directory `path`.
+
+        Create one with `PartitionedScrobbleLog.create` or
+        `PartitionedScrobbleLog.from_scrobble_log`.
+        """
+        self._path = os.fspath(path)
+        manifest_file = os.path.join(self._path, MANIFEST)
+        try:
+            with open(manifest_file, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ParseError(manifest_file, e) from e
+        if manifest.get("format") != FORMAT:
+            raise ParseError(manifest_file,
+                             "Not a memory.fm partitioned ScrobbleLog")
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ParseError(
+                manifest_file,
+                f"Unsupported format version: {manifest.get('format_version')}"
+            )
+        self._meta = validate_meta(manifest["meta"])
+        self._freq = manifest["freq"]
+        self._partitions = manifest["partitions"]
+
+    @classmethod
+    def create(
+        cls,
+        path: PathLike,
+        username: str | None = None,
+        tz: str | None = "Etc/UTC",
+        source: str | None = "manual",
+        freq: str = "month"
+    ) -> Self:
+        """
+        Create an empty partitioned ScrobbleLog in directory `path`,
+        with `freq` ('month' or 'year') partitions.
+        """
+        if freq not in PARTITION_FREQUENCIES:
+            raise ValueError(f"'freq' must be one of: {PARTITION_FREQUENCIES}")
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(os.path.join(path, MANIFEST)):
+            raise InvalidDataError(
+                f"A partitioned ScrobbleLog already exists in '{path}'"
+            )
+        df = validate_df(
+            pd.DataFrame(columns=["timestamp", "track", "artist", "album"]),
+            tz
+        )
+        meta = meta_generator(df, username, tz, source)
+        _write_manifest(path, meta, freq, [])
+        return cls(path)
+
+    @classmethod
+    def from_scrobble_log(
+        cls,
+        scrobble_log: ScrobbleLog,
+        path: PathLike,
+        freq: str = "month"
+    ) -> Self:
+        """
+        Write `scrobble_log` as a partitioned ScrobbleLog in `path`.
+        """
+        meta = scrobble_log.meta
+        partitioned = cls.create(path, meta["username"], meta["tz"],
+                                 meta["source"], freq)
+        partitioned.append(scrobble_log, drop_duplicates=False)
+        return partitioned
+
+    # -----------------------------------------------------------------
+    # Properties
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def meta(self) -> dict:
+        return self._meta
+
+    @property
+    def username(self) -> str | None:
+        return self._meta["username"]
+
+    @property
+    def tz(self) -> str:
+        return self._meta["tz"]
+
+    @property
+    def freq(self) -> str:
+        return self._freq
+
+    @property
+    def partitions(self) -> list[str]:
+        """Keys of the partitions, in date order"""
+        return [entry["key"] for entry in self._partitions]
+
+    def __len__(self) -> int:
+        return self._meta["num_scrobbles"]
+
+    def __bool__(self) -> bool:
+        return bool(len(self))
+
+    def __repr__(self) -> str:
+        return (f"PartitionedScrobbleLog('{self._path}', "
+                f"username={self.username!r}, freq={self._freq!r}, "
+                f"partitions={len(self._partitions)}, "
+                f"num_scrobbles={len(self)})")
+
+    # -----------------------------------------------------------------
+    # Partitions
+
+    def load_partition(self, key: str, mmap: bool = True) -> ScrobbleLog:
+        """Load one partition as a ScrobbleLog"""
+        for entry in self._partitions:
+            if entry["key"] == key:
+                file = os.path.join(self._path, entry["file"])
+                return ScrobbleLog.open(file, mmap=mmap)
+        raise KeyError(f"Partition not found: {key}")
+
+    def iter_partitions(
+        self,
+        start: str | pd.Timestamp | datetime.datetime | None = None,
+        end: str | pd.Timestamp | datetime.datetime | None = None,
+        unit: str | None = None,
+        include_end: bool = True,
+        reverse: bool = False
+    ) -> Iterator[ScrobbleLog]:
+        """
+        Iterate over the partitions touching a date window (see
+        `ScrobbleLog.filter_by_date`), cut to the window.
+
+        Partitions entirely outside the window are not opened.
+        """
+        start, end = _date_window(start, end, self.tz, unit, include_end)
+        entries = [
+            entry for entry in self._partitions
+            if (start is None or pd.Timestamp(entry["end"]) >= start)
+            and (end is None or pd.Timestamp(entry["start"]) < end)
+        ]
+        if reverse:
+            entries.reverse()
+        for entry in entries:
+            partition = self.load_partition(entry["key"])
+            if (
+                (start is not None and pd.Timestamp(entry["start"]) < start)
+                or (end is not None and pd.Timestamp(entry["end"]) >= end)
+            ):
+                partition = partition.filter_by_date(start, end,
+                                                     include_end=False)
+            yield partition
+
+    def _concat(self, logs: list[ScrobbleLog], source: str) -> ScrobbleLog:
+        """Build one ScrobbleLog from sorted, disjoint partition logs"""
+        frames = [scrobble_log.df for scrobble_log in logs
+                  if len(scrobble_log)]
+        if frames:
+            df = concat_validated(frames)
+        else:
+            df = validate_df(
+                pd.DataFrame(columns=["timestamp", "track", "artist",
+                                      "album"]),
+                self.tz
+            )
+        return ScrobbleLog._from_validated(
+            df, derive_meta(self._meta, df, source=source)
+        )
+
+    # -----------------------------------------------------------------
+    # Filtering Methods
+
+    def filter_by_date(
+        self,
+        start: str | pd.Timestamp | datetime.datetime | None = None,
+        end: str | pd.Timestamp | datetime.datetime | None = None,
+        unit: str | None = None,
+        include_end: bool = True
+    ) -> ScrobbleLog:
+        """
+        Load the scrobbles of a date window into an in-memory
+        ScrobbleLog, reading only the partitions the window touches.
+        """
+        return self._concat(
+            list(self.iter_partitions(start, end, unit, include_end)),
+            source="filter"
+        )
+
+    def to_scrobble_log(self) -> ScrobbleLog:
+        """Load the whole partitioned log into memory"""
+        return self._concat(list(self.iter_partitions()),
+                            source=self._meta["source"])
+
+    def head(self, n: int | None = None) -> ScrobbleLog:
+        """ Return ScrobbleLog for the first n scrobbles
+        """
+        if n is None:
+            n = 5
+        logs, count = [], 0
+        for partition in self.iter_partitions():
+            if count >= n:
+                break
+            logs.append(partition.head(n - count))
+            count += len(logs[-1])
+        return self._concat(logs, source=self._meta["source"])
+
+    def tail(self, n: int | None = None) -> ScrobbleLog:
+        """ Return ScrobbleLog for the last n scrobbles
+        """
+        if n is None:
+            n = 5
+        logs, count = [], 0
+        for partition in self.iter_partitions(reverse=True):
+            if count >= n:
+                break
+            logs.append(partition.tail(n - count))
+            count += len(logs[-1])
+        return self._concat(logs[::-1], source=self._meta["source"])
+
+    # -----------------------------------------------------------------
+    # Charts Methods
+
+    def aggregate(
+        self,
+        by: str | list[str] = ("artist", "album"),
+        freq: str | None = None,
+        n: int | None = None,
+        within: str | list[str] | None = None,
+        start: str | pd.Timestamp | datetime.datetime | None = None,
+        end: str | pd.Timestamp | datetime.datetime | None = None
+    ) -> pd.DataFrame:
+        """
+        Same as `ScrobbleLog.aggregate`: scrobbles are counted in each
+        partition of the date window, and the counts merged and ranked.
+        """
+        by, freq, n, within = validate_aggregate_args(by, freq, n, within)
+        parts = [count(partition.df, by, freq)
+                 for partition in self.iter_partitions(start, end)]
+        return merge_counts(parts, by, freq, n, within)
+
+    def top_charts(
+        self,
+        kind: str = "track",
+        n: int = 5,
+        start: str | pd.Timestamp | datetime.datetime | None = None,
+        end: str | pd.Timestamp | datetime.datetime | None = None
+    ) -> pd.Series:
+        """
+        Get top n tracks/artists/albums by number of scrobbles (see
+        `ScrobbleLog.top_charts`).
+        """
+        if not isinstance(kind, str):
+            raise TypeError("Expecting string type value for 'kind'")
+        kind = kind.lower().strip().rstrip("s")
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("'n' must be a non-negative integer")
+        counts = self.aggregate(kind, n=n, start=start, end=end)
+        count_series = counts.set_index(kind)["scrobbles"]
+        count_series.index.name = kind.capitalize()
+        count_series.name = "Scrobbles"
+        return count_series
+
+    # -----------------------------------------------------------------
+    # Transform Methods
+
+    def append(
+        self,
+        scrobbles: Scrobble | list(Scrobble | dict) | ScrobbleLog,
+        drop_duplicates: bool = True
+    ) -> MergeStats:
+        """
+        Add scrobbles to the partitioned log on disk.
+
+        Only the partitions receiving new scrobbles are loaded and
+        rewritten, one at a time. With `drop_duplicates`, scrobbles
+        already present are skipped (see `ScrobbleLog.upsert`).
+
+        Returns the numbers of added and skipped scrobbles.
+        """
+        batch = ScrobbleLog._from_validated(
+            validate_df(pd.DataFrame(columns=["timestamp", "track",
+                                              "artist", "album"]),
+                        self.tz),
+            dict(self._meta, num_scrobbles=0)
+        )
+        batch.append(scrobbles)
+        entries = {entry["key"]: entry for entry in self._partitions}
+        added = skipped = 0
+        for key, first, last in _partition_slices(batch.df, self._freq):
+            df = batch.df.iloc[first:last].reset_index(drop=True)
+            new = ScrobbleLog._from_validated(df, derive_meta(batch.meta, df))
+            if key in entries:
+                partition = self.load_partition(key, mmap=False)
+                if drop_duplicates:
+                    stats = partition.upsert(new)
+                else:
+                    partition.append(new)
+                    stats = MergeStats(len(new), 0)
+            else:
+                partition = new
+                stats = MergeStats(len(new), 0)
+            added += stats.added
+            skipped += stats.skipped
+            if stats.added:
+                file = f"{key}.mfm"
+                # Replace the file instead of overwriting it, as it may
+                # still be memory mapped by logs loaded earlier
+                temp_file = os.path.join(self._path, file + ".tmp")
+                partition.save(temp_file)
+                os.replace(temp_file, os.path.join(self._path, file))
+                timestamps = partition.df["timestamp"]
+                entries[key] = {
+                    "key": key,
+                    "file": file,
+                    "num_scrobbles": len(partition),
+                    "start": timestamps.iloc[0].isoformat(),
+                    "end": timestamps.iloc[-1].isoformat()
+                }
+        self._partitions = sorted(entries.values(),
+                                  key=lambda entry: entry["key"])
+        meta = dict(self._meta)
+        meta["num_scrobbles"] = sum(entry["num_scrobbles"]
+                                    for entry in self._partitions)
+        if self._partitions:
+            meta["date_range"] = {"start": self._partitions[0]["start"],
+                                  "end": self._partitions[-1]["end"]}
+        self._meta = meta
+        _write_manifest(self._path, self._meta, self._freq,
+                        self._partitions)
+        return MergeStats(added, skipped)
+
+
+def _write_manifest(
+    path: PathLike,
+    meta: dict,
+    freq: str,
+    partitions: list[dict]
+) -> None:
+    """Replace the manifest atomically, so readers never see half of it"""
+    manifest = {
+        "format": FORMAT,
+        "format_version": FORMAT_VERSION,
+        "meta": meta,
+        "freq": freq,
+        "partitions": partitions
+    }
+    manifest_file = os.path.join(path, MANIFEST)
+    temp_file = manifest_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_file, manifest_file)
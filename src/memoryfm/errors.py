@@ -21,6 +21,11 @@ class ParseError(InvalidDataError):
         self.error = error
         super().__init__(f"Cannot parse file '{self.filename}': {self.error}")
 
+    def __reduce__(self):
+        # Rebuild from the constructor arguments, e.g. when raised in a
+        # worker process
+        return type(self), (self.filename, self.error)
+
 
 class SchemaError(InvalidDataError):
     def __init__(self, msg, obj):
@@ -28,6 +33,9 @@ class SchemaError(InvalidDataError):
         self.obj = obj
         super().__init__(self.msg)
 
+    def __reduce__(self):
+        return type(self), (self.msg, self.obj)
+
 class InvalidTypeError(InvalidDataError):
     pass
 
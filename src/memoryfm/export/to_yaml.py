@@ -0,0 +1,96 @@
+"""Module: memoryfm.export.to_yaml
+Streaming YAML export and import of ScrobbleLogs.
+
+A YAML ScrobbleLog is a stream of documents: the first one holds the
+meta ({"meta": {...}}), and each following one is a list of up to
+`chunksize` scrobbles ({timestamp, track, artist, album} mappings).
+
+Documents are dumped and loaded one at a time, with the libyaml based
+CSafeDumper/CSafeLoader when PyYAML was built with libyaml, and the pure
+Python SafeDumper/SafeLoader otherwise.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+import yaml
+
+from memoryfm.errors import ParseError, SchemaError
+from memoryfm.util._file_handler import _file_opener
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+if TYPE_CHECKING:
+    from typing import IO
+    import pandas as pd
+    from memoryfm._typing import PathLike
+
+COLUMNS = ["timestamp", "track", "artist", "album"]
+
+
+def dump_yaml(
+    meta: dict,
+    chunks: Iterator[pd.DataFrame],
+    file_like: IO[str],
+) -> None:
+    """
+    Write `meta`, then every chunk of decoded scrobbles (plain strings,
+    None for missing values, formatted timestamps), as YAML documents.
+    """
+    def documents():
+        yield {"meta": meta}
+        for chunk in chunks:
+            columns = [chunk[column].tolist() for column in COLUMNS]
+            yield [dict(zip(COLUMNS, row)) for row in zip(*columns)]
+
+    yaml.dump_all(documents(), file_like, Dumper=SafeDumper,
+                  explicit_start=True, sort_keys=False,
+                  allow_unicode=True)
+
+
+def load_yaml(file: PathLike | IO[str]) -> dict:
+    """
+    Read a YAML ScrobbleLog one document at a time.
+
+    The scrobbles are decoded into per-column buffers, and repeated
+    strings share one object per column, as in `load_json_stream`.
+
+    Returns a dict with keys 'meta' and 'scrobbles', where 'scrobbles'
+    is a pandas DataFrame.
+    """
+    import pandas as pd
+    file_like = _file_opener(file, "r")
+    try:
+        documents = yaml.load_all(file_like, Loader=SafeLoader)
+        try:
+            first = next(documents, None)
+            if not isinstance(first, dict) or "meta" not in first:
+                raise SchemaError("First YAML document must hold 'meta'",
+                                  "meta")
+            buffers = {column: [] for column in COLUMNS}
+            interned = {column: {} for column in COLUMNS[1:]}
+            for number, document in enumerate(documents, start=2):
+                if document is None:
+                    continue
+                if not isinstance(document, list):
+                    raise ParseError(file, f"Document {number} is not a "
+                                           "list of scrobbles")
+                for scrobble in document:
+                    if not isinstance(scrobble, dict):
+                        raise ParseError(file, f"Document {number} holds "
+                                               "a scrobble that is not a "
+                                               "mapping")
+                    buffers["timestamp"].append(scrobble.get("timestamp"))
+                    for column, strings in interned.items():
+                        value = scrobble.get(column)
+                        buffers[column].append(
+                            strings.setdefault(value, value)
+                        )
+        except yaml.YAMLError as e:
+            raise ParseError(file, e) from e
+    finally:
+        if file_like is not file:
+            file_like.close()
+    return {"meta": first["meta"], "scrobbles": pd.DataFrame(buffers)}
@@ -0,0 +1,152 @@
+"""Module: memoryfm.io._binary
+Native binary columnar format for ScrobbleLog.
+
+Layout of a `.mfm` file
+-----------------------
+- 8 bytes   : magic string b"MFMLOG01"
+- 8 bytes   : length of the header, little-endian uint64
+- header    : UTF-8 JSON with keys 'meta', 'num_scrobbles' and 'columns'
+- data      : one little-endian array per column, each aligned to 64 bytes
+
+Columns
+-------
+'timestamp'                  : int64 epoch values in the unit of the log
+'track', 'artist', 'album'   : int32 dictionary codes (-1 for missing
+                               values); the dictionary is stored in the
+                               header under the column's 'categories'
+                               (strings, or numbers for numeric values)
+
+Arrays are read with `numpy.memmap`, so opening a file only decodes the
+header and the string dictionaries.
+"""
+
+from __future__ import annotations
+import json
+import numpy as np
+import pandas as pd
+from typing import TYPE_CHECKING
+
+from memoryfm.errors import InvalidTypeError, ParseError
+
+if TYPE_CHECKING:
+    from memoryfm._typing import PathLike
+
+MAGIC = b"MFMLOG01"
+ALIGNMENT = 64
+STRING_COLUMNS = ["track", "artist", "album"]
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _encode_strings(series: pd.Series) -> tuple[np.ndarray, list]:
+    """
+    Dictionary-encode a string column into int32 codes. Categories that
+    are not strings (e.g. numeric titles read from a CSV) are kept as
+    JSON numbers, so that they are read back with the same values.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Slices of a log keep all categories of the log
+        series = series.cat.remove_unused_categories()
+        codes = series.cat.codes.to_numpy()
+        categories = series.cat.categories
+    else:
+        codes, categories = pd.factorize(series)
+    values = categories.tolist()
+    if not pd.api.types.is_string_dtype(categories):
+        invalid = [value for value in values
+                   if not isinstance(value, (str, int, float))]
+        if invalid:
+            raise InvalidTypeError(
+                f"Cannot store '{series.name}' values of type "
+                f"{type(invalid[0]).__name__} in a binary ScrobbleLog"
+            )
+    return codes.astype("<i4"), values
+
+
+def write_binary(df: pd.DataFrame, meta: dict, file: PathLike) -> None:
+    """
+    Write a validated ScrobbleLog DataFrame and its meta to `file`.
+    """
+    timestamps = pd.DatetimeIndex(df["timestamp"])
+    columns = {
+        "timestamp": {
+            "dtype": "<i8",
+            "unit": timestamps.unit,
+        }
+    }
+    arrays = {"timestamp": timestamps.asi8.astype("<i8")}
+    for name in STRING_COLUMNS:
+        codes, categories = _encode_strings(df[name])
+        columns[name] = {"dtype": "<i4", "categories": categories}
+        arrays[name] = codes
+    offset = 0
+    for name, array in arrays.items():
+        columns[name]["offset"] = offset
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps({
+        "meta": meta,
+        "num_scrobbles": len(df),
+        "columns": columns
+    }).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+    with open(file, "wb") as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + columns[name]["offset"])
+            f.write(memoryview(np.ascontiguousarray(array)))
+
+
+def read_binary(
+    file: PathLike,
+    mmap: bool = True
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Read a DataFrame and meta written by `write_binary`.
+
+    String columns are returned as pandas categoricals built on the
+    stored dictionary codes. With `mmap`, the column arrays are memory
+    mapped instead of read into memory.
+    """
+    with open(file, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ParseError(file, "Not a memory.fm binary ScrobbleLog file")
+        header_length = int.from_bytes(f.read(8), "little")
+        try:
+            header = json.loads(f.read(header_length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ParseError(file, f"Corrupt header: {e}") from e
+    data_start = _aligned(len(MAGIC) + 8 + header_length)
+    num_scrobbles = header["num_scrobbles"]
+    columns = header["columns"]
+
+    def load(name: str) -> np.ndarray:
+        dtype = np.dtype(columns[name]["dtype"])
+        offset = data_start + columns[name]["offset"]
+        if not num_scrobbles:
+            return np.empty(0, dtype=dtype)
+        if mmap:
+            return np.memmap(file, dtype=dtype, mode="r",
+                             offset=offset, shape=(num_scrobbles,))
+        return np.fromfile(file, dtype=dtype, count=num_scrobbles,
+                           offset=offset)
+
+    meta = header["meta"]
+    unit = columns["timestamp"]["unit"]
+    epoch = np.asarray(load("timestamp")).view(f"M8[{unit}]")
+    data = {
+        "timestamp": pd.Series(epoch).dt.tz_localize("UTC")
+                                     .dt.tz_convert(meta["tz"])
+    }
+    for name in STRING_COLUMNS:
+        values = columns[name]["categories"]
+        if all(isinstance(value, str) for value in values):
+            categories = pd.Index(values, dtype="str")
+        else:
+            categories = pd.Index(values)
+        data[name] = pd.Categorical.from_codes(load(name),
+                                               categories=categories)
+    return pd.DataFrame(data), meta
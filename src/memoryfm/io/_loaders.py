@@ -4,6 +4,7 @@ a pandas DataFrame for further processing depending on the JSON source.
 """
 
 from __future__ import annotations
+import io
 import json
 import pandas as pd
 from typing import TYPE_CHECKING
@@ -27,51 +28,234 @@ def load_json(file: PathLike | IO[str] = None) ->Any:
     file_like = _file_opener(file, "r")
     try:
         data = json.load(file_like)
-        file_like.close()
-    except FileNotFoundError:
-        raise
     except json.JSONDecodeError as e:
         raise ParseError(file, f"{e.msg} at line {e.lineno} column {e.colno}")
+    finally:
+        file_like.close()
     return data
 
 
-def load_csv(file: PathLike | IO[str] = None) -> pd.DataFrame:
+class _JSONStream:
+    """
+    Incremental reader for a JSON document in a text file.
+
+    Keeps a bounded text buffer and decodes one value at a time with
+    `json.JSONDecoder.raw_decode`, refilling the buffer when a value is
+    cut off at its end.
+    """
+    def __init__(
+        self,
+        file_like: IO[str],
+        blocksize: int,
+        filename: PathLike | IO[str] | None = None
+    ):
+        self.file_like = file_like
+        self.filename = filename
+        self.blocksize = blocksize
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0     # Position of buffer[0] in the file
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read the next block, dropping the consumed part of the buffer"""
+        if self.eof:
+            return False
+        block = self.file_like.read(self.blocksize)
+        if not block:
+            self.eof = True
+            return False
+        self.offset = self.offset + self.pos
+        self.buffer = self.buffer[self.pos:] + block
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            while (self.pos < len(self.buffer)
+                   and self.buffer[self.pos] in " \t\n\r"):
+                self.pos = self.pos + 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, one of `chars`"""
+        char = self.peek()
+        if not char or char not in chars:
+            self.error(f"Expecting one of {list(chars)}")
+        self.pos = self.pos + 1
+        return char
+
+    def value(self) -> Any:
+        """Decode and consume the next JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if not self._fill():
+                    self.error(e.msg, e.pos)
+                continue
+            # A number at the end of the buffer may continue in the file
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def error(self, msg: str, pos: int | None = None) -> None:
+        if pos is None:
+            pos = self.pos
+        raise ParseError(self.filename, f"{msg} at char {self.offset + pos}")
+
+
+def load_json_stream(
+    file: PathLike | IO[str] = None,
+    blocksize: int = 1 << 16
+) -> dict:
+    """
+    Read a lastfmstats JSON export incrementally.
+
+    The 'scrobbles' array is decoded one scrobble at a time into
+    per-column buffers, so no list of scrobble dicts is ever built.
+    Repeated strings (artists, albums, ...) share one object per column.
+
+    Returns a dict with the top-level keys of the export, where
+    'scrobbles' is a pandas DataFrame with one column per scrobble key.
     """
-    """ 
     file_like = _file_opener(file, "r")
-    line_num = 0
-    for line in file_like:
-        col_list = line.split(";")
-        if not line_num and len(col_list) != 5:
-            raise ParseError(file, "Wrong delimiter or missing columns: "
-                                   f"{len(col_list)}")
-        elif not line_num:
-            last_col = col_list[-1]
-            pos_username = last_col.find("Date#")
-            if pos_username:
-                raise ParseError(file, "Expecting last column name: "
-                                       "'Data#{username}'")
-            else:
-                username = last_col[5:].strip()
-                if not username:
-                    raise ParseError(file, "Blank or only whitespace username")
-        if line_num and len(col_list) != 5:
-            raise ParseError(file, "Expected delimiter ';' in line number "
-                                   f"{line_num+1}: {line}")
-        line_num = line_num + 1
-    file_like.close()
-    file_like = _file_opener(file)
     try:
-        df = pd.read_csv(file_like, sep=";")
+        stream = _JSONStream(file_like, blocksize, file)
+        data = {}
+        stream.expect("{")
+        if stream.peek() == "}":
+            stream.expect("}")
+            return data
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                stream.error("Expecting property name")
+            stream.expect(":")
+            if key == "scrobbles" and stream.peek() == "[":
+                data[key] = _stream_scrobbles(stream)
+            else:
+                data[key] = stream.value()
+            if stream.expect(",}") == "}":
+                break
+    finally:
         file_like.close()
-    except FileNotFoundError:
-        raise
-    except pd.errors.ParserError as e:
-        raise ParseError(file, e) from e
-    except ValueError as e:
-        raise ParseError(file, e) from e
-    # Last column name expected of the form "Date#{username}"
-    last_column = df.columns[-1]
-    df = pd.DataFrame.rename(df, columns={last_column: "Date"})
-    data = {"username": username, "scrobbles": df.to_dict(orient="records")}
     return data
+
+
+def _stream_scrobbles(stream: _JSONStream) -> pd.DataFrame:
+    """Decode a JSON array of scrobble objects into a DataFrame"""
+    columns = {}
+    interned = {}
+    num_rows = 0
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.expect("]")
+        return pd.DataFrame()
+    while True:
+        item = stream.value()
+        if not isinstance(item, dict):
+            stream.error("Expecting object in 'scrobbles' array")
+        for key, value in item.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * num_rows
+                interned[key] = {}
+            if isinstance(value, str):
+                value = interned[key].setdefault(value, value)
+            column.append(value)
+        num_rows = num_rows + 1
+        if len(item) != len(columns):
+            for column in columns.values():
+                if len(column) < num_rows:
+                    column.append(None)
+        if stream.expect(",]") == "]":
+            break
+    interned.clear()
+    return pd.DataFrame(columns)
+
+
+def load_csv(
+    file: PathLike | IO[str] = None,
+    chunksize: int = 100_000
+) -> dict:
+    """
+    Read a lastfmstats CSV export in a single pass.
+
+    The header is checked once for the ';' delimiter and the
+    'Date#{username}' column. The body is parsed by pandas in chunks of
+    `chunksize` rows. Rows whose number of fields is not 5 (e.g. with a
+    wrong delimiter) are looked for only if pandas reports a parser
+    error, an extra field or a missing date; an empty date in a row of
+    5 fields is kept, and the row is dropped on validation.
+
+    Returns a dict with keys 'username' and 'scrobbles', where
+    'scrobbles' is a pandas DataFrame with columns
+    ['Artist', 'Album', 'AlbumId', 'Track', 'Date'].
+    """
+    file_like = _file_opener(file, "r")
+    try:
+        if not file_like.seekable():
+            # Rows are read again to report a wrong number of fields
+            file_like = io.StringIO(file_like.read())
+        header = file_like.readline()
+        columns = header.rstrip("\r\n").split(";")
+        if len(columns) != 5:
+            raise ParseError(file, "Wrong delimiter or missing columns: "
+                                   f"{len(columns)}")
+        # Last column name expected of the form "Date#{username}"
+        if not columns[-1].startswith("Date#"):
+            raise ParseError(file, "Expecting last column name: "
+                                   "'Data#{username}'")
+        username = columns[-1][5:].strip()
+        if not username:
+            raise ParseError(file, "Blank or only whitespace username")
+        columns[-1] = "Date"
+        chunks = []
+        try:
+            # A 6th column catches a first row with an extra field, which
+            # pandas would otherwise silently drop or move to the index
+            reader = pd.read_csv(file_like, sep=";", header=None,
+                                 names=columns + ["_extra"], index_col=False,
+                                 chunksize=chunksize)
+            for chunk in reader:
+                if (chunk["_extra"].notna().any()
+                        or chunk["Date"].isna().any()):
+                    _check_field_counts(file, file_like)
+                chunks.append(chunk.drop(columns="_extra"))
+        except pd.errors.ParserError as e:
+            _check_field_counts(file, file_like)
+            raise ParseError(file, e) from e
+        except ValueError as e:
+            raise ParseError(file, e) from e
+    finally:
+        file_like.close()
+    if not chunks:
+        df = pd.DataFrame(columns=columns)
+    elif len(chunks) == 1:
+        df = chunks[0]
+    else:
+        df = pd.concat(chunks, ignore_index=True)
+    return {"username": username, "scrobbles": df}
+
+
+def _check_field_counts(file: PathLike | IO[str], file_like: IO[str]) -> None:
+    """
+    Raise a ParseError for the first row of the CSV export that does not
+    have 5 fields, with its line number. Restores the read position.
+    """
+    import csv
+    position = file_like.tell()
+    file_like.seek(0)
+    rows = csv.reader(file_like, delimiter=";")
+    next(rows, None)
+    for row in rows:
+        if row and len(row) != 5:
+            raise ParseError(file, "Expected delimiter ';' in line number "
+                                   f"{rows.line_num}: {';'.join(row)}")
+    file_like.seek(position)
@@ -0,0 +1,274 @@
+"""Module: memoryfm.io._log_cache
+On-disk cache of parsed lastfmstats exports, used by the CLI.
+
+Layout of a cache directory
+---------------------------
+index.json : the known source files (size, mtime and content hash) and
+             one entry per cached log (source, file type, timezone,
+             memory.fm version, username, number of scrobbles, creation
+             and last use times)
+<key>.mfm  : one binary ScrobbleLog (see `ScrobbleLog.save`) per entry
+
+An entry is keyed by the content hash of the export, its file type, the
+timezone it was normalised to and the memory.fm version that parsed it,
+so logs parsed by another version are never loaded (and are pruned as
+stale). A source whose size and mtime are unchanged is not hashed
+again, so a cache hit only costs a `stat` and memory mapping the `.mfm`
+file: the export is neither parsed nor normalised.
+"""
+
+from __future__ import annotations
+import datetime
+import hashlib
+import json
+import os
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+from memoryfm.errors import InvalidDataError
+
+if TYPE_CHECKING:
+    from memoryfm._typing import PathLike
+    from memoryfm.core.objects import ScrobbleLog
+
+FORMAT = "memoryfm-log-cache"
+FORMAT_VERSION = 1
+INDEX = "index.json"
+# <key>.mfm and <key>.mfm.tmp, where keys are 12 byte BLAKE2b hex digests
+CACHE_FILE = re.compile(r"([0-9a-f]{24})\.mfm(\.tmp)?")
+
+
+def default_cache_dir() -> str:
+    """
+    $MEMORYFM_CACHE_DIR, else memoryfm/ under $XDG_CACHE_HOME (default
+    ~/.cache).
+    """
+    cache_dir = os.environ.get("MEMORYFM_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    cache_home = (os.environ.get("XDG_CACHE_HOME")
+                  or os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_home, "memoryfm")
+
+
+def file_hash(path: PathLike, chunk_size: int = 1 << 20) -> str:
+    """Hex BLAKE2b digest of the contents of `path`"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PruneStats(NamedTuple):
+    removed: int
+    freed_bytes: int
+
+
+class LogCache:
+    """
+    Cache of ScrobbleLogs parsed from lastfmstats exports.
+
+    `hits` and `misses` count the `load` calls of this instance.
+    """
+
+    def __init__(self, path: PathLike | None = None) -> None:
+        self._path = os.fspath(path) if path is not None \
+            else default_cache_dir()
+        index = self._read_index()
+        # Only a directory with a valid index is known to be a cache, so
+        # only there are unindexed files removed by `prune`
+        self._has_index = index is not None
+        self._index = index if index is not None else {
+            "format": FORMAT, "format_version": FORMAT_VERSION,
+            "sources": {}, "entries": {}
+        }
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._index["entries"])
+
+    def __repr__(self) -> str:
+        return f"LogCache(path={self._path!r}, entries={len(self)})"
+
+    # -----------------------------------------------------------------
+    # Lookup
+
+    def load(
+        self,
+        source: PathLike,
+        file_type: str,
+        tz: str | None = None
+    ) -> ScrobbleLog:
+        """
+        Return the ScrobbleLog of the lastfmstats export `source`,
+        parsing it (and caching the result) only on a miss.
+        """
+        from memoryfm.core._validation import validate_tz
+        from memoryfm.core.objects import ScrobbleLog
+        if file_type not in ("json", "csv"):
+            raise InvalidDataError('Only "json" or "csv" allowed as '
+                                   '"file_type"')
+        source = os.path.realpath(source)
+        tz = validate_tz(tz)
+        from memoryfm._version import package_version
+        content_hash = self._source_hash(source)
+        # Logs parsed by another memory.fm version are parsed again
+        version = package_version()
+        key = hashlib.blake2b(
+            f"{content_hash}\0{file_type}\0{tz}\0{version}".encode(),
+            digest_size=12
+        ).hexdigest()
+        entry = self._index["entries"].get(key)
+        log_file = os.path.join(self._path, f"{key}.mfm")
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        if entry is not None and os.path.exists(log_file):
+            self.hits += 1
+            scrobble_log = ScrobbleLog.open(log_file)
+            entry.update(source=source, last_used=now)
+        else:
+            self.misses += 1
+            from memoryfm.io.lastfmstats import from_lastfmstats
+            scrobble_log = from_lastfmstats(source, file_type, tz)
+            os.makedirs(self._path, exist_ok=True)
+            temp_file = log_file + ".tmp"
+            scrobble_log.save(temp_file)
+            os.replace(temp_file, log_file)
+            self._index["entries"][key] = {
+                "source": source,
+                "hash": content_hash,
+                "file_type": file_type,
+                "tz": tz,
+                "version": version,
+                "username": scrobble_log.username,
+                "num_scrobbles": len(scrobble_log),
+                "created": now,
+                "last_used": now,
+            }
+        self._write_index()
+        return scrobble_log
+
+    def _source_hash(self, source: str) -> str:
+        """Content hash of `source`, recomputed only if it changed"""
+        stat = os.stat(source)
+        known = self._index["sources"].get(source)
+        if (known is not None and known["size"] == stat.st_size
+                and known["mtime_ns"] == stat.st_mtime_ns):
+            return known["hash"]
+        content_hash = file_hash(source)
+        self._index["sources"][source] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": content_hash,
+        }
+        return content_hash
+
+    # -----------------------------------------------------------------
+    # Inspection and pruning
+
+    def entries(self) -> list[dict]:
+        """Cached logs, most recently used first, with their file size"""
+        entries = []
+        for key, entry in self._index["entries"].items():
+            log_file = os.path.join(self._path, f"{key}.mfm")
+            size = os.path.getsize(log_file) \
+                if os.path.exists(log_file) else 0
+            entries.append(dict(entry, key=key, size=size))
+        return sorted(entries, key=lambda entry: entry["last_used"],
+                      reverse=True)
+
+    def prune(
+        self,
+        everything: bool = False,
+        max_age: datetime.timedelta | None = None
+    ) -> PruneStats:
+        """
+        Remove stale entries: those whose source file is gone or has
+        different contents, those not used within `max_age`, and `.mfm`
+        files missing from the index. With `everything`, remove all.
+
+        Only files named like cache entries are removed, and unindexed
+        ones only if the directory already held a valid cache index.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        removed, freed = 0, 0
+        for key, entry in list(self._index["entries"].items()):
+            stale = everything or not self._is_current(entry)
+            if max_age is not None:
+                last_used = datetime.datetime.fromisoformat(entry["last_used"])
+                stale = stale or now - last_used > max_age
+            if stale:
+                del self._index["entries"][key]
+                removed += 1
+                freed += self._remove(f"{key}.mfm")
+        if self._has_index and os.path.isdir(self._path):
+            for name in os.listdir(self._path):
+                match = CACHE_FILE.fullmatch(name)
+                if match and (match.group(2)
+                              or match.group(1) not in self._index["entries"]):
+                    removed += 1
+                    freed += self._remove(name)
+        used = {entry["source"] for entry in self._index["entries"].values()}
+        self._index["sources"] = {
+            source: known for source, known in self._index["sources"].items()
+            if source in used
+        }
+        if self._has_index:
+            self._write_index()
+        return PruneStats(removed, freed)
+
+    def _is_current(self, entry: dict) -> bool:
+        """
+        True if the entry was parsed by this memory.fm version and its
+        source still has the cached contents
+        """
+        from memoryfm._version import package_version
+        if entry.get("version") != package_version():
+            return False
+        try:
+            return self._source_hash(entry["source"]) == entry["hash"]
+        except OSError:
+            return False
+
+    def _remove(self, name: str) -> int:
+        file = os.path.join(self._path, name)
+        try:
+            size = os.path.getsize(file)
+            os.remove(file)
+        except FileNotFoundError:
+            return 0
+        return size
+
+    # -----------------------------------------------------------------
+    # Index
+
+    def _read_index(self) -> dict | None:
+        """The index of the cache directory, None if missing or invalid"""
+        index_file = os.path.join(self._path, INDEX)
+        try:
+            with open(index_file, encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            # A corrupt index only loses the cache, it is rebuilt
+            return None
+        if (not isinstance(index, dict) or index.get("format") != FORMAT
+                or index.get("format_version") != FORMAT_VERSION):
+            return None
+        return index
+
+    def _write_index(self) -> None:
+        """Replace the index atomically, so readers never see half of it"""
+        os.makedirs(self._path, exist_ok=True)
+        index_file = os.path.join(self._path, INDEX)
+        temp_file = index_file + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(temp_file, index_file)
+        self._has_index = True
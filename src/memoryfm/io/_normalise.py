@@ -1,6 +1,7 @@
 """Module: memoryfm.normalise.normalise_lastfmstats
 """
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 from memoryfm.errors import SchemaError, InvalidDataError
 from memoryfm.core.objects import ScrobbleLog
@@ -13,21 +14,44 @@ def normalise_timestamps(
 ) -> pd.Series:
     """
     Convert series values to tz-aware pd.Timestamp.
+
+    Numbers are epoch values in `unit`, and tz-naive values are taken as
+    UTC. Fast paths: tz-aware timestamps are only converted to `tz`,
+    and integer epochs are reinterpreted as datetime64 without parsing.
+    Strings are parsed with the format pandas infers from the first one.
     """
+    from memoryfm.core._validation import validate_tz
+    tz = validate_tz(tz)
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return series.dt.tz_convert(tz)
     try:
-        if not pd.api.types.is_numeric_dtype(series):
-            unit = None
-        series = pd.to_datetime(series, unit=unit, utc=True)
-    except ValueError as e:
+        if pd.api.types.is_datetime64_dtype(dtype):
+            series = series.dt.tz_localize("UTC")
+        elif pd.api.types.is_integer_dtype(dtype) and unit is not None:
+            series = _from_epoch(series, unit)
+        elif pd.api.types.is_numeric_dtype(dtype):
+            series = pd.to_datetime(series, unit=unit, utc=True)
+        else:
+            series = pd.to_datetime(series, utc=True)
+    except (ValueError, OverflowError) as e:
         raise InvalidDataError(e)
-    else:
-        from memoryfm.core._validation import validate_tz
-        tz = validate_tz(tz)
-    if hasattr(series, "dt.tz") and series.dt.tz is None:
-        series = series.dt.tz_localize(tz)
-    else:
-        series = series.dt.tz_convert(tz)
-    return series
+    return series.dt.tz_convert(tz)
+
+
+def _from_epoch(series: pd.Series, unit: str) -> pd.Series:
+    """
+    Reinterpret integer epochs in `unit` as UTC datetime64 values. Only
+    NumPy integers are reinterpreted: nullable (e.g. "Int64") ones may
+    hold missing values, which pd.to_datetime turns into NaT.
+    """
+    if (unit not in ("s", "ms", "us", "ns")
+            or not isinstance(series.dtype, np.dtype)):
+        return pd.to_datetime(series, unit=unit, utc=True)
+    values = series.to_numpy(dtype="int64").astype(f"datetime64[{unit}]")
+    index = pd.DatetimeIndex(values).tz_localize("UTC")
+    return pd.Series(index, index=series.index, name=series.name)
+
 
 def normalise_lastfmstats(
     df: pd.DataFrame,
@@ -38,6 +62,7 @@ def normalise_lastfmstats(
     """
     df = df.rename(str.lower, axis=1)
     if "date" in df.columns:
+        # validate_df keeps the normalised tz-aware column as is
         df["date"] = normalise_timestamps(df["date"],
                                           tz=tz,
                                           unit="ms")
@@ -2,15 +2,26 @@
 """
 
 from __future__ import annotations
+import csv
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 from memoryfm.util._file_handler import _file_opener
 
+try:
+    # Optional, as for tabulate: display width of wide (e.g. CJK) text
+    from wcwidth import wcswidth
+except ImportError:
+    wcswidth = None
+
 if TYPE_CHECKING:
-    from typing import IO
+    import pandas as pd
+    from typing import IO, Iterable
     from memoryfm._typing import PathLike
 
+# tabulate's MIN_PADDING: header width + 2 is the minimum column width
+MARKDOWN_MIN_PADDING = 2
+
 
 def _write_string(
     data: str,
@@ -45,17 +56,106 @@ def _dict_to_json(
         return json.dumps(data)
     return None
 
-def _dict_to_csv(
-    data,
-    file: PathLike | IO[str] | None = None,
-) ->str | None:
+def _write_csv_chunks(
+    chunks: Iterable[pd.DataFrame],
+    header: list[str],
+    file_like: IO[str],
+    sep: str = ",",
+    quoting: int = csv.QUOTE_MINIMAL,
+) -> None:
     """
-    Write `dict` to CSV format.
+    Write DataFrame chunks as one CSV table under an unquoted `header`.
+
+    Each chunk is written by `DataFrame.to_csv`, so values are quoted
+    and escaped by pandas' C writer; missing values are left empty.
     """
-    if file is not None:
-        file_like = _file_opener(file, "w")
-        json.dump(data, file_like)
-        file_like.close()
-    else:
-        return data
-    return None
+    file_like.write(sep.join(header) + "\n")
+    for chunk in chunks:
+        chunk.to_csv(file_like, sep=sep, header=False, index=False,
+                     quoting=quoting, lineterminator="\n")
+
+def _write_markdown_table(
+    chunks: Iterable[pd.DataFrame],
+    widths: list[int],
+    file_like: IO[str],
+    tablefmt: str = "github",
+) -> None:
+    """
+    Write string DataFrame chunks as one left-aligned markdown table.
+
+    Column `widths` (the `_text_width` of the widest stripped cell of
+    each column) must be known in advance, so that rows can be written
+    chunk by chunk. As in tabulate, cells are stripped and a column is
+    at least 2 wider than its header; the output is the same as
+    tabulate's "github" or "pipe" table of single-line text cells.
+    """
+    if tablefmt not in ("github", "pipe"):
+        raise ValueError("Streaming markdown supports only the 'github' "
+                         "and 'pipe' table formats")
+    lead = ":" if tablefmt == "pipe" else "-"
+    first = True
+    for chunk in chunks:
+        if first:
+            widths = [
+                max(width, _text_width(header) + MARKDOWN_MIN_PADDING)
+                for header, width in zip(chunk.columns, widths)
+            ]
+            file_like.write(_markdown_row(chunk.columns, widths) + "\n")
+            file_like.write(
+                "|" + "|".join(lead + "-" * (width + 1) for width in widths)
+                + "|"
+            )
+            first = False
+        columns = [_pad_cells(chunk[column], width)
+                   for column, width in zip(chunk.columns, widths)]
+        lines = ["\n| " + " | ".join(row) + " |" for row in zip(*columns)]
+        file_like.write("".join(lines))
+
+
+def _text_width(text: str) -> int:
+    """Display width of `text`, as measured by tabulate"""
+    if wcswidth is None or (text.isascii() and text.isprintable()):
+        return len(text)
+    return wcswidth(text)
+
+
+def _pad_text(text: str, width: int) -> str:
+    text = text.strip()
+    return text + " " * (width - _text_width(text))
+
+
+def _pad_cells(cells: pd.Series, width: int) -> list[str]:
+    """Stripped cells padded to `width`, each distinct one padded once"""
+    cells = cells.fillna("")
+    padded = {cell: _pad_text(cell, width) for cell in cells.unique()}
+    return cells.map(padded).tolist()
+
+
+def _markdown_row(cells: Iterable[str], widths: list[int]) -> str:
+    return "| " + " | ".join(
+        _pad_text(cell, width) for cell, width in zip(cells, widths)
+    ) + " |"
+
+def _write_json_log(
+    meta: dict,
+    columns: list[str],
+    chunks: Iterable[list[list[str]]],
+    file_like: IO[str],
+) -> None:
+    """
+    Write a canonical JSON ScrobbleLog, {"meta": ..., "scrobbles": [...]},
+    with the scrobbles written chunk by chunk.
+
+    Each chunk holds one list per column of JSON-encoded values. The
+    output is the same as `json.dumps` of the whole dict.
+    """
+    record = "{" + ", ".join(json.dumps(column).replace("%", "%%") + ": %s"
+                             for column in columns) + "}"
+    file_like.write('{"meta": ' + json.dumps(meta) + ', "scrobbles": [')
+    sep = ""
+    for chunk in chunks:
+        records = ", ".join([record % row for row in zip(*chunk)])
+        if records:
+            file_like.write(sep + records)
+            sep = ", "
+    file_like.write("]}")
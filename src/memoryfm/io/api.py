@@ -2,6 +2,6 @@
 Data IO api
 """
 
-from memoryfm.io.lastfmstats import from_lastfmstats
+from memoryfm.io.lastfmstats import from_lastfmstats, from_lastfmstats_many
 
-__all__ = ["from_lastfmstats"]
+__all__ = ["from_lastfmstats", "from_lastfmstats_many"]
@@ -18,27 +18,43 @@ Functions: verify_columns,
            verify_scrobbles_columns
 """
 from __future__ import annotations
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 from memoryfm._typing import PathLike
 from memoryfm.errors import InvalidDataError
-from memoryfm.io._loaders import load_csv, load_json
+from memoryfm.io._loaders import load_csv, load_json, load_json_stream
 from memoryfm.io._normalise import normalise_lastfmstats
 from memoryfm.core.objects import ScrobbleLog
+from memoryfm.core._merge import duplicate_mask
+from memoryfm.core._validation import (
+    validate_tz,
+    concat_validated,
+    sort_by_timestamp,
+    meta_generator,
+)
 
 if TYPE_CHECKING:
-    from typing import IO, AnyStr, Literal
+    from typing import IO, AnyStr, Iterable, Literal
 
 
 def from_lastfmstats(
     file: PathLike | IO[AnyStr],
     file_type: Literal["json", "csv"],
-    tz: str | None = None
+    tz: str | None = None,
+    streaming: bool = True
 ) -> ScrobbleLog:
     """
+    Create a ScrobbleLog from a lastfmstats.com JSON or CSV export.
+
+    With `streaming` (default), JSON exports are decoded incrementally
+    into columns instead of being loaded as one Python object tree.
     """
-    if file_type == "json":
+    if file_type == "json" and streaming:
+        data = load_json_stream(file)
+    elif file_type == "json":
         data = load_json(file)
     elif file_type == "csv":
         data = load_csv(file)
@@ -46,11 +62,106 @@ def from_lastfmstats(
         raise InvalidDataError('Only "json" or "csv" allowed as "file_type"')
     _validate_data(data) 
     username = data["username"]
-    df = pd.DataFrame(data["scrobbles"])
+    df = data["scrobbles"]
+    if not isinstance(df, pd.DataFrame):
+        df = pd.DataFrame(df)
     scrobble_log = normalise_lastfmstats(df, username, tz)
     return scrobble_log
 
 
+def from_lastfmstats_many(
+    paths: PathLike | Iterable[PathLike],
+    file_type: Literal["json", "csv"] | None = None,
+    tz: str | None = None,
+    combine: bool = False,
+    max_workers: int | None = None,
+    streaming: bool = True,
+    drop_duplicates: bool = True
+) -> dict[str, ScrobbleLog] | ScrobbleLog:
+    """
+    Create ScrobbleLogs from many lastfmstats.com exports in parallel.
+
+    `paths` is a list of files, or a directory whose .json and .csv
+    files are read. Files are parsed and normalised in a process pool
+    of `max_workers` processes (default: number of CPUs), and the logs
+    of each username are merged into one. With `drop_duplicates`,
+    scrobbles found in several (overlapping) exports are kept once.
+
+    If `file_type` is None, it is taken from each file's extension.
+
+    Returns a dict mapping username to ScrobbleLog or, with `combine`,
+    the single ScrobbleLog of the only username found.
+    """
+    paths = _export_paths(paths)
+    if not paths:
+        raise InvalidDataError("No lastfmstats exports found")
+    # Resolve the timezone once instead of in every worker
+    tz = validate_tz(tz)
+    jobs = []
+    for path in paths:
+        path_type = file_type or _file_type(path)
+        if path_type is None:
+            raise InvalidDataError(
+                f"Cannot infer file type of '{path}': expecting .json or .csv"
+            )
+        jobs.append((path, path_type, tz, streaming))
+    if max_workers == 1 or len(jobs) == 1:
+        results = [_parse_export(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_parse_export, *zip(*jobs)))
+
+    frames: dict[str, list[pd.DataFrame]] = {}
+    for username, df in results:
+        frames.setdefault(username, []).append(df)
+    logs = {}
+    for username, user_frames in frames.items():
+        df = sort_by_timestamp(concat_validated(user_frames))
+        if drop_duplicates and len(user_frames) > 1:
+            duplicated = duplicate_mask(df.iloc[:0], df)
+            df = df[~duplicated].reset_index(drop=True)
+        meta = meta_generator(df, username, tz, "lastfmstats.com")
+        logs[username] = ScrobbleLog._from_validated(df, meta)
+    if not combine:
+        return logs
+    if len(logs) > 1:
+        raise InvalidDataError(
+            f"Cannot combine exports of several usernames: {list(logs)}"
+        )
+    return next(iter(logs.values()))
+
+
+def _export_paths(paths: PathLike | Iterable[PathLike]) -> list[str]:
+    """List the export files of a directory, or the given files"""
+    if isinstance(paths, (str, os.PathLike)):
+        if not os.path.isdir(paths):
+            return [os.fspath(paths)]
+        return sorted(
+            entry.path for entry in os.scandir(paths)
+            if entry.is_file() and _file_type(entry.path)
+        )
+    return [os.fspath(path) for path in paths]
+
+
+def _file_type(path: str) -> str | None:
+    """'json' or 'csv' from the file extension, None if neither"""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension in ("json", "csv"):
+        return extension
+    return None
+
+
+def _parse_export(
+    path: str,
+    file_type: Literal["json", "csv"],
+    tz: str,
+    streaming: bool
+) -> tuple[str, pd.DataFrame]:
+    """Parse one export into its username and validated DataFrame"""
+    scrobble_log = from_lastfmstats(path, file_type, tz, streaming)
+    return scrobble_log.username, scrobble_log.df
+
+
 def _validate_data(data: dict) -> None:
     """
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+import datetime
 import memoryfm as mfm
 import pandas as pd
 import pytest
@@ -73,10 +74,71 @@ class TestScrobbleLog:
         scrobble = sample_log[2]
         assert scrobble in sample_log
 
+    def test_contains_tz_and_missing_album(self):
+        scrobble_log = mfm.ScrobbleLog.from_dict(dict_valid_2)
+        scrobble = scrobble_log[0]
+        assert scrobble.album is None
+        assert scrobble in scrobble_log
+        scrobble.timestamp = scrobble.timestamp.tz_convert("Asia/Kolkata")
+        assert scrobble in scrobble_log
+        scrobble.track = "Tr2"
+        assert scrobble not in scrobble_log
+        scrobble.timestamp = "not a date"
+        assert scrobble not in scrobble_log
+
+    def test_contains_many(self):
+        scrobble = mfm.Scrobble.from_dict(data_valid)
+        result = sample_log.contains_many([sample_log[0], scrobble,
+                                           sample_log[12]])
+        assert result.tolist() == [True, False, True]
+        assert sample_log.contains_many(sample_log[3:6]).all()
+        assert sample_log[3:6].isin(sample_log).all()
+        assert sample_log.isin(sample_log[3:6]).sum() == 3
+
+    def test_contains_timestamp_inputs(self):
+        # `in` and `contains_many` read timestamps as validation does:
+        # integers are epoch ms, naive values UTC
+        scrobble_log = mfm.ScrobbleLog(pd.DataFrame({
+            "timestamp": [1_600_000_000_000, 1_600_000_100_000],
+            "track": ["Tr1", "Tr2"],
+            "artist": ["Ar1", "Ar2"],
+            "album": ["Al1", None],
+        }), username="sid", tz="Asia/Kolkata")
+        naive = pd.Timestamp(1_600_000_000_000, unit="ms")
+        items = [mfm.Scrobble(value, "Tr1", "Ar1", "Al1")
+                 for value in [1_600_000_000_000, naive, str(naive),
+                               "not a date"]]
+        items.append(scrobble_log[1])
+        expected = [True, True, True, False, True]
+        assert [item in scrobble_log for item in items] == expected
+        assert scrobble_log.contains_many(items).tolist() == expected
+
+    def test_contains_index_invalidated(self):
+        scrobble_log = mfm.ScrobbleLog.from_dict(dict_valid_2)
+        scrobble = mfm.Scrobble.from_dict(data_valid)
+        assert scrobble not in scrobble_log
+        scrobble_log.append(scrobble)
+        assert scrobble in scrobble_log
+
     def test_iter(self):
         for scrobble in sample_log:
             assert scrobble.artist in ("Lana Del Rey", "Cigarettes After Sex")
 
+    def test_iter_matches_getitem(self):
+        scrobbles = list(sample_log)
+        assert len(scrobbles) == len(sample_log)
+        assert scrobbles[4] == sample_log[4]
+        assert scrobbles[-1].timestamp == sample_log.df["timestamp"].iloc[-1]
+
+    def test_iter_batches(self):
+        batches = list(sample_log.iter_batches(5))
+        assert [len(batch) for batch in batches] == [5, 5, 3]
+        assert isinstance(batches[0], pd.DataFrame)
+        scrobble_batches = list(sample_log.iter_batches(5, as_scrobbles=True))
+        assert scrobble_batches[1][0] == sample_log[5]
+        with pytest.raises(ValueError, match="positive integer"):
+            next(sample_log.iter_batches(0))
+
     def test_append(self):
         scrobble_log = mfm.ScrobbleLog.from_dict(dict_valid_2)
         assert len(scrobble_log) == 1
@@ -87,6 +149,251 @@ class TestScrobbleLog:
         assert scrobble_log.df.iloc[1]["album"] == "Elliott Smith"
         assert scrobble_log.tz == "Etc/UTC"
 
+    def test_dictionary_encoded(self):
+        df = pd.DataFrame({"timestamp": [1, 2],
+                           "track": ["Tr1", " "],
+                           "artist": ["Ar1", "Ar1"]})
+        scrobble_log = mfm.ScrobbleLog(df, username="sid")
+        for column in ["track", "artist", "album"]:
+            assert isinstance(scrobble_log.df[column].dtype,
+                              pd.CategoricalDtype)
+        assert list(scrobble_log.df["artist"].cat.categories) == ["Ar1"]
+        assert scrobble_log[1].track is None
+        assert scrobble_log.to_dict()["scrobbles"][1]["track"] is None
+
+    def test_top_charts_ties(self):
+        # Tracks with the same count are ordered by name
+        charts = sample_log.top_charts("track", n=5)
+        assert charts.index.tolist() == ["Shades of Cool", "Black Beauty",
+                                         "Brooklyn Baby", "Dreaming of You",
+                                         "Flash"]
+        assert charts.tolist() == [2, 1, 1, 1, 1]
+
+    def test_top_charts_unused_categories(self):
+        filtered = sample_log[10:]
+        charts = filtered.top_charts("artist", n=5)
+        assert charts.to_dict() == {"Lana Del Rey": 3}
+        assert charts.index.name == "Artist"
+
+    def test_aggregate(self):
+        df = pd.DataFrame({
+            "timestamp": ["2023-12-31 18:00", "2023-12-31 19:00",
+                          "2024-01-02 10:00", "2024-01-03 10:00",
+                          "2024-02-01 10:00"],
+            "track": ["Intro", "Intro", "Intro", "Song", "Intro"],
+            "artist": ["Ar1", "Ar2", "Ar2", "Ar2", "Ar1"],
+            "album": ["Greatest Hits", "Greatest Hits", "Greatest Hits",
+                      "Greatest Hits", None]
+        })
+        scrobble_log = mfm.ScrobbleLog(df, username="sid",
+                                       tz="Asia/Kolkata")
+        charts = scrobble_log.aggregate(by=["artist", "album"])
+        assert charts.to_dict("list") == {
+            "artist": ["Ar2", "Ar1"],
+            "album": ["Greatest Hits", "Greatest Hits"],
+            "scrobbles": [3, 1],
+            "rank": [1, 2]
+        }
+        monthly = scrobble_log.aggregate(by=["artist", "track"],
+                                         freq="month", n=1)
+        assert monthly["period"].astype(str).tolist() == [
+            "2023-12", "2024-01", "2024-02"
+        ]
+        assert monthly["artist"].tolist() == ["Ar1", "Ar2", "Ar1"]
+        assert monthly["scrobbles"].tolist() == [1, 2, 1]
+        per_artist = scrobble_log.aggregate(by=["artist", "track"],
+                                            within="artist")
+        assert per_artist[["artist", "track", "rank"]].values.tolist() == [
+            ["Ar1", "Intro", 1], ["Ar2", "Intro", 1], ["Ar2", "Song", 2]
+        ]
+        assert scrobble_log.aggregate("tracks", n=1)["track"].tolist() == \
+            ["Intro"]
+        with pytest.raises(ValueError, match="'freq' must be one of"):
+            scrobble_log.aggregate(freq="decade")
+        with pytest.raises(ValueError, match="'within' columns"):
+            scrobble_log.aggregate(by="artist", within="album")
+
+    def test_periodic_charts(self):
+        charts = sample_log.periodic_charts("year", n=1)
+        assert charts.columns.tolist() == ["period", "chart", "rank",
+                                           "artist", "album", "track",
+                                           "scrobbles"]
+        assert charts["chart"].tolist() == ["artist", "album", "track"]
+        assert charts["artist"].tolist() == ["Lana Del Rey"] * 3
+        assert charts[["album", "track"]].isna().values.tolist() == [
+            [True, True], [False, True], [True, False]
+        ]
+        expected = sample_log.aggregate(["artist", "album"], freq="year",
+                                        n=1)
+        assert charts.iloc[1]["scrobbles"] == expected["scrobbles"].iloc[0]
+        from memoryfm.charts.top_charts import periodic_charts_markdown
+        markdown = periodic_charts_markdown(charts)
+        assert list(markdown) == ["2020"]
+        assert "### Top Albums" in markdown["2020"]
+        with pytest.raises(ValueError, match="'freq' must be one of"):
+            sample_log.periodic_charts(None)
+
+    def test_charts_cache(self):
+        scrobble_log = sample_log.copy()
+        charts = scrobble_log.top_charts("artist", n=2)
+        charts.iloc[0] = 0
+        assert scrobble_log.top_charts("artists", n=2).iloc[0] == 8
+        assert scrobble_log.cache_info()[:2] == (1, 1)
+        window = scrobble_log.top_charts("artist", start="2020-07-12 06:33",
+                                         end="2020-07-12 06:45")
+        assert window.to_dict() == {"Lana Del Rey": 3}
+        scrobble_log.cache_size = 2
+        scrobble_log.aggregate("album")
+        info = scrobble_log.cache_info()
+        assert (info.evictions, info.maxsize, info.currsize) == (1, 2, 2)
+        scrobble_log.append(mfm.Scrobble.from_dict(data_valid))
+        assert scrobble_log.cache_info().currsize == 0
+        assert scrobble_log.top_charts("artist", n=2).iloc[0] == 8
+        assert scrobble_log.top_charts("artist", n=10)["Elliott Smith"] == 1
+        scrobble_log.df = sample_log.df
+        assert scrobble_log.cache_info().currsize == 0
+
+    def test_tz_convert(self):
+        scrobble_log = sample_log.copy()
+        daily = scrobble_log.aggregate("artist", freq="day")
+        converted = scrobble_log.tz_convert("Asia/Kolkata", inplace=False)
+        assert scrobble_log.tz == sample_log.tz
+        assert converted.tz == "Asia/Kolkata"
+        assert str(converted.df["timestamp"].dt.tz) == "Asia/Kolkata"
+        assert scrobble_log.tz_convert("Asia/Kolkata") is scrobble_log
+        assert scrobble_log.meta["tz"] == "Asia/Kolkata"
+        assert scrobble_log.cache_info().currsize == 0
+        assert scrobble_log.aggregate("artist", freq="day").equals(
+            converted.aggregate("artist", freq="day"))
+        assert daily["period"].nunique() == 1
+
+    def test_append_updates_meta(self):
+        scrobble_log = mfm.ScrobbleLog.from_dict(dict_valid_2)
+        earlier = {"timestamp": pd.Timestamp("2023-11-01 10:00"),
+                   "track": "Tr0", "artist": "Ar0"}
+        scrobble_log.append([earlier, mfm.Scrobble.from_dict(data_valid)])
+        assert scrobble_log.meta["num_scrobbles"] == 3
+        assert scrobble_log.meta["date_range"] == {
+            "start": "2023-11-01T10:00:00+00:00",
+            "end": "2023-12-17T22:00:00+00:00"
+        }
+        assert scrobble_log.df["album"].isna().tolist() == [True, True, False]
+
+    def test_append_many(self):
+        scrobble_log = mfm.ScrobbleLog.from_dict(dict_valid_2)
+        batches = [mfm.Scrobble.from_dict(data_valid),
+                   [{"timestamp": 1701810000000, "track": "Tr2",
+                     "artist": "Ar1"}],
+                   mfm.ScrobbleLog(sample_log.df.iloc[:3], username="sid")]
+        scrobble_log.append_many(batches)
+        assert len(scrobble_log) == 6
+        assert scrobble_log.meta["num_scrobbles"] == 6
+        assert scrobble_log.meta["date_range"]["start"] == \
+            sample_log.meta["date_range"]["start"]
+        assert scrobble_log.df["timestamp"].is_monotonic_increasing
+        assert scrobble_log.df["track"].tolist()[:3] == \
+            sample_log.df["track"].tolist()[:3]
+
+    def test_append_sorted_categories(self):
+        # Ties are broken in category order, which must not depend on
+        # the order the strings were appended in
+        scrobble_log = mfm.ScrobbleLog(pd.DataFrame({
+            "timestamp": pd.to_datetime(["2024-01-01 10:00"], utc=True),
+            "track": ["T2"], "artist": ["Ar2"], "album": [None],
+        }), username="sid", tz="UTC")
+        scrobble_log.append([{"timestamp": pd.Timestamp("2024-01-01 10:05"),
+                              "track": "T1", "artist": "Ar1"}])
+        assert scrobble_log.df["artist"].cat.categories.tolist() == [
+            "Ar1", "Ar2"]
+        assert scrobble_log.sessions()["artist"].tolist() == ["Ar1"]
+        assert scrobble_log.top_charts("artist").index[0] == "Ar1"
+
+    def test_upsert(self):
+        scrobble_log = sample_log[:8].copy()
+        stats = scrobble_log.upsert(sample_log[5:])
+        assert stats == (5, 3)
+        assert scrobble_log.df.equals(sample_log.df)
+        assert scrobble_log.meta["num_scrobbles"] == len(sample_log)
+        duplicate = {"timestamp": 1701810000000, "track": "Tr2",
+                     "artist": "Ar1"}
+        stats = scrobble_log.upsert([duplicate, dict(duplicate),
+                                     dict(duplicate, album="Alb")])
+        assert (stats.added, stats.skipped) == (2, 1)
+        stats = scrobble_log.upsert([dict(duplicate, album="Alb2")],
+                                    match_album=False)
+        assert stats == (0, 1)
+        merged, stats = sample_log[:3].merge(sample_log[2:5])
+        assert stats == (2, 1)
+        assert merged == sample_log[:5]
+        assert len(sample_log[:3]) == 3
+
+    def test_sorted_by_timestamp(self):
+        df = pd.DataFrame({"timestamp": [3000, 1000, 2000, 1000],
+                           "track": ["Tr3", "Tr1", "Tr2", "Tr1b"],
+                           "artist": ["Ar1", "Ar1", "Ar1", "Ar1"]})
+        scrobble_log = mfm.ScrobbleLog(df, username="sid")
+        assert scrobble_log.df["track"].tolist() == ["Tr1", "Tr1b",
+                                                     "Tr2", "Tr3"]
+        scrobble_log.append([{"timestamp": 1500, "track": "Tr1c",
+                              "artist": "Ar1"}])
+        assert scrobble_log.df["track"].tolist() == ["Tr1", "Tr1b", "Tr1c",
+                                                     "Tr2", "Tr3"]
+
+    def test_filter_by_date(self):
+        filtered = sample_log.filter_by_date("2020-07-12 06:33",
+                                             "2020-07-12 06:45")
+        assert filtered.df["track"].tolist() == [
+            "Brooklyn Baby", "West Coast", "Sad Girl"
+        ]
+        assert filtered.meta["num_scrobbles"] == 3
+        assert filtered.meta["source"] == "filter"
+        assert filtered.meta["date_range"]["start"] == \
+            "2020-07-12T06:33:29+00:00"
+        assert filtered == mfm.ScrobbleLog(filtered.df, meta=filtered.meta)
+        whole_day = sample_log.filter_by_date("2020-07-12", "2020-07-12")
+        assert whole_day.df.equals(sample_log.df)
+        assert len(sample_log.filter_by_date(end="2020-07-12 06:30")) == 2
+        assert not sample_log.filter_by_date("2021-01-01")
+        other_tz = sample_log.filter_by_date(
+            pd.Timestamp("2020-07-12 12:03", tz="Asia/Kolkata"),
+            pd.Timestamp("2020-07-12 12:15", tz="Asia/Kolkata")
+        )
+        assert len(other_tz) == 3
+
+    def test_derived_logs(self):
+        copy = sample_log.copy()
+        assert copy == sample_log
+        assert copy.df is not sample_log.df
+        head = sample_log.head(3)
+        assert head.meta["num_scrobbles"] == 3
+        assert head.meta["source"] == sample_log.meta["source"]
+        assert head.meta["date_range"]["end"] == \
+            sample_log.df["timestamp"].iloc[2].isoformat()
+        tail = sample_log.tail(2)
+        assert tail.df["track"].tolist() == ["Guns and Roses", "Florida Kilos"]
+        assert tail.meta["date_range"]["end"] == \
+            sample_log.meta["date_range"]["end"]
+        reverse = sample_log[::-1]
+        assert reverse.df["timestamp"].is_monotonic_increasing
+        assert len(reverse) == len(sample_log)
+
+    def test_validation_levels(self):
+        df = sample_log.df.copy()
+        for validation in ["full", "light", "trusted"]:
+            scrobble_log = mfm.ScrobbleLog(df, meta=sample_log.meta,
+                                           validation=validation)
+            assert scrobble_log == sample_log
+        df["timestamp"] = df["timestamp"].dt.tz_convert("Asia/Kolkata")
+        light = mfm.ScrobbleLog(df, username="sid", tz="Europe/Berlin",
+                                validation="light")
+        assert str(light.df["timestamp"].dt.tz) == "Europe/Berlin"
+        assert str(df["timestamp"].dt.tz) == "Asia/Kolkata"
+        with pytest.raises(ValueError, match="'level' must be one of"):
+            mfm.ScrobbleLog(df, username="sid", validation="none")
+        with pytest.raises(mfm.errors.SchemaError, match="album"):
+            mfm.ScrobbleLog(df.drop(columns="album"), meta=sample_log.meta,
+                            validation="trusted")
+
     def test_to_json(self, tmp_path):
         file_temp = tmp_path / "test_to_json.json"
         scrobble_log = mfm.from_lastfmstats(file_json, "json", tz="Europe/Berlin")
@@ -95,3 +402,161 @@ class TestScrobbleLog:
         import json
         assert json.loads(content).get("meta")["source"] == "lastfmstats.com"
         assert json.loads(content).get("meta")["tz"] == "Europe/Berlin"
+
+    def test_to_markdown_truncated(self):
+        markdown = sample_log.to_markdown(max_length=4, newest_first=True)
+        rows = markdown.splitlines()
+        assert rows[-1] == f"Showing 4 out of {len(sample_log)} scrobbles"
+        assert rows[5].startswith("| " + sample_log.df["timestamp"]
+                                  .iloc[-1].strftime("%Y-%m-%d %H:%M"))
+        assert sum(row.startswith("| ...") for row in rows) == 3
+        assert str(sample_log) == sample_log.to_markdown(
+            tablefmt="pipe", maxcolwidths=20, max_length=10,
+            show_extra=False, newest_first=False)
+
+    def test_to_markdown_streaming(self, tmp_path):
+        file_temp = tmp_path / "test_to_markdown.md"
+        for tablefmt in ["github", "pipe"]:
+            for newest_first in [False, True]:
+                sample_log.to_markdown(file_temp, tablefmt=tablefmt,
+                                       newest_first=newest_first,
+                                       chunksize=3)
+                assert file_temp.read_text() == sample_log.to_markdown(
+                    tablefmt=tablefmt, newest_first=newest_first)
+        sample_log.to_markdown(file_temp, datetimefmt="%A %d %B %Y",
+                               chunksize=5)
+        assert file_temp.read_text() == sample_log.to_markdown(
+            datetimefmt="%A %d %B %Y")
+        with pytest.raises(ValueError, match="'file' is required"):
+            sample_log.to_markdown(chunksize=3)
+        with pytest.raises(ValueError, match="does not support"):
+            sample_log.to_markdown(file_temp, maxcolwidths=20, chunksize=3)
+
+    def test_to_markdown_streaming_narrow(self, tmp_path):
+        # Cells narrower than their header, wide characters and
+        # surrounding whitespace are laid out as by tabulate
+        file_temp = tmp_path / "test_to_markdown.md"
+        scrobble_log = mfm.ScrobbleLog(pd.DataFrame({
+            "timestamp": pd.to_datetime(["2024-01-01 10:00",
+                                         "2024-01-02 11:00"], utc=True),
+            "track": ["  Tr ", "夜に駆ける"],
+            "artist": ["A", "YOASOBI"],
+            "album": [None, "Ａ"],
+        }), username="narrow", tz="UTC")
+        for tablefmt in ["github", "pipe"]:
+            scrobble_log.to_markdown(file_temp, tablefmt=tablefmt,
+                                     chunksize=1)
+            assert file_temp.read_text() == scrobble_log.to_markdown(
+                tablefmt=tablefmt)
+        # Line breaks split a row over several lines, '|' is kept
+        df = scrobble_log.df.assign(track=["Line1\nLine2 longer", "a|b"])
+        scrobble_log = mfm.ScrobbleLog(df, username="narrow", tz="UTC")
+        for tablefmt in ["github", "pipe"]:
+            scrobble_log.to_markdown(file_temp, tablefmt=tablefmt,
+                                     chunksize=1)
+            assert file_temp.read_text() == scrobble_log.to_markdown(
+                tablefmt=tablefmt)
+
+    def test_to_json_streaming(self, tmp_path):
+        import json
+        file_temp = tmp_path / "test_to_json.json"
+        expected = sample_log.to_json(chunksize=len(sample_log))
+        sample_log.to_json(file_temp, chunksize=3)
+        assert file_temp.read_text() == expected
+        data = json.loads(expected)
+        assert data["meta"] == sample_log.meta
+        assert len(data["scrobbles"]) == len(sample_log)
+        assert (data["scrobbles"][0]["timestamp"]
+                == sample_log[0].timestamp.strftime("%Y-%m-%dT%H:%M:%S%z"))
+        assert json.loads(sample_log.to_json(orient="list"))["scrobbles"][
+            "track"] == sample_log.df["track"].astype(str).tolist()
+
+    def test_to_json_epoch(self, tmp_path):
+        file_temp = tmp_path / "test_to_json_epoch.json"
+        sample_log.to_json(file_temp, epoch_unit="ms", chunksize=4)
+        import json
+        first = json.loads(file_temp.read_text())["scrobbles"][0]
+        assert first["timestamp"] == sample_log[0].timestamp.value // 10**6
+        assert mfm.ScrobbleLog.from_json(file_temp, epoch_unit="ms") == sample_log
+        with pytest.raises(ValueError, match="'epoch_unit' must be one of"):
+            sample_log.to_json(epoch_unit="minutes")
+
+    def test_to_csv(self, tmp_path):
+        file_temp = tmp_path / "test_to_csv.csv"
+        sample_log.to_csv(file_temp, layout="lastfmstats", chunksize=4)
+        assert file_temp.read_text().splitlines()[0] == (
+            f"Artist;Album;AlbumId;Track;Date#{sample_log.username}")
+        reloaded = mfm.from_lastfmstats(file_temp, "csv", tz=sample_log.tz)
+        assert reloaded == sample_log
+        plain = sample_log.to_csv(chunksize=5)
+        assert plain == sample_log.to_csv()
+        from io import StringIO
+        df = pd.read_csv(StringIO(plain))
+        assert list(df.columns) == ["timestamp", "track", "artist", "album"]
+        assert len(df) == len(sample_log)
+        with pytest.raises(ValueError, match="'layout' must be one of"):
+            sample_log.to_csv(layout="tsv")
+        with pytest.warns(DeprecationWarning, match="'orient'"):
+            assert sample_log.to_csv(None, "records") == plain
+        with pytest.warns(DeprecationWarning, match="'orient'"):
+            assert sample_log.to_csv(orient="list") == plain
+
+    def test_sessions(self):
+        scrobble_log = mfm.ScrobbleLog(pd.DataFrame({
+            "timestamp": pd.to_datetime([
+                "2024-01-01 10:00", "2024-01-01 10:04", "2024-01-01 10:08",
+                "2024-01-01 12:00", "2024-01-01 12:29", "2024-01-01 13:30",
+            ], utc=True),
+            "track": ["T1", "T2", "T3", "T4", "T5", "T6"],
+            "artist": ["Ar1", "Ar2", "Ar2", "Ar1", "Ar3", "Ar3"],
+            "album": ["Al1", "Al2", "Al2", None, None, None],
+        }), username="sid", tz="Europe/Berlin")
+        assert scrobble_log.session_ids().tolist() == [0, 0, 0, 1, 1, 2]
+        sessions = scrobble_log.sessions()
+        assert sessions["scrobbles"].tolist() == [3, 2, 1]
+        assert sessions["artist"].tolist() == ["Ar2", "Ar1", "Ar3"]
+        assert sessions["album"].tolist() == ["Al2", None, None]
+        assert sessions["duration"].tolist() == [pd.Timedelta("8min"),
+                                                 pd.Timedelta("29min"),
+                                                 pd.Timedelta(0)]
+        assert str(sessions["start"].dt.tz) == "Europe/Berlin"
+        assert scrobble_log.sessions("2h")["scrobbles"].tolist() == [6]
+        assert scrobble_log.sessions(min_scrobbles=2)["session"].tolist() \
+            == [0, 1]
+        assert len(scrobble_log[0:0].sessions()) == 0
+        with pytest.raises(ValueError, match="'gap' must be a positive"):
+            scrobble_log.sessions("-5min")
+
+    def test_calendar(self):
+        scrobble_log = mfm.ScrobbleLog(pd.DataFrame({
+            "timestamp": pd.to_datetime([
+                "2023-12-31 23:30", "2024-01-01 08:00", "2024-01-02 09:00",
+                "2024-01-04 10:00", "2024-01-05 11:00", "2024-01-06 11:30",
+            ], utc=True),
+            "track": ["T1", "T2", "T3", "T4", "T5", "T6"],
+            "artist": ["Ar1", "Ar1", "Ar2", "Ar2", "Ar3", "Ar3"],
+            "album": [None] * 6,
+        }), username="cal", tz="Europe/Berlin")
+        calendar = scrobble_log.calendar()
+        # 2023-12-31 23:30 UTC is already 2024-01-01 in Berlin
+        assert calendar.start == datetime.date(2024, 1, 1)
+        assert calendar.end == datetime.date(2024, 1, 6)
+        assert calendar.daily.tolist() == [2, 1, 0, 1, 1, 1]
+        assert calendar.hourly[[0, 9, 10, 11, 12]].tolist() == [1, 1, 1, 1, 2]
+        # Monday 2024-01-01 to Saturday 2024-01-06
+        assert calendar.weekday.tolist() == [2, 1, 0, 1, 1, 1, 0]
+        assert calendar.daily_series().sum() == 6
+        streak = calendar.longest_streak()
+        assert (streak.days, streak.start, streak.scrobbles) \
+            == (3, datetime.date(2024, 1, 4), 3)
+        assert calendar.streaks()["days"].tolist() == [2, 3]
+        assert scrobble_log.calendar() is calendar
+        # Calendars compare by identity, not elementwise over arrays
+        assert calendar == calendar and hash(calendar) == hash(calendar)
+        assert calendar != scrobble_log[:].calendar()
+        with pytest.raises(ValueError):
+            calendar.daily[0] = 0
+        scrobble_log.tz_convert("UTC")
+        assert scrobble_log.calendar().start == datetime.date(2023, 12, 31)
+        empty = scrobble_log[0:0].calendar()
+        assert len(empty.daily) == 0 and empty.longest_streak() is None
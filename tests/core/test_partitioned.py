@@ -0,0 +1,66 @@
+from pathlib import Path
+import memoryfm as mfm
+import pandas as pd
+import pytest
+
+from memoryfm.errors import InvalidDataError
+
+data_dir = Path(__file__).resolve().parent.parent / "data"
+sample_log = mfm.from_lastfmstats(data_dir / "csv" / "sample.csv", "csv",
+                                  tz="Asia/Kolkata")
+sample_log.append(mfm.from_lastfmstats(data_dir / "json" / "sample.json",
+                                       "json", tz="Asia/Kolkata"))
+
+
+@pytest.fixture
+def partitioned(tmp_path):
+    return mfm.PartitionedScrobbleLog.from_scrobble_log(
+        sample_log, tmp_path / "log", freq="month"
+    )
+
+
+class TestPartitionedScrobbleLog:
+    def test_roundtrip(self, partitioned):
+        reopened = mfm.PartitionedScrobbleLog(partitioned.path)
+        assert len(reopened) == len(sample_log)
+        assert reopened.meta == sample_log.meta
+        assert reopened.partitions == ["2020-07", "2025-09"]
+        assert reopened.to_scrobble_log().df.equals(sample_log.df)
+
+    def test_filter_by_date(self, partitioned):
+        timestamps = sample_log.df["timestamp"]
+        start = timestamps.iloc[len(timestamps) // 3]
+        end = timestamps.iloc[2 * len(timestamps) // 3]
+        assert (partitioned.filter_by_date(start, end)
+                == sample_log.filter_by_date(start, end))
+        assert (partitioned.filter_by_date("2020-07-12 06:40", "2025-12-31")
+                == sample_log.filter_by_date("2020-07-12 06:40", "2025-12-31"))
+        assert not partitioned.filter_by_date("1990-01-01", "1990-02-01")
+
+    def test_head_tail(self, partitioned):
+        assert partitioned.head(3) == sample_log.head(3)
+        assert partitioned.tail(len(sample_log) + 1) == sample_log
+
+    def test_charts(self, partitioned):
+        assert partitioned.top_charts("artist", 3).equals(
+            sample_log.top_charts("artist", 3))
+        assert partitioned.aggregate(["artist", "track"], freq="month",
+                                     n=2).equals(
+            sample_log.aggregate(["artist", "track"], freq="month", n=2))
+
+    def test_append(self, partitioned):
+        stats = partitioned.append(sample_log[:5])
+        assert (stats.added, stats.skipped) == (0, 5)
+        new = {"timestamp": pd.Timestamp("2030-01-01", tz="UTC"),
+               "track": "Tr1", "artist": "Ar1"}
+        assert partitioned.append([new]).added == 1
+        reopened = mfm.PartitionedScrobbleLog(partitioned.path)
+        assert len(reopened) == len(sample_log) + 1
+        assert reopened.partitions[-1] == "2030-01"
+        assert reopened.tail(1)[0].track == "Tr1"
+
+    def test_create(self, tmp_path, partitioned):
+        with pytest.raises(InvalidDataError, match="already exists"):
+            mfm.PartitionedScrobbleLog.create(partitioned.path)
+        with pytest.raises(ValueError, match="'freq' must be one of"):
+            mfm.PartitionedScrobbleLog.create(tmp_path / "other", freq="day")
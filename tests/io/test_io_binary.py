@@ -0,0 +1,65 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+
+import memoryfm as mfm
+from memoryfm.errors import InvalidTypeError, ParseError
+
+data_dir = Path(__file__).resolve().parent.parent / "data"
+csv_file = data_dir / "csv" / "sample.csv"
+
+
+class TestBinary:
+    def test_round_trip(self, tmp_path):
+        file = tmp_path / "sample.mfm"
+        scrobble_log = mfm.from_lastfmstats(csv_file, "csv",
+                                            tz="Asia/Kolkata")
+        scrobble_log.save(file)
+        for mmap in (True, False):
+            loaded = mfm.ScrobbleLog.open(file, mmap=mmap)
+            assert loaded == scrobble_log
+            assert loaded.meta == scrobble_log.meta
+            assert loaded.df["timestamp"].dtype == \
+                scrobble_log.df["timestamp"].dtype
+            assert isinstance(loaded.df["artist"].dtype, pd.CategoricalDtype)
+
+    def test_missing_album(self, tmp_path):
+        file = tmp_path / "missing_album.mfm"
+        df = pd.DataFrame({"timestamp": [1, 2],
+                           "track": ["Tr1", "Tr2"],
+                           "artist": ["Ar1", "Ar1"],
+                           "album": ["Alb1", None]})
+        scrobble_log = mfm.ScrobbleLog(df, username="sid")
+        scrobble_log.save(file)
+        loaded = mfm.ScrobbleLog.open(file)
+        assert loaded[1].album is None
+        assert loaded == scrobble_log
+
+    def test_numeric_values(self, tmp_path):
+        # e.g. a track titled 1999, read from a CSV as a number
+        file = tmp_path / "numeric.mfm"
+        df = pd.DataFrame({"timestamp": [1, 2, 3],
+                           "track": [1999, "Tr2", 1.5],
+                           "artist": [2000, 2001, 2000],
+                           "album": ["Alb1", None, "Alb1"]})
+        scrobble_log = mfm.ScrobbleLog(df, username="sid", tz="UTC")
+        scrobble_log.save(file)
+        loaded = mfm.ScrobbleLog.open(file)
+        assert loaded == scrobble_log
+        assert loaded[0].track == 1999 and loaded[0].artist == 2000
+        df["track"] = [pd.Timestamp("2020-01-01"), "Tr2", "Tr3"]
+        with pytest.raises(InvalidTypeError, match="Timestamp"):
+            mfm.ScrobbleLog(df, username="sid", tz="UTC").save(file)
+
+    def test_empty(self, tmp_path):
+        file = tmp_path / "empty.mfm"
+        df = pd.DataFrame(columns=["timestamp", "track", "artist"])
+        scrobble_log = mfm.ScrobbleLog(df, username="sid")
+        scrobble_log.save(file)
+        loaded = mfm.ScrobbleLog.open(file)
+        assert not loaded
+        assert loaded.meta == scrobble_log.meta
+
+    def test_not_binary(self):
+        with pytest.raises(ParseError, match="Not a memory.fm binary"):
+            mfm.ScrobbleLog.open(csv_file)
@@ -2,8 +2,12 @@ import pytest
 import pandas as pd
 from pathlib import Path
 
-from memoryfm.io._loaders import load_csv, load_json
-from memoryfm.io.lastfmstats import from_lastfmstats, _validate_data
+from memoryfm.io._loaders import load_csv, load_json, load_json_stream
+from memoryfm.io.lastfmstats import (
+    from_lastfmstats,
+    from_lastfmstats_many,
+    _validate_data
+)
 from memoryfm.io._normalise import normalise_lastfmstats
 from memoryfm.errors import (
     SchemaError,
@@ -50,6 +54,34 @@ class TestLoaders:
         with pytest.raises(ParseError, match=msg):
             return load_json(file)
     
+    def test_valid_json_stream(self):
+        file = json_dir / "sample.json"
+        expected_result = load_json(file)
+        for blocksize in (7, 1 << 16):
+            data = load_json_stream(file, blocksize=blocksize)
+            assert data["username"] == expected_result["username"]
+            assert (data["scrobbles"].to_dict(orient="records")
+                    == expected_result["scrobbles"])
+
+    def test_json_stream_missing_keys(self, tmp_path):
+        file = tmp_path / "missing_keys.json"
+        file.write_text(
+            '{"scrobbles": [{"track": "T1", "artist": "Ar1", "date": 1},\n'
+            ' {"track": "T2", "artist": "Ar1", "album": "Alb1", "date": 2}],'
+            ' "username": "sid"}'
+        )
+        data = load_json_stream(file, blocksize=16)
+        assert data["username"] == "sid"
+        scrobbles = data["scrobbles"]
+        assert list(scrobbles.columns) == ["track", "artist", "date", "album"]
+        assert scrobbles["date"].tolist() == [1, 2]
+        assert scrobbles["album"].isna().tolist() == [True, False]
+
+    def test_json_stream_invalid(self):
+        for name in ["empty.json", "invalid_json.json"]:
+            with pytest.raises(ParseError, match=r".* at char \d+"):
+                load_json_stream(json_dir / name)
+
     def test_valid_csv(self):
         file = csv_dir / "valid_data.csv"
         expected_result = {
@@ -63,7 +95,18 @@ class TestLoaders:
                                  }
                             ]
         }
-        assert load_csv(file) == expected_result
+        data = load_csv(file)
+        assert data["username"] == expected_result["username"]
+        assert (data["scrobbles"].to_dict(orient="records")
+                == expected_result["scrobbles"])
+
+    def test_csv_chunks(self):
+        file = csv_dir / "sample.csv"
+        data = load_csv(file, chunksize=4)
+        assert len(data["scrobbles"]) == 13
+        assert data["scrobbles"]["Date"].is_monotonic_increasing
+        assert list(data["scrobbles"].columns) == ["Artist", "Album",
+                                                   "AlbumId", "Track", "Date"]
     
     def test_mismatch_delimiter(self):
         file = csv_dir / "mismatch_delimiter.csv"
@@ -71,6 +114,24 @@ class TestLoaders:
         with pytest.raises(ParseError, match=msg):
             load_csv(file)
     
+    def test_csv_field_counts(self, tmp_path):
+        file = tmp_path / "export.csv"
+        header = "Artist;Album;AlbumId;Track;Date#sid\n"
+        # An empty date is kept here, and dropped on validation
+        file.write_text(header + "Ar1;Al1;;Tr1;1700000000000\n"
+                                 "Ar2;Al2;;Tr2;\n")
+        assert load_csv(file)["scrobbles"]["Date"].isna().tolist() == [
+            False, True]
+        assert len(from_lastfmstats(file, "csv", tz="UTC")) == 1
+        # Extra fields on the first data row, and a missing one later
+        file.write_text(header + "Ar1;Al1;;Tr1;1700000000000;x\n")
+        with pytest.raises(ParseError, match="line number 2: Ar1"):
+            load_csv(file)
+        file.write_text(header + "Ar1;Al1;;Tr1;1700000000000\n"
+                                 '"Ar;2";Al2;;Tr2\n')
+        with pytest.raises(ParseError, match="line number 3: Ar;2"):
+            load_csv(file)
+
     def test_wrong_header_csv(self):
         file = csv_dir / "wrong_header.csv"
         msg = r"Expecting last column name: .*"
@@ -91,6 +152,48 @@ class TestFromLastfmstats:
         with pytest.raises(InvalidDataError, match=msg):
             from_lastfmstats(file, "jsom")
 
+    def test_json_streaming(self):
+        file = json_dir / "latest_scrobble.json"
+        assert (from_lastfmstats(file, "json", tz="Etc/UTC")
+                == from_lastfmstats(file, "json", tz="Etc/UTC",
+                                    streaming=False))
+
+    def test_many(self, tmp_path):
+        import shutil
+        shutil.copy(json_dir / "sample.json", tmp_path / "a.json")
+        shutil.copy(csv_dir / "sample.csv", tmp_path / "b.csv")
+        (tmp_path / "notes.txt").write_text("not an export")
+        logs = from_lastfmstats_many(tmp_path, tz="Etc/UTC", max_workers=2)
+        assert list(logs) == ["lazulinoother"]
+        scrobble_log = logs["lazulinoother"]
+        json_log = from_lastfmstats(json_dir / "sample.json", "json",
+                                    tz="Etc/UTC")
+        csv_log = from_lastfmstats(csv_dir / "sample.csv", "csv",
+                                   tz="Etc/UTC")
+        assert len(scrobble_log) == len(json_log) + len(csv_log)
+        assert scrobble_log.df["timestamp"].is_monotonic_increasing
+        assert scrobble_log.meta["source"] == "lastfmstats.com"
+        combined = from_lastfmstats_many([tmp_path / "a.json",
+                                          tmp_path / "b.csv"],
+                                         tz="Etc/UTC", combine=True,
+                                         max_workers=1)
+        assert combined == scrobble_log
+        shutil.copy(json_dir / "sample.json", tmp_path / "c.json")
+        overlapping = from_lastfmstats_many(tmp_path, tz="Etc/UTC",
+                                            max_workers=1)
+        assert overlapping["lazulinoother"] == scrobble_log
+        with pytest.raises(InvalidDataError, match="Cannot infer file type"):
+            from_lastfmstats_many([tmp_path / "notes.txt"])
+
+    def test_many_malformed(self, tmp_path):
+        import shutil
+        shutil.copy(json_dir / "sample.json", tmp_path / "a.json")
+        (tmp_path / "b.json").write_text("{not json")
+        for max_workers in (1, 2):
+            with pytest.raises(ParseError, match="b.json"):
+                from_lastfmstats_many(tmp_path, tz="Etc/UTC",
+                                      max_workers=max_workers)
+
     def test_lastfmstats_validate_dict_type(self):
         data = []
         msg = "Expecting dict type data"
@@ -155,3 +258,34 @@ class TestNormaliseLastfmstats:
         ).to_dict(orient="records")
         assert dict_d["meta"]["tz"] == "Europe/London"
         assert dict_d["scrobbles"]
+
+    def test_normalise_timestamps(self):
+        from memoryfm.io._normalise import normalise_timestamps
+        epochs = pd.Series([1758122054033, 1594535082000])
+        expected = pd.to_datetime(epochs, unit="ms", utc=True)
+        normalised = normalise_timestamps(epochs, tz="Asia/Kolkata",
+                                          unit="ms")
+        assert str(normalised.dt.tz) == "Asia/Kolkata"
+        assert (normalised == expected).all()
+        nullable = normalise_timestamps(
+            pd.Series([1758122054033, None], dtype="Int64"), unit="ms",
+            tz="UTC"
+        )
+        assert nullable.iloc[0] == expected.iloc[0]
+        assert pd.isna(nullable.iloc[1])
+        # tz-aware values are only converted, naive values taken as UTC
+        assert (normalise_timestamps(normalised, tz="UTC") == expected).all()
+        naive = expected.dt.tz_localize(None)
+        assert (normalise_timestamps(naive, tz="UTC") == expected).all()
+        strings = pd.Series(["2025-09-17 15:14:14", "2020-07-12 06:24:42"])
+        parsed = normalise_timestamps(strings, tz="UTC")
+        assert parsed.iloc[1] == pd.Timestamp("2020-07-12 06:24:42",
+                                              tz="UTC")
+        # The format of one call does not carry over to the next
+        normalise_timestamps(pd.Series(["01/02/2020 10:00"]), tz="UTC")
+        with pytest.warns(UserWarning, match="dayfirst"):
+            parsed = normalise_timestamps(pd.Series(["13/02/2020 10:00"]),
+                                          tz="UTC")
+        assert parsed.iloc[0] == pd.Timestamp("2020-02-13 10:00", tz="UTC")
+        with pytest.raises(InvalidDataError):
+            normalise_timestamps(pd.Series(["2020-07-12 06:24:42", "dhj"]))
@@ -0,0 +1,55 @@
+import pytest
+from pathlib import Path
+
+import memoryfm as mfm
+from memoryfm.errors import ParseError, SchemaError
+
+data_dir = Path(__file__).resolve().parent.parent / "data"
+csv_file = data_dir / "csv" / "sample.csv"
+scrobble_log = mfm.from_lastfmstats(csv_file, "csv", tz="Asia/Kolkata")
+
+
+class TestYAML:
+    def test_round_trip(self, tmp_path):
+        file = tmp_path / "sample.yaml"
+        scrobble_log.to_yaml(file, chunksize=4)
+        text = file.read_text()
+        # One meta document, then ceil(13 / 4) chunks
+        assert text.count("---\n") == 5
+        loaded = mfm.ScrobbleLog.from_yaml(file)
+        assert loaded == scrobble_log
+        assert loaded.meta == scrobble_log.meta
+
+    def test_pure_python_fallback(self, tmp_path, monkeypatch):
+        # Without libyaml, the pure Python dumper and loader are used
+        import yaml
+        from memoryfm.export import to_yaml
+        monkeypatch.setattr(to_yaml, "SafeDumper", yaml.SafeDumper)
+        monkeypatch.setattr(to_yaml, "SafeLoader", yaml.SafeLoader)
+        file = tmp_path / "sample.yaml"
+        scrobble_log.to_yaml(file, chunksize=4)
+        assert mfm.ScrobbleLog.from_yaml(file) == scrobble_log
+
+    def test_epoch(self, tmp_path):
+        file = tmp_path / "sample.yaml"
+        scrobble_log.to_yaml(file, epoch_unit="s")
+        assert f"timestamp: {scrobble_log[0].timestamp.value // 10**9}\n" \
+            in file.read_text()
+        assert mfm.ScrobbleLog.from_yaml(file, epoch_unit="s") == scrobble_log
+
+    def test_empty(self):
+        empty = scrobble_log.filter_by_date("1990-01-01", "1990-01-02")
+        from io import StringIO
+        assert len(mfm.ScrobbleLog.from_yaml(StringIO(empty.to_yaml()))) == 0
+
+    def test_invalid(self, tmp_path):
+        file = tmp_path / "invalid.yaml"
+        file.write_text("--- {username: sid}\n")
+        with pytest.raises(SchemaError, match="'meta'"):
+            mfm.ScrobbleLog.from_yaml(file)
+        file.write_text("--- {meta: {}}\n--- {track: Tr1}\n")
+        with pytest.raises(ParseError, match="not a list of scrobbles"):
+            mfm.ScrobbleLog.from_yaml(file)
+        file.write_text("--- {meta: {}}\n--- [a: b: c]\n")
+        with pytest.raises(ParseError):
+            mfm.ScrobbleLog.from_yaml(file)
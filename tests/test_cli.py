@@ -0,0 +1,123 @@
+import shutil
+from pathlib import Path
+import memoryfm as mfm
+import pytest
+
+from memoryfm.cli import main
+from memoryfm.io._log_cache import LogCache
+
+data_dir = Path(__file__).resolve().parent / "data"
+file_csv = data_dir / "csv" / "sample.csv"
+
+
+@pytest.fixture
+def export(tmp_path):
+    path = tmp_path / "export.csv"
+    shutil.copy(file_csv, path)
+    return path
+
+
+class TestLogCache:
+    def test_load(self, tmp_path, export):
+        cache = LogCache(tmp_path / "cache")
+        expected = mfm.from_lastfmstats(export, "csv", tz="Asia/Kolkata")
+        assert cache.load(export, "csv", tz="Asia/Kolkata") == expected
+        # A new instance reads the index written by the first one
+        cache = LogCache(tmp_path / "cache")
+        assert cache.load(export, "csv", tz="Asia/Kolkata") == expected
+        assert (cache.hits, cache.misses) == (1, 0)
+        cache.load(export, "csv", tz="Europe/Berlin")
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 2
+
+    def test_version_change(self, tmp_path, export, monkeypatch):
+        cache = LogCache(tmp_path / "cache")
+        cache.load(export, "csv", tz="Asia/Kolkata")
+        # Logs parsed by an older version are parsed again, and pruned
+        import memoryfm._version
+        monkeypatch.setattr(memoryfm._version, "package_version",
+                            lambda: "999.0.0")
+        cache = LogCache(tmp_path / "cache")
+        cache.load(export, "csv", tz="Asia/Kolkata")
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert cache.prune().removed == 1
+        assert [entry["version"] for entry in cache.entries()] == ["999.0.0"]
+
+    def test_changed_source(self, tmp_path, export):
+        cache = LogCache(tmp_path / "cache")
+        cache.load(export, "csv", tz="Asia/Kolkata")
+        with open(export, "a") as f:
+            f.write('"Ar1";"Al1";"";"Tr1";"1700000000000"\n')
+        scrobble_log = cache.load(export, "csv", tz="Asia/Kolkata")
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert scrobble_log.tail(1)[0].track == "Tr1"
+        # Only the entry of the current contents is kept
+        assert cache.prune().removed == 1
+        assert len(cache) == 1
+        export.unlink()
+        assert cache.prune().removed == 1
+        assert not cache.entries()
+        assert [p.name for p in (tmp_path / "cache").iterdir()] == [
+            "index.json"]
+
+    def test_prune_foreign_files(self, tmp_path, export):
+        folder = tmp_path / "mylogs"
+        folder.mkdir()
+        own_log = folder / "2024.mfm"
+        own_log.write_bytes(b"not a cache entry")
+        orphan = folder / ("0" * 24 + ".mfm")
+        orphan.write_bytes(b"")
+        # Without a cache index the folder is not known to be a cache
+        assert LogCache(folder).prune().removed == 0
+        assert sorted(p.name for p in folder.iterdir()) == [
+            orphan.name, "2024.mfm"]
+        cache = LogCache(folder)
+        cache.load(export, "csv", tz="Asia/Kolkata")
+        assert cache.prune().removed == 1
+        assert own_log.exists() and not orphan.exists()
+        assert len(cache) == 1
+
+
+class TestCLI:
+    def test_info(self, tmp_path, export, capsys):
+        args = ["--cache-dir", str(tmp_path / "cache"), "info", str(export),
+                "--tz", "Asia/Kolkata"]
+        assert main(args) == 0
+        assert main(args) == 0
+        out = capsys.readouterr().out
+        assert out.count("Scrobbles : 13") == 2
+        assert main(["--cache-dir", str(tmp_path / "cache"),
+                     "cache", "list"]) == 0
+        assert "(1 entries)" in capsys.readouterr().out
+
+    def test_charts(self, tmp_path, export, capsys):
+        assert main(["--cache-dir", str(tmp_path / "cache"), "charts",
+                     str(export), "--kind", "track", "-n", "1"]) == 0
+        assert "Shades of Cool" in capsys.readouterr().out
+
+    def test_export(self, tmp_path, export):
+        output = tmp_path / "out.json"
+        assert main(["--cache-dir", str(tmp_path / "cache"), "export",
+                     str(export), str(output), "--tz", "Asia/Kolkata"]) == 0
+        assert mfm.ScrobbleLog.from_json(output) == mfm.from_lastfmstats(
+            export, "csv", tz="Asia/Kolkata")
+
+    def test_filter(self, tmp_path, export, capsys):
+        assert main(["filter", str(export), "--no-cache",
+                     "--tz", "Asia/Kolkata", "--start", "2020-07-12 12:45",
+                     "--format", "csv"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "timestamp,track,artist,album"
+        assert len(lines) == 4
+
+    def test_filter_stdout_without_tz(self, tmp_path, export, capsys):
+        import json
+        assert main(["--cache-dir", str(tmp_path / "cache"), "filter",
+                     str(export), "--format", "json"]) == 0
+        # Only the log is written to stdout, warnings go to stderr
+        data = json.loads(capsys.readouterr().out)
+        assert len(data["scrobbles"]) == 13
+
+    def test_error(self, tmp_path, capsys):
+        assert main(["info", str(tmp_path / "missing.txt"), "--no-cache"]) == 1
+        assert "memoryfm: error" in capsys.readouterr().err
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+# Budget for the cumulative import time of the memoryfm package, in µs
+IMPORT_BUDGET_US = 100_000
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    """Cumulative import time of each module, from `-X importtime`"""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    result = _run("import memoryfm")
+    times = _import_times(result.stderr)
+    assert times["memoryfm"] < IMPORT_BUDGET_US
+    assert "pandas" not in times
+    assert "memoryfm.core.objects" not in times
+
+
+def test_lazy_attributes():
+    result = _run(
+        "import sys, memoryfm\n"
+        "assert memoryfm.ScrobbleLog.__name__ == 'ScrobbleLog'\n"
+        "assert isinstance(memoryfm.__version__, str)\n"
+        "print('tabulate' in sys.modules, 'memoryfm.io.api' in sys.modules)"
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_submodule_attributes():
+    # Submodules are reachable after a plain `import memoryfm`
+    _run(
+        "import memoryfm\n"
+        "for name in ['errors', 'io', 'core', 'charts']:\n"
+        "    assert getattr(memoryfm, name).__name__ == 'memoryfm.' + name\n"
+        "assert issubclass(memoryfm.errors.ParseError, Exception)"
+    )